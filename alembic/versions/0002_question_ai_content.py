@@ -0,0 +1,40 @@
+"""Add question_ai_content cache table
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('question_ai_content',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('question_id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=20), nullable=False),
+    sa.Column('variant', sa.String(length=500), nullable=False),
+    sa.Column('prompt_version', sa.String(length=20), nullable=False),
+    sa.Column('model', sa.String(length=100), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['question_id'], ['trivia_questions.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('question_id', 'kind', 'variant', 'prompt_version', 'model')
+    )
+    op.create_index(op.f('ix_question_ai_content_id'), 'question_ai_content', ['id'], unique=False)
+    op.create_index(op.f('ix_question_ai_content_question_id'), 'question_ai_content', ['question_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_question_ai_content_question_id'), table_name='question_ai_content')
+    op.drop_index(op.f('ix_question_ai_content_id'), table_name='question_ai_content')
+    op.drop_table('question_ai_content')
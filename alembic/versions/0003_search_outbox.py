@@ -0,0 +1,33 @@
+"""Add search_outbox table
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('search_outbox',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('index_name', sa.String(length=100), nullable=False),
+    sa.Column('doc_id', sa.String(length=100), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_search_outbox_id'), 'search_outbox', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_search_outbox_id'), table_name='search_outbox')
+    op.drop_table('search_outbox')
@@ -0,0 +1,60 @@
+"""Key question_ai_content by a hash of the question fields
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def _create_table(with_source_hash: bool) -> None:
+    key = ['question_id', 'kind', 'variant', 'prompt_version', 'model']
+    columns = [
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('question_id', sa.Integer(), nullable=False),
+        sa.Column('kind', sa.String(length=20), nullable=False),
+        sa.Column('variant', sa.String(length=500), nullable=False),
+        sa.Column('prompt_version', sa.String(length=20), nullable=False),
+        sa.Column('model', sa.String(length=100), nullable=False),
+    ]
+    if with_source_hash:
+        columns.append(sa.Column('source_hash', sa.String(length=64), nullable=False))
+        key.append('source_hash')
+    op.create_table('question_ai_content',
+    *columns,
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['question_id'], ['trivia_questions.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint(*key)
+    )
+    op.create_index(op.f('ix_question_ai_content_id'), 'question_ai_content', ['id'], unique=False)
+    op.create_index(op.f('ix_question_ai_content_question_id'), 'question_ai_content', ['question_id'], unique=False)
+
+
+def _drop_table() -> None:
+    op.drop_index(op.f('ix_question_ai_content_question_id'), table_name='question_ai_content')
+    op.drop_index(op.f('ix_question_ai_content_id'), table_name='question_ai_content')
+    op.drop_table('question_ai_content')
+
+
+# The table is a cache that regenerates on demand, so both directions
+# recreate it empty rather than rewriting its unique constraint in place.
+
+def upgrade() -> None:
+    _drop_table()
+    _create_table(with_source_hash=True)
+
+
+def downgrade() -> None:
+    _drop_table()
+    _create_table(with_source_hash=False)
@@ -0,0 +1,46 @@
+"""Benchmark the pulli (dot-grid) Kolam search across grid sizes.
+
+Usage: python -m scripts.benchmark_pulli_kolams [max_results]
+"""
+import sys
+import tempfile
+import time
+
+from src.services.ai.pulli_kolam import PulliKolamGenerator
+
+GRIDS = [
+    (3, 3, "none"),
+    (4, 4, "none"),
+    (5, 5, "none"),
+    (5, 5, "rotational"),
+    (6, 6, "bilateral"),
+    (7, 7, "rotational"),
+    (9, 9, "rotational"),
+    (10, 10, "bilateral"),
+    (12, 12, "none"),
+]
+
+
+def main():
+    max_results = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        generator = PulliKolamGenerator(cache_dir=cache_dir)
+
+        print(f"{'grid':>8} {'symmetry':>11} {'found':>6} {'nodes':>7} {'exhaustive':>10} {'search ms':>10} {'cached ms':>10}")
+        for rows, cols, symmetry in GRIDS:
+            result = generator.generate(rows, cols, symmetry, max_results=max_results)
+
+            started = time.perf_counter()
+            generator.generate(rows, cols, symmetry, max_results=max_results)
+            cached_ms = (time.perf_counter() - started) * 1000
+
+            print(
+                f"{f'{rows}x{cols}':>8} {symmetry:>11} {len(result['kolams']):>6} "
+                f"{result['nodes_explored']:>7} {str(result['exhaustive']):>10} "
+                f"{result['search_time_ms']:>10.1f} {cached_ms:>10.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
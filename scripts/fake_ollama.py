@@ -0,0 +1,150 @@
+"""A stand-in Ollama server for load testing without a GPU.
+
+Implements /api/generate (streaming and non-streaming) and /api/tags with
+configurable latency and error injection. Completion time is drawn from a
+log-normal distribution around the median, and is either spent before the
+response (non-streaming) or spread across the streamed tokens.
+
+Usage: python -m scripts.fake_ollama [--port 11435] [--median-ms 800] [--sigma 0.5]
+           [--ttft-ms 150] [--tokens 60] [--error-rate 0.0] [--hang-rate 0.0]
+           [--max-concurrency 2] [--models llama2]
+
+Point the app at it with OLLAMA_BASE_URL=http://localhost:11435.
+"""
+import argparse
+import asyncio
+import json
+import random
+from dataclasses import dataclass, field
+from typing import AsyncIterator, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+WORDS = (
+    "kolam pulli dots lines loops symmetry threshold rice flour pattern grid "
+    "curve sikku kambi festival morning tradition Tamil Nadu geometry"
+).split()
+
+
+@dataclass
+class FakeOllamaConfig:
+    """Latency and failure behaviour of the fake server."""
+
+    median_ms: float = 800.0
+    sigma: float = 0.5
+    ttft_ms: float = 150.0
+    tokens: int = 60
+    error_rate: float = 0.0
+    hang_rate: float = 0.0
+    hang_seconds: float = 60.0
+    # Requests processed at once, like OLLAMA_NUM_PARALLEL; others queue
+    max_concurrency: int = 2
+    models: List[str] = field(default_factory=lambda: ["llama2"])
+    seed: Optional[int] = None
+
+
+def create_app(config: Optional[FakeOllamaConfig] = None) -> FastAPI:
+    """Create the fake Ollama application."""
+    config = config or FakeOllamaConfig()
+    rng = random.Random(config.seed)
+    slots = asyncio.Semaphore(config.max_concurrency)
+    app = FastAPI(title="Fake Ollama")
+    app.state.config = config
+    app.state.requests = 0
+
+    def completion_seconds() -> float:
+        return rng.lognormvariate(0, config.sigma) * config.median_ms / 1000
+
+    def completion_text(prompt: str) -> List[str]:
+        rng_words = random.Random(prompt)
+        return [rng_words.choice(WORDS) + " " for _ in range(config.tokens)]
+
+    def usage(prompt: str, system: str, tokens: int, seconds: float) -> dict:
+        return {
+            "done": True,
+            "prompt_eval_count": len((system + prompt).split()),
+            "eval_count": tokens,
+            "prompt_eval_duration": int(config.ttft_ms * 1e6),
+            "total_duration": int(seconds * 1e9),
+        }
+
+    @app.get("/api/tags")
+    async def tags():
+        return {"models": [{"name": f"{model}:latest"} for model in config.models]}
+
+    @app.post("/api/generate")
+    async def generate(request: Request):
+        body = await request.json()
+        app.state.requests += 1
+        model = body.get("model", "")
+        prompt = body.get("prompt", "")
+        if model.split(":")[0] not in config.models:
+            return JSONResponse({"error": f"model '{model}' not found"}, status_code=404)
+
+        # An empty prompt only loads the model
+        if not prompt:
+            return {"model": model, "response": "", "done": True}
+
+        roll = rng.random()
+        if roll < config.error_rate:
+            return JSONResponse({"error": "injected failure"}, status_code=500)
+        if roll < config.error_rate + config.hang_rate:
+            await asyncio.sleep(config.hang_seconds)
+
+        seconds = completion_seconds()
+        words = completion_text(prompt)
+        system = body.get("system", "")
+
+        if not body.get("stream", True):
+            async with slots:
+                await asyncio.sleep(seconds)
+            return {"model": model, "response": "".join(words), **usage(prompt, system, len(words), seconds)}
+
+        async def chunks() -> AsyncIterator[str]:
+            async with slots:
+                await asyncio.sleep(config.ttft_ms / 1000)
+                per_token = max(0.0, seconds - config.ttft_ms / 1000) / max(1, len(words))
+                for word in words:
+                    yield json.dumps({"model": model, "response": word, "done": False}) + "\n"
+                    await asyncio.sleep(per_token)
+            yield json.dumps({"model": model, "response": "", **usage(prompt, system, len(words), seconds)}) + "\n"
+
+        return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+    return app
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument("--median-ms", type=float, default=800.0)
+    parser.add_argument("--sigma", type=float, default=0.5)
+    parser.add_argument("--ttft-ms", type=float, default=150.0)
+    parser.add_argument("--tokens", type=int, default=60)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--hang-rate", type=float, default=0.0)
+    parser.add_argument("--max-concurrency", type=int, default=2)
+    parser.add_argument("--models", default="llama2", help="comma-separated model names")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    config = FakeOllamaConfig(
+        median_ms=args.median_ms,
+        sigma=args.sigma,
+        ttft_ms=args.ttft_ms,
+        tokens=args.tokens,
+        error_rate=args.error_rate,
+        hang_rate=args.hang_rate,
+        max_concurrency=args.max_concurrency,
+        models=[model.strip() for model in args.models.split(",") if model.strip()],
+        seed=args.seed,
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
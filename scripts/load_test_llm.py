@@ -0,0 +1,296 @@
+"""Load-test the AI learning assistant against a fake Ollama server.
+
+Everything runs in one process on plain CPUs: the fake server from
+scripts.fake_ollama is mounted on the HTTP client's transport, so no model
+or GPU is needed. Pass --ollama-url to target a separately running fake (or
+real) Ollama instead.
+
+Scenarios:
+  assistant  call AILearningAssistant hint/explanation methods directly (cache-backed)
+  api        GET the learning hint/explanation endpoints (cache-backed)
+  stream     GET the learning SSE streaming endpoints and read them to the end
+
+Usage: python -m scripts.load_test_llm [--scenario assistant] [--requests 200]
+           [--concurrency 20] [--questions 50] [--ollama-url URL] [--json]
+           [fake server options: --median-ms --sigma --ttft-ms --tokens
+            --error-rate --hang-rate --max-concurrency]
+"""
+import argparse
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+from sqlalchemy.orm import Session
+
+from scripts.fake_ollama import FakeOllamaConfig, create_app
+from src.core.config import settings
+from src.core.database import SessionLocal
+from src.services.ai.llm_router import LLMRouter
+from src.services.ai.ollama_service import BUSY_MESSAGE, AILearningAssistant, OllamaService
+
+FAKE_OLLAMA_URL = "http://fake-ollama"
+SCENARIOS = ("assistant", "api", "stream")
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile of unsorted values (0 when empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(q * len(ordered))) - 1))
+    return ordered[index]
+
+
+def is_fallback(text: str) -> bool:
+    """Whether the assistant answered with a canned busy/error message."""
+    return text == BUSY_MESSAGE or text.startswith("I apologize")
+
+
+@dataclass
+class LoadResult:
+    """Outcome of one load-test run."""
+
+    scenario: str
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+    fallbacks: int = 0
+    elapsed: float = 0.0
+
+    def summary(self) -> Dict[str, float]:
+        completed = len(self.latencies)
+        return {
+            "scenario": self.scenario,
+            "requests": completed + self.errors,
+            "errors": self.errors,
+            "fallbacks": self.fallbacks,
+            "throughput_rps": round(completed / self.elapsed, 2) if self.elapsed else 0.0,
+            "p50_ms": round(percentile(self.latencies, 0.50) * 1000, 1),
+            "p90_ms": round(percentile(self.latencies, 0.90) * 1000, 1),
+            "p99_ms": round(percentile(self.latencies, 0.99) * 1000, 1),
+            "max_ms": round(max(self.latencies, default=0.0) * 1000, 1),
+        }
+
+
+async def run_load(
+    scenario: str,
+    call: Callable[[int], Awaitable[str]],
+    requests: int,
+    concurrency: int
+) -> LoadResult:
+    """Issue `requests` calls from `concurrency` workers, timing each one."""
+    result = LoadResult(scenario)
+    counter = iter(range(requests))
+
+    async def worker():
+        for index in counter:
+            started = time.perf_counter()
+            try:
+                text = await call(index)
+            except Exception:
+                result.errors += 1
+                continue
+            result.latencies.append(time.perf_counter() - started)
+            if is_fallback(text):
+                result.fallbacks += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def make_assistant(
+    ollama_url: Optional[str] = None,
+    config: Optional[FakeOllamaConfig] = None,
+    session_factory: Optional[Callable[[], Session]] = None
+) -> AILearningAssistant:
+    """Build an assistant wired to the fake server, or to ollama_url."""
+    timeout = httpx.Timeout(settings.http_timeout_seconds, connect=settings.http_connect_timeout_seconds)
+    if ollama_url:
+        client = httpx.AsyncClient(timeout=timeout)
+        urls = [ollama_url.rstrip("/")]
+    else:
+        transport = httpx.ASGITransport(app=create_app(config))
+        client = httpx.AsyncClient(transport=transport, timeout=timeout)
+        urls = [FAKE_OLLAMA_URL]
+
+    service = OllamaService(client=client, router=LLMRouter.from_settings(urls))
+    if not ollama_url:
+        # The fake only serves its configured models
+        service.model = config.models[0] if config else FakeOllamaConfig().models[0]
+        service.task_models = {}
+    return AILearningAssistant(service, session_factory or SessionLocal)
+
+
+def make_questions(count: int) -> List[Dict[str, object]]:
+    """Distinct trivia questions so requests are not all coalesced together."""
+    return [
+        {
+            "question_text": f"What does pattern feature #{i} represent in a kolam?",
+            "correct_answer": f"Answer {i}",
+            "options": [f"Answer {i}", f"Distractor {i}", f"Other {i}"],
+            "difficulty_level": i % 5 + 1,
+            "category": "patterns",
+            "explanation": None,
+        }
+        for i in range(count)
+    ]
+
+
+def assistant_call(assistant: AILearningAssistant, questions: List[Dict[str, object]]):
+    async def call(index: int) -> str:
+        question = questions[index % len(questions)]
+        if index % 2:
+            return await assistant.get_question_explanation(
+                index % len(questions) + 1, question, user_answer=question["options"][1]
+            )
+        return await assistant.get_question_hint(question, question_id=index % len(questions) + 1)
+    return call
+
+
+def seed_database(questions: List[Dict[str, object]]) -> Callable[[], Session]:
+    """In-memory database holding the questions, ids starting at 1."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from src.core.database import Base
+    from src.db.models.models import TriviaQuestion
+
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    with Session() as db:
+        for question in questions:
+            db.add(TriviaQuestion(
+                question_text=question["question_text"],
+                question_type="multiple_choice",
+                difficulty_level=question["difficulty_level"],
+                category=question["category"],
+                options=question["options"],
+                correct_answer=question["correct_answer"],
+                is_active=True,
+            ))
+        db.commit()
+    return Session
+
+
+def build_api_client(
+    assistant: AILearningAssistant,
+    session_factory: Callable[[], Session]
+) -> httpx.AsyncClient:
+    """Serve the learning router on a database seeded with questions."""
+    from fastapi import FastAPI
+
+    from src.api import learning
+    from src.core.database import get_db
+    from src.services.ai.ollama_service import get_ai_learning_assistant
+
+    def get_test_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(learning.router, prefix="/api/v1/learning")
+    app.dependency_overrides[get_db] = get_test_db
+    app.dependency_overrides[get_ai_learning_assistant] = lambda: assistant
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://app")
+
+
+def api_call(client: httpx.AsyncClient, questions: List[Dict[str, object]], stream: bool):
+    async def call(index: int) -> str:
+        question_id = index % len(questions) + 1
+        path = f"/api/v1/learning/questions/{question_id}"
+        if index % 2:
+            path += "/explanation"
+            params = {"user_answer": questions[question_id - 1]["options"][1]}
+        else:
+            path += "/hint"
+            params = {}
+
+        if not stream:
+            response = await client.get(path, params=params)
+            response.raise_for_status()
+            body = response.json()
+            return body.get("hint") or body.get("explanation") or ""
+
+        text = ""
+        async with client.stream("GET", path + "/stream", params=params) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if line.startswith("data: ") and line != "data: {}":
+                    data = json.loads(line[6:])
+                    # An error event replaces the done event; its message is the fallback text
+                    if "message" in data:
+                        return data["message"]
+                    text += data.get("token", "")
+        return text
+    return call
+
+
+async def run(args) -> LoadResult:
+    config = FakeOllamaConfig(
+        median_ms=args.median_ms,
+        sigma=args.sigma,
+        ttft_ms=args.ttft_ms,
+        tokens=args.tokens,
+        error_rate=args.error_rate,
+        hang_rate=args.hang_rate,
+        max_concurrency=args.max_concurrency,
+        seed=args.seed,
+    )
+    questions = make_questions(args.questions)
+    session_factory = seed_database(questions)
+    assistant = make_assistant(args.ollama_url, config, session_factory)
+
+    try:
+        if args.scenario == "assistant":
+            return await run_load(
+                args.scenario, assistant_call(assistant, questions), args.requests, args.concurrency
+            )
+
+        async with build_api_client(assistant, session_factory) as client:
+            call = api_call(client, questions, stream=args.scenario == "stream")
+            return await run_load(args.scenario, call, args.requests, args.concurrency)
+    finally:
+        await assistant.ollama_service.client.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", choices=SCENARIOS, default="assistant")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--questions", type=int, default=50)
+    parser.add_argument("--ollama-url", help="use this Ollama instead of the in-process fake")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    parser.add_argument("--median-ms", type=float, default=800.0)
+    parser.add_argument("--sigma", type=float, default=0.5)
+    parser.add_argument("--ttft-ms", type=float, default=150.0)
+    parser.add_argument("--tokens", type=int, default=60)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--hang-rate", type=float, default=0.0)
+    parser.add_argument("--max-concurrency", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    summary = asyncio.run(run(args)).summary()
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+    for key, value in summary.items():
+        print(f"{key:>15}: {value}")
+
+
+if __name__ == "__main__":
+    main()
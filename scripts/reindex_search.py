@@ -0,0 +1,40 @@
+"""Rebuild search indices from the database without downtime.
+
+Each index is loaded into a new versioned index and its alias is switched
+over once the load completes; searches keep hitting the old index until then.
+
+Usage: python -m scripts.reindex_search [kolam_images|trivia_questions|all]
+           [--batch-size 500] [--threads 4] [--keep-previous 1]
+"""
+import argparse
+import json
+
+from src.core.database import SessionLocal
+from src.search.client import OpenSearchClient
+from src.search.reindex import SOURCES, Reindexer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("index", nargs="?", default="all", choices=[*SOURCES, "all"])
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--keep-previous", type=int, default=1)
+    args = parser.parse_args()
+
+    client = OpenSearchClient().client
+    if client is None:
+        raise SystemExit("OpenSearch is not reachable")
+
+    aliases = list(SOURCES) if args.index == "all" else [args.index]
+    db = SessionLocal()
+    try:
+        reindexer = Reindexer(client, db, args.batch_size, args.threads, args.keep_previous)
+        for alias in aliases:
+            print(json.dumps(reindexer.reindex(alias), indent=2, default=str))
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Pre-generate AI hints and explanations for the whole trivia question bank.
+
+Prompts run as batches at the Ollama backends' full capacity and every
+completion is checkpointed, so the job can be stopped and re-run without
+losing finished work.
+
+Usage: python -m scripts.warm_question_content [concurrency] [checkpoint_dir]
+"""
+import asyncio
+import json
+import sys
+
+from src.core.http import close_http_client
+from src.services.question_content_service import pregenerate_question_content
+
+DEFAULT_CHECKPOINT_DIR = "generated_images/checkpoints/question_content"
+
+
+async def main():
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    checkpoint_dir = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_CHECKPOINT_DIR
+
+    try:
+        stats = await pregenerate_question_content(
+            concurrency=concurrency,
+            checkpoint_dir=checkpoint_dir
+        )
+    finally:
+        await close_http_client()
+
+    print(json.dumps(stats, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
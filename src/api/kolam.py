@@ -1,21 +1,53 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
 from pathlib import Path
+from typing import List, Optional
+import base64
+import re
 import uuid
 
+from src.core.config import settings
+from src.core.database import get_db
+from src.core.security import verify_token
+
 from src.schemas import (
+    GeneratedKolamSummary,
     KolamGenerationRequest,
     KolamGenerationResponse,
     KnowledgeRequest,
     KnowledgeResponse,
-    PredictionResponse
+    KolamSearchResponse,
+    PredictionResponse,
+    SuggestResponse
 )
 
+from src.search.client import SearchService, get_search_service
+
 from src.services.ai.detection_service import model, classes, predict_image
 from src.services.ai.generation_service import query_knowledge_and_generate
+from src.services.ai.pulli_kolam import get_pulli_kolam_generator
+from src.services.image_store import get_generated_image_store
+from src.services.kolam_service import KolamService
+from src.services.thumbnail_service import get_thumbnail_service
+from src.services.user_service import UserService
 
 
 router = APIRouter(tags=["Kolam"])
 
+IMAGE_KEY_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+THUMBNAIL_NAME_PATTERN = re.compile(r"^(\d+)\.(png|webp)$")
+
+
+def get_optional_user_id(token: Optional[str] = None, db: Session = Depends(get_db)) -> Optional[int]:
+    """Extract user ID from an optional JWT token (None for unknown users)."""
+    if not token:
+        return None
+    username = verify_token(token).get("sub")
+    user = UserService(db).get_user_by_username(username) if username else None
+    return user.id if user else None
+
 
 # Hard-coded mapping of class → design principle
 DESIGN_PRINCIPLES = {
@@ -102,16 +134,235 @@ async def predict_kolam(file: UploadFile = File(...)):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def immutable_file_response(path: Path, etag_value: str, media_type: str, request: Request) -> Response:
+    """Serve a content-addressed file with a strong ETag and immutable caching."""
+    etag = f'"{etag_value}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=31536000, immutable",
+    }
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    return FileResponse(path, media_type=media_type, headers=headers)
+
+
 # ---------- Knowledge + Generation ----------
 @router.post("/knowledge", response_model=KnowledgeResponse)
-async def kolam_knowledge(req: KnowledgeRequest):
+async def kolam_knowledge(
+    req: KnowledgeRequest,
+    db: Session = Depends(get_db),
+    user_id: Optional[int] = Depends(get_optional_user_id)
+):
     """
     Query Kolam knowledge base and optionally generate an image.
     """
     try:
-        explanation, image_base64 = query_knowledge_and_generate(
+        explanation, image_key = query_knowledge_and_generate(
             req.query, req.generate_image
         )
-        return KnowledgeResponse(explanation=explanation, image_base64=image_base64)
+
+        image_base64 = None
+        image_url = None
+        if image_key:
+            image_path = get_generated_image_store().path_for(image_key)
+            image_url = f"/api/v1/kolam/images/{image_key}"
+
+            if req.inline_image:
+                image_base64 = base64.b64encode(image_path.read_bytes()).decode("utf-8")
+
+            if user_id is not None:
+                KolamService(db).record_generated_image(
+                    user_id, str(image_path), req.query, {"image_key": image_key}
+                )
+
+        return KnowledgeResponse(
+            explanation=explanation,
+            image_base64=image_base64,
+            image_url=image_url
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/images/{image_key}")
+async def get_generated_image(image_key: str, request: Request):
+    """
+    Serve a stored generated image.
+
+    Images are content-addressed, so they are sent with a strong ETag and
+    immutable cache headers and can be cached indefinitely by browsers and CDNs.
+    """
+    if not IMAGE_KEY_PATTERN.match(image_key):
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    image_path = get_generated_image_store().get(image_key)
+    if image_path is None:
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    return immutable_file_response(image_path, image_key, "image/png", request)
+
+
+@router.get("/thumbnails/{key}/{name}")
+async def get_thumbnail(key: str, name: str, request: Request):
+    """
+    Serve a precomputed thumbnail of a generated SVG Kolam.
+
+    Thumbnails are keyed by the SVG content hash, so like generated images
+    they are immutable and cacheable forever.
+    """
+    match = THUMBNAIL_NAME_PATTERN.match(name)
+    if not IMAGE_KEY_PATTERN.match(key) or not match:
+        raise HTTPException(status_code=404, detail="Thumbnail not found")
+
+    thumbnails = get_thumbnail_service()
+    size, fmt = int(match.group(1)), match.group(2)
+    thumbnail_path = thumbnails.thumbnail_path(key, size, fmt)
+    if not thumbnail_path.exists():
+        raise HTTPException(status_code=404, detail="Thumbnail not found")
+
+    return immutable_file_response(
+        thumbnail_path, f"{key}_{name}", thumbnails.MEDIA_TYPES[fmt], request
+    )
+
+
+@router.get("/generated", response_model=List[GeneratedKolamSummary])
+async def list_generated_kolams(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    user_id: Optional[int] = Depends(get_optional_user_id)
+):
+    """
+    List a user's generated Kolams with thumbnail URLs.
+
+    SVGs are rasterized once per distinct pattern and served from the
+    thumbnail cache afterwards, so listings never ship full SVG text.
+    """
+    if user_id is None:
+        raise HTTPException(status_code=401, detail="Authentication required")
+
+    kolams = KolamService(db).get_user_generated_kolams(user_id, skip, limit)
+    thumbnails = get_thumbnail_service()
+    svgs = [kolam.svg_data for kolam in kolams if kolam.svg_data]
+    rendered = dict(zip(svgs, await run_in_threadpool(thumbnails.render_batch, svgs)))
+
+    summaries = []
+    for kolam in kolams:
+        urls = {}
+        # SVGs that failed to render are listed without thumbnails
+        if rendered.get(kolam.svg_data):
+            key = thumbnails.key_for(kolam.svg_data)
+            urls = {
+                name: f"/api/v1/kolam/thumbnails/{key}/{name}"
+                for name in rendered[kolam.svg_data]
+            }
+        summaries.append(GeneratedKolamSummary(
+            id=kolam.id,
+            pattern_type=kolam.pattern_type,
+            complexity_level=kolam.complexity_level or 1,
+            symmetry_type=kolam.symmetry_type,
+            size=kolam.size,
+            title=kolam.title,
+            description=kolam.description,
+            generation_params=kolam.generation_params,
+            is_favorite=kolam.is_favorite or False,
+            created_at=kolam.created_at,
+            thumbnails=urls
+        ))
+    return summaries
+
+
+@router.get("/search", response_model=KolamSearchResponse)
+async def search_kolams(
+    q: Optional[str] = Query(None, max_length=200),
+    tags: Optional[List[str]] = Query(None),
+    patterns: Optional[List[str]] = Query(None),
+    min_complexity: Optional[float] = Query(None, ge=0),
+    max_complexity: Optional[float] = Query(None, ge=0),
+    size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, max_length=4096),
+    user_id: Optional[int] = Depends(get_optional_user_id),
+    search: SearchService = Depends(get_search_service)
+):
+    """
+    Search the Kolam gallery, with facet counts for the same query.
+
+    The first page comes from one OpenSearch request returning the hits and
+    counts by tag, detected pattern, symmetry type and complexity band, and
+    is cached briefly. Pass next_cursor back as cursor (with the same
+    filters) for the following pages, which carry no facets; a cursor that
+    has expired gets 410.
+    """
+    complexity_range = None
+    if min_complexity is not None or max_complexity is not None:
+        complexity_range = (min_complexity, max_complexity)
+
+    if cursor:
+        return await search.page_kolams(
+            query_text=q,
+            tags=tags,
+            pattern_types=patterns,
+            complexity_range=complexity_range,
+            user_id=user_id,
+            size=size,
+            cursor=cursor
+        )
+
+    return await search.facet_kolams(
+        query_text=q,
+        tags=tags,
+        pattern_types=patterns,
+        complexity_range=complexity_range,
+        user_id=user_id,
+        size=size
+    )
+
+
+@router.get("/suggest", response_model=SuggestResponse)
+async def suggest_kolams(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=100),
+    size: int = Query(8, ge=1, le=settings.search_suggest_max_results),
+    search: SearchService = Depends(get_search_service)
+):
+    """
+    Search-as-you-type suggestions from public titles, tags, patterns,
+    Kolam styles and trivia categories.
+
+    No database access: the completion suggester answers, or the in-memory
+    trie if it is slow or down, so each keystroke stays cheap.
+    """
+    response.headers["Cache-Control"] = "public, max-age=60"
+    return {"suggestions": await search.suggest(q, size)}
+
+
+@router.get("/pulli")
+async def generate_pulli_kolams(
+    rows: int = Query(5, ge=1, le=15),
+    cols: int = Query(5, ge=1, le=15),
+    symmetry: str = "none",
+    max_results: int = Query(20, ge=1, le=200),
+    seed: Optional[int] = None,
+    include_svg: bool = False
+):
+    """
+    Find single-loop (sikku) Kolams on a dot grid.
+
+    Results are cached per grid configuration, so repeat requests are instant.
+    """
+    generator = get_pulli_kolam_generator()
+    try:
+        # The search is CPU-bound and can take seconds on large grids
+        result = await run_in_threadpool(generator.generate, rows, cols, symmetry, max_results, seed)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if include_svg:
+        result = dict(result)
+        result["kolams"] = [
+            {**kolam, "svg_data": generator.render_svg(rows, cols, kolam)}
+            for kolam in result["kolams"]
+        ]
+    return result
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from datetime import datetime
+import json
 
 from src.core.database import get_db
 from src.core.security import verify_token
@@ -10,7 +12,13 @@ from src.schemas import (
     LearningSession, LearningSessionCreate, LearningSessionUpdate,
     QuizSession, QuizAnswer
 )
+from src.services.ai.ollama_service import AILearningAssistant, OllamaStreamError, get_ai_learning_assistant
 from src.services.learning_service import LearningService
+from src.services.question_content_service import (
+    KIND_HINT,
+    QuestionContentService,
+    pregenerate_question_content,
+)
 
 router = APIRouter()
 
@@ -20,6 +28,46 @@ def get_current_user_id(token: str = Depends(verify_token)) -> int:
     return 1  # Placeholder
 
 
+def question_to_dict(question) -> Dict[str, Any]:
+    """Extract the fields the AI assistant needs from a trivia question."""
+    return {
+        "question_text": question.question_text,
+        "correct_answer": question.correct_answer,
+        "difficulty_level": question.difficulty_level,
+        "category": question.category,
+        "explanation": question.explanation
+    }
+
+
+async def sse_events(tokens: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Wrap streamed tokens as server-sent events.
+
+    Ends with a done event, or with an error event carrying a message to
+    show if generation failed, so a cut-off answer never looks complete.
+    """
+    try:
+        async for token in tokens:
+            yield f"data: {json.dumps({'token': token})}\n\n"
+    except OllamaStreamError as e:
+        yield f"event: error\ndata: {json.dumps({'message': str(e)})}\n\n"
+        return
+    yield "event: done\ndata: {}\n\n"
+
+
+async def single_token(text: str) -> AsyncIterator[str]:
+    """Stream already-available text as one chunk."""
+    yield text
+
+
+def sse_response(tokens: AsyncIterator[str]) -> StreamingResponse:
+    """Stream tokens to the client as they are generated."""
+    return StreamingResponse(
+        sse_events(tokens),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/questions", response_model=List[TriviaQuestion])
 async def get_trivia_questions(
     category: Optional[str] = None,
@@ -65,10 +113,98 @@ async def get_trivia_question(
     return question
 
 
+@router.get("/questions/{question_id}/hint")
+async def get_question_hint(
+    question_id: int,
+    db: Session = Depends(get_db),
+    assistant: AILearningAssistant = Depends(get_ai_learning_assistant)
+):
+    """Get the AI hint for a question, served from the precomputed cache."""
+    learning_service = LearningService(db)
+    question = learning_service.get_trivia_question(question_id)
+    if not question:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Trivia question not found"
+        )
+    
+    hint = await QuestionContentService(db, assistant).get_hint(question)
+    return {"question_id": question_id, "hint": hint}
+
+
+@router.get("/questions/{question_id}/explanation")
+async def get_question_explanation(
+    question_id: int,
+    user_answer: Optional[str] = None,
+    db: Session = Depends(get_db),
+    assistant: AILearningAssistant = Depends(get_ai_learning_assistant)
+):
+    """Get the AI explanation for a question, served from the precomputed cache."""
+    learning_service = LearningService(db)
+    question = learning_service.get_trivia_question(question_id)
+    if not question:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Trivia question not found"
+        )
+    
+    explanation = await QuestionContentService(db, assistant).get_explanation(question, user_answer)
+    return {"question_id": question_id, "explanation": explanation}
+
+
+@router.get("/questions/{question_id}/hint/stream")
+async def stream_question_hint(
+    question_id: int,
+    db: Session = Depends(get_db),
+    assistant: AILearningAssistant = Depends(get_ai_learning_assistant)
+):
+    """Stream an AI-generated hint for a question as server-sent events."""
+    learning_service = LearningService(db)
+    question = learning_service.get_trivia_question(question_id)
+    if not question:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Trivia question not found"
+        )
+    
+    cached = QuestionContentService(db, assistant).get_cached(question, KIND_HINT)
+    if cached is not None:
+        return sse_response(single_token(cached))
+    
+    return sse_response(assistant.stream_question_hint(question_to_dict(question)))
+
+
+@router.get("/questions/{question_id}/explanation/stream")
+async def stream_question_explanation(
+    question_id: int,
+    user_answer: Optional[str] = None,
+    db: Session = Depends(get_db),
+    assistant: AILearningAssistant = Depends(get_ai_learning_assistant)
+):
+    """Stream an AI-generated explanation for a question as server-sent events."""
+    learning_service = LearningService(db)
+    question = learning_service.get_trivia_question(question_id)
+    if not question:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Trivia question not found"
+        )
+    
+    content_service = QuestionContentService(db, assistant)
+    cached = content_service.get_cached_explanation(question, user_answer)
+    if cached is not None:
+        return sse_response(single_token(cached))
+    
+    return sse_response(
+        assistant.stream_question_explanation(question_to_dict(question), user_answer)
+    )
+
+
 @router.put("/questions/{question_id}", response_model=TriviaQuestion)
 async def update_trivia_question(
     question_id: int,
     question_update: TriviaQuestionUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user_id: int = Depends(get_current_user_id)
 ):
@@ -83,6 +219,9 @@ async def update_trivia_question(
         )
     
     updated_question = learning_service.update_trivia_question(question_id, question_update)
+    
+    # The update dropped the question's cached hints/explanations; refill them
+    background_tasks.add_task(pregenerate_question_content, [question_id])
     return updated_question
 
 
@@ -21,13 +21,74 @@ class Settings(BaseSettings):
     database_url_test: str = "sqlite:///./kolam_test.db"
     
     # OpenSearch
+    # "embedded": in-process SQLite FTS5, no cluster needed; "auto": embedded if the cluster is unreachable at startup
+    search_backend: str = "opensearch"
+    search_probe_timeout_seconds: float = 2.0
+    search_embedded_path: str = "search.db"
     opensearch_url: str = "http://localhost:9200"
     opensearch_username: Optional[str] = None
     opensearch_password: Optional[str] = None
+    opensearch_timeout_seconds: float = 10.0
+    opensearch_max_retries: int = 2
+    opensearch_pool_maxsize: int = 20
+    opensearch_keepalive_seconds: float = 60.0
+    opensearch_http_compress: bool = True
+    opensearch_number_of_replicas: int = 0
+    opensearch_refresh_interval: str = "1s"
+    
+    # Vector and hybrid search
+    kolam_vector_dimension: int = 512
+    opensearch_knn_engine: str = "lucene"  # lucene filters during graph search; also nmslib, faiss
+    opensearch_knn_space_type: str = "cosinesimil"
+    opensearch_knn_ef_construction: int = 128
+    opensearch_knn_m: int = 16
+    search_hybrid_candidate_factor: int = 3
+    search_rrf_rank_constant: int = 60
+    search_bulk_max_docs: int = 500
+    search_bulk_max_bytes: int = 5 * 1024 * 1024
+    search_bulk_flush_interval_seconds: float = 1.0
+    search_bulk_max_retries: int = 3
+    search_bulk_retry_backoff_seconds: float = 0.5
+    search_outbox_relay_enabled: bool = True
+    search_outbox_batch_size: int = 500
+    search_outbox_poll_interval_seconds: float = 1.0
+    search_outbox_max_attempts: int = 5
+    search_outbox_max_backoff_seconds: float = 60.0
+    search_cache_enabled: bool = True
+    search_cache_ttl_seconds: float = 30.0
+    search_cache_max_entries: int = 1024
+    search_pit_keep_alive: str = "2m"
+    search_facet_size: int = 20
+    search_suggest_max_results: int = 10
+    search_suggest_timeout_seconds: float = 0.005  # then answer from the in-memory trie
+    search_facet_cache_ttl_seconds: float = 300.0  # 0 disables caching of global facet counts
+    
+    # Outbound HTTP
+    http_timeout_seconds: float = 30.0
+    http_connect_timeout_seconds: float = 5.0
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry_seconds: float = 60.0
     
     # Ollama
     ollama_base_url: str = "http://localhost:11434"
     ollama_model: str = "llama2"
+    pregenerate_question_content: bool = True
+    ollama_max_in_flight: int = 2
+    ollama_max_queue: int = 64
+    ollama_queue_timeout_seconds: float = 10.0
+    ollama_backends: str = ""  # comma-separated base URLs; defaults to ollama_base_url
+    ollama_task_models: str = ""  # e.g. "hint=llama3.2:1b,analysis=llama3:8b"
+    ollama_backend_cooldown_seconds: float = 30.0
+    ollama_backend_max_failures: int = 3
+    ollama_slow_call_seconds: float = 20.0
+    ollama_half_open_max_calls: int = 1
+    ollama_hedge_enabled: bool = False
+    ollama_hedge_percentile: float = 0.95
+    ollama_hedge_min_delay_seconds: float = 1.0
+    ollama_health_check_interval_seconds: float = 15.0
+    ollama_keep_alive: str = "30m"
+    ollama_warm_up: bool = True
     
     # Security
     secret_key: str = "your-secret-key-here-change-in-production"
@@ -38,11 +99,20 @@ class Settings(BaseSettings):
     upload_dir: str = "uploads"
     max_file_size: int = 10485760  # 10MB
     allowed_extensions: str = "jpg,jpeg,png,gif,svg"
+    generated_image_dir: str = "generated_images"
+    generated_image_max_bytes: int = 524288000  # 500MB
+    thumbnail_dir: str = "generated_images/thumbnails"
+    thumbnail_sizes: str = "64,128,256"
+    thumbnail_formats: str = "png,webp"
     
     # AI Model Configuration
     model_path: str = "models/"
     detection_confidence_threshold: float = 0.7
     generation_max_complexity: int = 100
+    knowledge_context_token_budget: int = 1500
+    image_prompt_token_budget: int = 480
+    pulli_kolam_cache_dir: str = "generated_images/pulli"
+    pulli_kolam_memory_cache_size: int = 128
     
     # Monitoring
     enable_metrics: bool = True
@@ -0,0 +1,43 @@
+import httpx
+from typing import Optional
+
+from src.core.config import settings
+from src.core.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the pooled HTTP client used for outbound service calls."""
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(settings.http_timeout_seconds, connect=settings.http_connect_timeout_seconds),
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry_seconds
+        )
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the application-scoped HTTP client (FastAPI dependency).
+
+    The client is normally opened in the application lifespan; scripts and
+    tests that run without it get one created on first use.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_http_client()
+    return _client
+
+
+async def close_http_client():
+    """Close the shared client and its pooled connections."""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+        logger.info("HTTP client pool closed")
+    _client = None
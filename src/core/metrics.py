@@ -0,0 +1,135 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+
+# Ollama request coalescing
+OLLAMA_REQUESTS = Counter(
+    "ollama_requests_total",
+    "Ollama completions requested by the application"
+)
+OLLAMA_UPSTREAM_REQUESTS = Counter(
+    "ollama_upstream_requests_total",
+    "Ollama completions actually sent to the model server"
+)
+OLLAMA_COALESCED_REQUESTS = Counter(
+    "ollama_coalesced_requests_total",
+    "Ollama completions served by joining an identical in-flight request"
+)
+
+# LLM scheduling
+LLM_QUEUE_DEPTH = Gauge(
+    "llm_queue_depth",
+    "Requests waiting for an LLM slot",
+    ["backend"]
+)
+LLM_IN_FLIGHT = Gauge(
+    "llm_in_flight_requests",
+    "Requests currently running against an LLM backend",
+    ["backend"]
+)
+LLM_QUEUE_WAIT_SECONDS = Histogram(
+    "llm_queue_wait_seconds",
+    "Time requests spent waiting for an LLM slot",
+    ["backend", "priority"],
+    buckets=(0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+)
+LLM_REJECTED_REQUESTS = Counter(
+    "llm_rejected_requests_total",
+    "Requests rejected by the LLM scheduler",
+    ["backend", "reason"]
+)
+
+# LLM backends
+LLM_BACKEND_HEALTHY = Gauge(
+    "llm_backend_healthy",
+    "Whether an LLM backend is in rotation (1) or ejected (0)",
+    ["backend"]
+)
+LLM_BACKEND_LATENCY_SECONDS = Histogram(
+    "llm_backend_latency_seconds",
+    "Completion latency per LLM backend",
+    ["backend"],
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60)
+)
+LLM_BACKEND_ERRORS = Counter(
+    "llm_backend_errors_total",
+    "Failed requests per LLM backend",
+    ["backend"]
+)
+LLM_CIRCUIT_STATE = Gauge(
+    "llm_circuit_state",
+    "Circuit breaker state per LLM backend (0 closed, 1 half-open, 2 open)",
+    ["backend"]
+)
+LLM_CIRCUIT_TRANSITIONS = Counter(
+    "llm_circuit_transitions_total",
+    "Circuit breaker state changes per LLM backend",
+    ["backend", "state"]
+)
+OLLAMA_HEDGED_REQUESTS = Counter(
+    "ollama_hedged_requests_total",
+    "Ollama requests duplicated to a second backend after the hedge delay"
+)
+OLLAMA_HEDGE_WINS = Counter(
+    "ollama_hedge_wins_total",
+    "Hedged Ollama requests answered first by the second backend"
+)
+
+# LLM token usage
+LLM_PROMPT_TOKENS = Histogram(
+    "llm_prompt_tokens",
+    "Prompt tokens evaluated per completion (cached prefix tokens are not counted)",
+    ["task"],
+    buckets=(8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096)
+)
+LLM_COMPLETION_TOKENS = Histogram(
+    "llm_completion_tokens",
+    "Tokens generated per completion",
+    ["task"],
+    buckets=(16, 32, 64, 128, 256, 512, 1024)
+)
+LLM_PROMPT_EVAL_SECONDS = Histogram(
+    "llm_prompt_eval_seconds",
+    "Time the model spent evaluating the prompt",
+    ["task"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+)
+LLM_GENERATION_SECONDS = Histogram(
+    "llm_generation_seconds",
+    "Total server-side time per completion, including model load",
+    ["task"],
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60)
+)
+
+# Search indexing
+SEARCH_INDEXED_DOCUMENTS = Counter(
+    "search_indexed_documents_total",
+    "Search index and delete actions sent in bulk, by result",
+    ["result"]
+)
+SEARCH_INDEX_BUFFERED = Gauge(
+    "search_index_buffered_actions",
+    "Index and delete actions waiting for the next bulk flush"
+)
+SEARCH_BULK_FLUSH_SECONDS = Histogram(
+    "search_bulk_flush_seconds",
+    "Time to send one buffer of bulk actions, including retries",
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+)
+
+SEARCH_OUTBOX_RELAYED = Counter(
+    "search_outbox_relayed_total",
+    "Search outbox entries relayed to the index, by result (failed ones are retried, then dead-lettered; "
+    "deferred ones hit a transient error and are retried without counting an attempt)",
+    ["result"]
+)
+
+# Search result cache
+SEARCH_CACHE_REQUESTS = Counter(
+    "search_cache_requests_total",
+    "Search result cache lookups, by result (hit, miss)",
+    ["result"]
+)
+SEARCH_CACHE_INVALIDATIONS = Counter(
+    "search_cache_invalidations_total",
+    "Search result cache entries dropped because an index write changed them"
+)
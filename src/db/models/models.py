@@ -0,0 +1,162 @@
+from sqlalchemy import Column, Integer, String, Boolean, Float, Text, JSON, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+
+from src.core.database import Base
+
+
+class User(Base):
+    """Registered platform user."""
+
+    __tablename__ = "users"
+
+    id = Column(Integer, primary_key=True, index=True)
+    email = Column(String(255), unique=True, index=True, nullable=False)
+    username = Column(String(100), unique=True, index=True, nullable=False)
+    hashed_password = Column(String(255), nullable=False)
+    full_name = Column(String(255))
+    is_active = Column(Boolean, default=True)
+    is_verified = Column(Boolean, default=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True))
+
+    kolam_images = relationship("KolamImage", back_populates="user")
+    generated_kolams = relationship("GeneratedKolam", back_populates="user")
+    learning_sessions = relationship("LearningSession", back_populates="user")
+
+
+class KolamImage(Base):
+    """Uploaded Kolam image with AI analysis results."""
+
+    __tablename__ = "kolam_images"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    filename = Column(String(255), nullable=False)
+    file_path = Column(String(500), nullable=False)
+    file_size = Column(Integer)
+    mime_type = Column(String(100))
+
+    # AI analysis
+    detected_patterns = Column(JSON)
+    confidence_scores = Column(JSON)
+    complexity_score = Column(Float)
+    symmetry_type = Column(String(50))
+    geometric_features = Column(JSON)
+
+    # Metadata
+    title = Column(String(255))
+    description = Column(Text)
+    tags = Column(JSON)
+    is_public = Column(Boolean, default=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True))
+
+    user = relationship("User", back_populates="kolam_images")
+
+
+class GeneratedKolam(Base):
+    """AI or procedurally generated Kolam pattern."""
+
+    __tablename__ = "generated_kolams"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    pattern_type = Column(String(100), nullable=False)
+    complexity_level = Column(Integer)
+    symmetry_type = Column(String(50))
+    size = Column(String(20))
+    svg_data = Column(Text)
+    image_path = Column(String(500))
+    generation_params = Column(JSON)
+    title = Column(String(255))
+    description = Column(Text)
+    is_favorite = Column(Boolean, default=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    user = relationship("User", back_populates="generated_kolams")
+
+
+class TriviaQuestion(Base):
+    """Trivia question used in quizzes."""
+
+    __tablename__ = "trivia_questions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    question_text = Column(Text, nullable=False)
+    question_type = Column(String(50), nullable=False)
+    difficulty_level = Column(Integer, default=1)
+    options = Column(JSON)
+    correct_answer = Column(String(500), nullable=False)
+    explanation = Column(Text)
+    image_path = Column(String(500))
+    audio_path = Column(String(500))
+    category = Column(String(100))
+    tags = Column(JSON)
+    is_active = Column(Boolean, default=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True))
+
+
+class QuestionAIContent(Base):
+    """Precomputed AI hint or explanation for a trivia question.
+
+    Entries are keyed by prompt template version, model and a hash of the
+    question fields the prompt was built from, so that changing any of them
+    simply misses the cache instead of serving stale text, even for content
+    that finished generating after the question was edited.
+    """
+
+    __tablename__ = "question_ai_content"
+    __table_args__ = (
+        UniqueConstraint("question_id", "kind", "variant", "prompt_version", "model", "source_hash"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    question_id = Column(Integer, ForeignKey("trivia_questions.id"), nullable=False, index=True)
+    kind = Column(String(20), nullable=False)
+    variant = Column(String(500), nullable=False, default="")
+    prompt_version = Column(String(20), nullable=False)
+    model = Column(String(100), nullable=False)
+    source_hash = Column(String(64), nullable=False)
+    content = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class SearchOutbox(Base):
+    """A search document to refresh, written in the same transaction as the change.
+
+    The relay sends the row's current state (or a delete, if it is gone) to
+    the search index and removes the entry once the index accepted it.
+    Entries that keep failing are dead-lettered by setting failed_at.
+    """
+
+    __tablename__ = "search_outbox"
+
+    id = Column(Integer, primary_key=True, index=True)
+    index_name = Column(String(100), nullable=False)
+    doc_id = Column(String(100), nullable=False)
+    attempts = Column(Integer, nullable=False, default=0)
+    failed_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class LearningSession(Base):
+    """A user's learning or quiz session."""
+
+    __tablename__ = "learning_sessions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    session_type = Column(String(50), nullable=False)
+    questions_answered = Column(Integer, default=0)
+    correct_answers = Column(Integer, default=0)
+    total_score = Column(Float, default=0.0)
+    current_level = Column(Integer, default=1)
+    streak_days = Column(Integer, default=0)
+    last_activity = Column(DateTime(timezone=True), server_default=func.now())
+    session_data = Column(JSON)
+    completed_at = Column(DateTime(timezone=True))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    user = relationship("User", back_populates="learning_sessions")
@@ -2,13 +2,22 @@ from fastapi import FastAPI, Depends, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
+from prometheus_client import make_asgi_app
+import asyncio
 import structlog
 from contextlib import asynccontextmanager
 
 from src.core.config import settings
 from src.core.logging import configure_logging, get_logger
 from src.core.database import engine, Base
+from src.core.http import close_http_client, get_http_client
+from src.search.client import close_search_client, get_search_service
+from src.search.pagination import ExpiredCursorError, InvalidCursorError
+from src.search.relay import OutboxRelay
+from src.search.suggest import load_suggestions
 from src.api import auth, kolam, learning, users
+from src.services.ai.ollama_service import get_ai_learning_assistant
+from src.services.question_content_service import pregenerate_question_content
 
 
 logger = get_logger(__name__)
@@ -24,9 +33,53 @@ async def lifespan(app: FastAPI):
     Base.metadata.create_all(bind=engine)
     logger.info("Database tables created")
     
+    # Pooled keep-alive client shared by every outbound service call
+    app.state.http_client = get_http_client()
+    
+    # Keep LLM backend health and available models up to date
+    ollama_service = get_ai_learning_assistant().ollama_service
+    health_monitor = asyncio.create_task(
+        ollama_service.router.monitor(app.state.http_client, settings.ollama_health_check_interval_seconds)
+    )
+    
+    # Load models up front so the first learner request does not wait for it
+    warm_up = None
+    if settings.ollama_warm_up:
+        warm_up = asyncio.create_task(ollama_service.warm_up())
+    
+    # Create search indices over the shared async OpenSearch pool
+    search_setup = asyncio.create_task(get_search_service().initialize())
+    get_search_service().indexer.start()
+    
+    # Typeahead terms for the suggest endpoint
+    suggestions = asyncio.create_task(load_suggestions(get_search_service(), kolam.DESIGN_PRINCIPLES))
+    
+    # Carry committed database changes into the search index
+    outbox_relay = None
+    if settings.search_outbox_relay_enabled:
+        outbox_relay = asyncio.create_task(OutboxRelay.from_settings().run())
+    
+    # Warm the hint/explanation cache without delaying startup
+    pregeneration = None
+    if settings.pregenerate_question_content:
+        pregeneration = asyncio.create_task(pregenerate_question_content())
+    
     yield
     
     # Shutdown
+    if pregeneration and not pregeneration.done():
+        pregeneration.cancel()
+    if warm_up and not warm_up.done():
+        warm_up.cancel()
+    if not search_setup.done():
+        search_setup.cancel()
+    if outbox_relay:
+        outbox_relay.cancel()
+    if not suggestions.done():
+        suggestions.cancel()
+    health_monitor.cancel()
+    await close_http_client()
+    await close_search_client()
     logger.info("Shutting down Kolam Learning Platform")
 
 
@@ -65,6 +118,9 @@ def create_app() -> FastAPI:
     app.include_router(kolam.router, prefix="/api/v1/kolam", tags=["kolam"])
     app.include_router(learning.router, prefix="/api/v1/learning", tags=["learning"])
     
+    if settings.enable_metrics:
+        app.mount("/metrics", make_asgi_app())
+    
     @app.get("/")
     async def root():
         """Root endpoint with basic API information."""
@@ -93,6 +149,15 @@ def create_app() -> FastAPI:
             content={"detail": exc.detail}
         )
     
+    @app.exception_handler(InvalidCursorError)
+    async def invalid_cursor_handler(request, exc):
+        """Malformed pagination cursors are client errors; expired ones are gone."""
+        status_code = (
+            status.HTTP_410_GONE if isinstance(exc, ExpiredCursorError)
+            else status.HTTP_400_BAD_REQUEST
+        )
+        return JSONResponse(status_code=status_code, content={"detail": str(exc)})
+    
     @app.exception_handler(Exception)
     async def general_exception_handler(request, exc):
         """Global exception handler for unhandled exceptions."""
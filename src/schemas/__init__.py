@@ -142,6 +142,125 @@ class QuizSession(BaseModel):
     total_score: float
     completed_at: Optional[datetime] = None
 
+# -------------------------
+# Kolam Image Schemas
+# -------------------------
+class KolamImageBase(BaseModel):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    tags: Optional[List[str]] = None
+    is_public: bool = False
+
+class KolamImageCreate(KolamImageBase):
+    pass
+
+class KolamImageUpdate(BaseModel):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    tags: Optional[List[str]] = None
+    is_public: Optional[bool] = None
+
+class KolamImageAnalysis(BaseModel):
+    detected_patterns: List[str] = []
+    confidence_scores: Dict[str, float] = {}
+    complexity_score: Optional[float] = None
+    symmetry_type: Optional[str] = None
+    geometric_features: Optional[Dict[str, Any]] = None
+
+class KolamImageInDB(KolamImageBase):
+    id: int
+    user_id: int
+    filename: str
+    file_path: str
+    file_size: Optional[int] = None
+    mime_type: Optional[str] = None
+    detected_patterns: Optional[List[str]] = None
+    confidence_scores: Optional[Dict[str, float]] = None
+    complexity_score: Optional[float] = None
+    symmetry_type: Optional[str] = None
+    geometric_features: Optional[Dict[str, Any]] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class KolamImage(KolamImageInDB):
+    pass
+
+# -------------------------
+# Kolam Search Schemas
+# -------------------------
+class KolamSearchHit(BaseModel):
+    id: int
+    title: Optional[str] = None
+    description: Optional[str] = None
+    tags: List[str] = []
+    detected_patterns: List[str] = []
+    symmetry_type: Optional[str] = None
+    complexity_score: Optional[float] = None
+    user_id: Optional[int] = None
+    is_public: bool = False
+    created_at: Optional[datetime] = None
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+class KolamSearchResponse(BaseModel):
+    """Gallery search results with counts per tag, pattern, symmetry and complexity band."""
+    results: List[KolamSearchHit]
+    facets: Dict[str, List[FacetCount]] = {}
+    next_cursor: Optional[str] = Field(None, description="Pass as cursor for the next page; null on the last page")
+
+class Suggestion(BaseModel):
+    text: str
+    kind: str = Field(..., description="title, tag, pattern, style or category")
+
+class SuggestResponse(BaseModel):
+    suggestions: List[Suggestion]
+
+# -------------------------
+# Generated Kolam Schemas
+# -------------------------
+class GeneratedKolamBase(BaseModel):
+    pattern_type: str
+    complexity_level: int = Field(1, ge=1, le=5)
+    symmetry_type: Optional[str] = None
+    size: Optional[str] = "medium"
+    title: Optional[str] = None
+    description: Optional[str] = None
+    generation_params: Optional[Dict[str, Any]] = None
+
+class GeneratedKolamCreate(GeneratedKolamBase):
+    pass
+
+class GeneratedKolamUpdate(BaseModel):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    is_favorite: Optional[bool] = None
+
+class GeneratedKolamInDB(GeneratedKolamBase):
+    id: int
+    user_id: int
+    svg_data: Optional[str] = None
+    image_path: Optional[str] = None
+    is_favorite: bool = False
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class GeneratedKolam(GeneratedKolamInDB):
+    pass
+
+class GeneratedKolamSummary(GeneratedKolamBase):
+    """Gallery listing entry: thumbnail URLs instead of the full SVG text."""
+    id: int
+    is_favorite: bool = False
+    created_at: datetime
+    thumbnails: Dict[str, str] = {}
+
 # -------------------------
 # Kolam Generation / Knowledge Schemas
 # -------------------------
@@ -154,10 +273,12 @@ class KolamGenerationResponse(BaseModel):
 class KnowledgeRequest(BaseModel):
     query: str = Field(..., description="User query for knowledge retrieval")
     generate_image: bool = Field(default=True, description="Whether to generate an image")
+    inline_image: bool = Field(default=True, description="Whether to also return the image inline as base64")
 
 class KnowledgeResponse(BaseModel):
     explanation: str = Field(..., description="Textual explanation of the query")
     image_base64: Optional[str] = Field(None, description="Base64-encoded generated image, if requested")
+    image_url: Optional[str] = Field(None, description="Cacheable URL of the generated image, if any")
 
 # -------------------------
 # Kolam Prediction Schemas
@@ -0,0 +1,161 @@
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Optional
+
+from src.core.config import settings
+from src.core.logging import LoggerMixin
+from src.core.metrics import SEARCH_CACHE_INVALIDATIONS, SEARCH_CACHE_REQUESTS
+
+# Query DSL arrays whose order does not change the result
+UNORDERED_CLAUSES = {"must", "filter", "should", "must_not", "fields"}
+
+
+def normalize_query(value: Any, key: Optional[str] = None) -> Any:
+    """Canonical form of a query so equivalent queries hash the same.
+
+    Bool clauses, terms values and multi_match fields are sorted, and
+    free-text query strings are lowercased with whitespace collapsed (the
+    analyzers lowercase them anyway).
+    """
+    if isinstance(value, dict):
+        if key == "terms":
+            return {
+                field: sorted(values, key=str) if isinstance(values, list) else normalize_query(values, field)
+                for field, values in value.items()
+            }
+        return {field: normalize_query(item, field) for field, item in value.items()}
+    if isinstance(value, list):
+        items = [normalize_query(item) for item in value]
+        if key in UNORDERED_CLAUSES:
+            items.sort(key=lambda item: json.dumps(item, sort_keys=True, default=str))
+        return items
+    if isinstance(value, str) and key == "query":
+        return " ".join(value.lower().split())
+    return value
+
+
+@dataclass
+class CacheEntry:
+    results: List[Dict[str, Any]]
+    expires_at: float
+    # Tag filter of the query (None: any tag) and user whose private images it includes
+    tags: Optional[FrozenSet[str]]
+    user_id: Optional[int]
+    doc_ids: FrozenSet[str]
+
+
+class SearchResultCache(LoggerMixin):
+    """Short-lived in-process cache of search results.
+
+    Entries are keyed by a hash of the normalized query and expire after
+    ttl seconds; the least recently used are evicted beyond max_entries.
+    Writes invalidate entries that returned the written document, and
+    entries whose filters the written document would now match (same tag,
+    and public or owned by the user the query was for). SearchService
+    invalidates once a write is searchable, after the bulk flush that sent
+    it; a search that started before an invalidation passes the generation
+    it read and its results are not stored, since they may predate the write.
+    """
+
+    def __init__(self, ttl: float = 30.0, max_entries: int = 1024, enabled: bool = True):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        # Bumped by every invalidation
+        self.generation = 0
+
+    @classmethod
+    def from_settings(cls) -> "SearchResultCache":
+        return cls(
+            settings.search_cache_ttl_seconds,
+            settings.search_cache_max_entries,
+            settings.search_cache_enabled
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(index: str, query: Dict[str, Any], size: int, from_: int = 0) -> str:
+        payload = json.dumps(
+            {"index": index, "query": normalize_query(query), "size": size, "from": from_},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Cached results for key (as copies), or None on a miss."""
+        if not self.enabled:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            SEARCH_CACHE_REQUESTS.labels("miss").inc()
+            return None
+
+        self._entries.move_to_end(key)
+        SEARCH_CACHE_REQUESTS.labels("hit").inc()
+        return [dict(result) for result in entry.results]
+
+    def put(
+        self,
+        key: str,
+        results: List[Dict[str, Any]],
+        doc_ids: List[str],
+        tags: Optional[List[str]] = None,
+        user_id: Optional[int] = None,
+        generation: Optional[int] = None
+    ):
+        """Store results; generation is self.generation as read before searching."""
+        if not self.enabled or (generation is not None and generation != self.generation):
+            return
+
+        self._entries[key] = CacheEntry(
+            results=results,
+            expires_at=time.monotonic() + self.ttl,
+            tags=frozenset(tags) if tags else None,
+            user_id=user_id,
+            doc_ids=frozenset(doc_ids)
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, doc_id: str, document: Optional[Dict[str, Any]] = None) -> int:
+        """Drop entries a write to doc_id may have changed; returns how many.
+
+        Without document (a delete) only entries that returned doc_id are
+        affected, since a removed document cannot join other results.
+        """
+        self.generation += 1
+        stale = [
+            key for key, entry in self._entries.items()
+            if doc_id in entry.doc_ids or (document is not None and self._matches(entry, document))
+        ]
+        for key in stale:
+            del self._entries[key]
+
+        if stale:
+            SEARCH_CACHE_INVALIDATIONS.inc(len(stale))
+            self.logger.debug("Search cache invalidated", doc_id=doc_id, entries=len(stale))
+        return len(stale)
+
+    def clear(self):
+        self._entries.clear()
+
+    @staticmethod
+    def _matches(entry: CacheEntry, document: Dict[str, Any]) -> bool:
+        """Whether document could appear in the entry's results."""
+        visible = document.get("is_public") or (
+            entry.user_id is not None and entry.user_id == document.get("user_id")
+        )
+        tagged = entry.tags is None or bool(entry.tags & set(document.get("tags") or []))
+        return bool(visible and tagged)
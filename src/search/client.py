@@ -1,10 +1,41 @@
-from opensearchpy import OpenSearch, RequestsHttpConnection
-from typing import Dict, List, Any, Optional
+from opensearchpy import AsyncHttpConnection, AsyncOpenSearch, OpenSearch, RequestsHttpConnection, helpers
+from opensearchpy.connection.http_async import OpenSearchClientResponse
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
+import aiohttp
+import asyncio
 import json
 import os
+import time
 
 from src.core.config import settings
-from src.core.logging import LoggerMixin
+from src.core.logging import LoggerMixin, get_logger
+from src.search.cache import SearchResultCache
+from src.search.embedded import EmbeddedSearchEngine
+from src.search.indexer import BulkIndexer
+from src.search.pagination import ExpiredCursorError, decode_cursor, encode_cursor
+from src.search.suggest import Suggester, Term, get_suggester, kolam_terms, question_terms
+from src.search.fusion import normalized_score_fusion, reciprocal_rank_fusion
+from src.search.indices import (
+    COMPLEXITY_RANGES,
+    INDEX_SETTINGS,
+    KOLAM_FACET_FIELDS,
+    KOLAM_IMAGES,
+    KOLAM_SOURCE_FIELDS,
+    MAPPINGS,
+    SUGGESTIONS,
+    TRIVIA_QUESTIONS,
+    index_settings,
+    versioned_index_name,
+)
+
+
+logger = get_logger(__name__)
+
+
+def empty_response() -> Dict[str, Any]:
+    """Search response returned when OpenSearch is unavailable."""
+    return {"hits": {"hits": [], "total": {"value": 0}}}
 
 
 class OpenSearchClient(LoggerMixin):
@@ -56,22 +87,7 @@ class OpenSearchClient(LoggerMixin):
             # Create index
             self.client.indices.create(
                 index=index_name,
-                body={
-                    "settings": {
-                        "number_of_shards": 1,
-                        "number_of_replicas": 0,
-                        "analysis": {
-                            "analyzer": {
-                                "custom_analyzer": {
-                                    "type": "custom",
-                                    "tokenizer": "standard",
-                                    "filter": ["lowercase", "stop", "snowball"]
-                                }
-                            }
-                        }
-                    },
-                    "mappings": mapping
-                }
+                body={"settings": index_settings(), "mappings": mapping}
             )
             
             self.logger.info("Index created successfully", index_name=index_name)
@@ -110,7 +126,7 @@ class OpenSearchClient(LoggerMixin):
         """Search documents in an index."""
         try:
             if not self.client:
-                return {"hits": {"hits": [], "total": {"value": 0}}}
+                return empty_response()
             
             response = self.client.search(
                 index=index_name,
@@ -124,7 +140,7 @@ class OpenSearchClient(LoggerMixin):
             
         except Exception as e:
             self.logger.error("Search failed", error=str(e), index_name=index_name)
-            return {"hits": {"hits": [], "total": {"value": 0}}}
+            return empty_response()
     
     def delete_document(self, index_name: str, doc_id: str) -> bool:
         """Delete a document from an index."""
@@ -142,128 +158,438 @@ class OpenSearchClient(LoggerMixin):
             return False
     
     def bulk_index(self, index_name: str, documents: List[Dict[str, Any]]) -> bool:
-        """Bulk index multiple documents."""
+        """Bulk index multiple documents, logging each document that fails."""
+        try:
+            if not self.client:
+                return False
+            
+            actions = (
+                {"_index": index_name, "_id": doc.get("id"), "_source": doc}
+                for doc in documents
+            )
+            failed = 0
+            for ok, item in helpers.streaming_bulk(self.client, actions, raise_on_error=False):
+                if not ok:
+                    failed += 1
+                    details = item.get("index", {})
+                    self.logger.error(
+                        "Bulk item failed",
+                        index_name=index_name,
+                        doc_id=details.get("_id"),
+                        status=details.get("status"),
+                        error=details.get("error")
+                    )
+            
+            self.logger.info("Bulk indexing completed", index_name=index_name, count=len(documents), failed=failed)
+            return failed == 0
+            
+        except Exception as e:
+            self.logger.error("Bulk indexing failed", error=str(e), index_name=index_name)
+            return False
+
+
+class KeepAliveHttpConnection(AsyncHttpConnection):
+    """aiohttp connection whose pooled sockets stay open between requests.
+    
+    The stock connection uses aiohttp's 15 second keep-alive, so bursty
+    search traffic keeps reconnecting; this one makes it configurable.
+    """
+    
+    def __init__(self, *args, keepalive_timeout: float = 60.0, **kwargs):
+        self._keepalive_timeout = keepalive_timeout
+        super().__init__(*args, **kwargs)
+    
+    async def _create_aiohttp_session(self):
+        if self.loop is None:
+            self.loop = asyncio.get_running_loop()
+        self.session = aiohttp.ClientSession(
+            headers=self.headers,
+            skip_auto_headers=("accept", "accept-encoding"),
+            auto_decompress=True,
+            loop=self.loop,
+            cookie_jar=aiohttp.DummyCookieJar(),
+            response_class=OpenSearchClientResponse,
+            connector=aiohttp.TCPConnector(
+                limit=self._limit,
+                keepalive_timeout=self._keepalive_timeout,
+                use_dns_cache=True,
+                ssl=self._ssl_context
+            ),
+        )
+
+
+class AsyncOpenSearchClient(LoggerMixin):
+    """Non-blocking OpenSearch client for use from async routes and services.
+    
+    Mirrors OpenSearchClient, but requests go over a pooled aiohttp
+    transport so they don't block the event loop.
+    """
+    
+    def __init__(self, client: Optional[AsyncOpenSearch] = None):
+        self.client = client
+        if self.client is None:
+            self._initialize_client()
+    
+    def _initialize_client(self):
+        """Create the client; connections are opened lazily on first use."""
+        try:
+            auth = None
+            if settings.opensearch_username and settings.opensearch_password:
+                auth = (settings.opensearch_username, settings.opensearch_password)
+            
+            self.client = AsyncOpenSearch(
+                hosts=[settings.opensearch_url],
+                http_auth=auth,
+                use_ssl=False,  # Set to True in production
+                verify_certs=False,  # Set to True in production
+                connection_class=KeepAliveHttpConnection,
+                pool_maxsize=settings.opensearch_pool_maxsize,
+                keepalive_timeout=settings.opensearch_keepalive_seconds,
+                http_compress=settings.opensearch_http_compress,
+                timeout=settings.opensearch_timeout_seconds,
+                max_retries=settings.opensearch_max_retries,
+                retry_on_timeout=True
+            )
+        except Exception as e:
+            self.logger.error("Failed to initialize async OpenSearch client", error=str(e))
+            self.client = None
+    
+    async def ping(self) -> bool:
+        """Check that the cluster is reachable."""
+        try:
+            return bool(self.client) and await self.client.ping()
+        except Exception as e:
+            self.logger.error("OpenSearch ping failed", error=str(e))
+            return False
+    
+    async def create_index(
+        self,
+        index_name: str,
+        mapping: Dict[str, Any],
+        alias: Optional[str] = None,
+        extra_settings: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Create an index with the specified mapping, optionally behind an alias.
+        
+        Nothing is created if the alias (or index) name already exists.
+        """
         try:
             if not self.client:
                 return False
             
-            # Prepare bulk data
-            bulk_data = []
-            for doc in documents:
-                bulk_data.append({
-                    "index": {
-                        "_index": index_name,
-                        "_id": doc.get("id")
-                    }
-                })
-                bulk_data.append(doc)
-            
-            # Execute bulk operation
-            response = self.client.bulk(body=bulk_data)
-            
-            # Check for errors
-            if response.get("errors"):
-                self.logger.error("Bulk indexing had errors", errors=response["errors"])
+            if await self.client.indices.exists(index=alias or index_name):
+                self.logger.info("Index already exists", index_name=alias or index_name)
+                return True
+            
+            body = {"settings": index_settings(**(extra_settings or {})), "mappings": mapping}
+            if alias:
+                body["aliases"] = {alias: {}}
+            await self.client.indices.create(
+                index=index_name,
+                body=body
+            )
+            
+            self.logger.info("Index created successfully", index_name=index_name)
+            return True
+            
+        except Exception as e:
+            self.logger.error("Failed to create index", error=str(e), index_name=index_name)
+            return False
+    
+    async def index_document(self, index_name: str, document: Dict[str, Any], doc_id: Optional[str] = None) -> bool:
+        """Index a document."""
+        try:
+            if not self.client:
                 return False
             
-            self.logger.info("Bulk indexing completed", index_name=index_name, count=len(documents))
+            await self.client.index(index=index_name, body=document, id=doc_id)
+            
+            self.logger.info("Document indexed successfully", index_name=index_name, doc_id=doc_id)
             return True
             
         except Exception as e:
-            self.logger.error("Bulk indexing failed", error=str(e), index_name=index_name)
+            self.logger.error("Failed to index document", error=str(e), index_name=index_name, doc_id=doc_id)
+            return False
+    
+    async def search_documents(
+        self,
+        index_name: str,
+        query: Dict[str, Any],
+        size: int = 10,
+        from_: int = 0,
+        request_timeout: Optional[float] = None,
+        raise_errors: bool = False
+    ) -> Dict[str, Any]:
+        """Search documents in an index.
+        
+        A query with a "pit" clause searches that point in time, which
+        already names its indices. request_timeout overrides the client
+        timeout for this search. Failures return an empty response unless
+        raise_errors is set.
+        """
+        try:
+            if not self.client:
+                return empty_response()
+            
+            params = {"request_timeout": request_timeout} if request_timeout else {}
+            response = await self.client.search(
+                index=None if "pit" in query else index_name,
+                body=query,
+                size=size,
+                from_=from_,
+                **params
+            )
+            
+            # total is absent when the query turns off track_total_hits
+            total = response["hits"].get("total", {}).get("value")
+            self.logger.debug("Search completed", index_name=index_name, total_hits=total)
+            return response
+            
+        except Exception as e:
+            self.logger.error("Search failed", error=str(e), index_name=index_name)
+            if raise_errors:
+                raise
+            return empty_response()
+    
+    async def multi_search(
+        self,
+        searches: List[Tuple[str, Dict[str, Any]]],
+        size: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Run several searches in one _msearch request.
+        
+        Returns one response per search, in order; a search that fails (or
+        all of them, if the request fails) gets an empty response.
+        """
+        try:
+            if not self.client:
+                return [empty_response() for _ in searches]
+            
+            body = []
+            for index_name, query in searches:
+                body.append({"index": index_name})
+                body.append({**query, "size": size})
+            
+            response = await self.client.msearch(body=body)
+            results = []
+            for index_name, result in zip([index for index, _ in searches], response["responses"]):
+                if "error" in result:
+                    self.logger.error("Search failed", error=str(result["error"]), index_name=index_name)
+                    result = empty_response()
+                results.append(result)
+            return results
+            
+        except Exception as e:
+            self.logger.error("Multi-search failed", error=str(e))
+            return [empty_response() for _ in searches]
+    
+    async def open_point_in_time(self, index_name: str, keep_alive: str) -> Optional[str]:
+        """Open a point in time over an index; returns its id, or None if unavailable."""
+        try:
+            if not self.client:
+                return None
+            
+            response = await self.client.create_pit(index=index_name, params={"keep_alive": keep_alive})
+            return response["pit_id"]
+            
+        except Exception as e:
+            self.logger.warning("Failed to open point in time", error=str(e), index_name=index_name)
+            return None
+    
+    async def close_point_in_time(self, pit_id: str) -> bool:
+        """Release a point in time before its keep-alive runs out."""
+        try:
+            if not self.client:
+                return False
+            
+            await self.client.delete_pit(body={"pit_id": [pit_id]})
+            return True
+            
+        except Exception as e:
+            self.logger.warning("Failed to close point in time", error=str(e))
+            return False
+    
+    async def delete_document(self, index_name: str, doc_id: str) -> bool:
+        """Delete a document from an index."""
+        try:
+            if not self.client:
+                return False
+            
+            await self.client.delete(index=index_name, id=doc_id)
+            
+            self.logger.info("Document deleted successfully", index_name=index_name, doc_id=doc_id)
+            return True
+            
+        except Exception as e:
+            self.logger.error("Failed to delete document", error=str(e), index_name=index_name, doc_id=doc_id)
             return False
+    
+    async def close(self):
+        """Close the pooled connections."""
+        if self.client:
+            await self.client.close()
+
+
+_search_client: Optional[AsyncOpenSearchClient] = None
+
+
+def get_search_client() -> AsyncOpenSearchClient:
+    """Get the application-scoped async OpenSearch client.
+    
+    One client, and so one connection pool, is shared for the lifetime of
+    the app and closed in the lifespan. With search_backend "embedded" the
+    client wraps an in-process SQLite engine instead of a cluster; with
+    "auto" it does so only when the cluster is unreachable at startup.
+    """
+    global _search_client
+    if _search_client is None:
+        backend = settings.search_backend
+        if backend == "auto" and not _cluster_reachable():
+            logger.warning(
+                "OpenSearch unreachable at startup, falling back to the embedded search engine",
+                url=settings.opensearch_url
+            )
+            backend = "embedded"
+        if backend == "embedded":
+            _search_client = AsyncOpenSearchClient(client=EmbeddedSearchEngine(settings.search_embedded_path))
+            logger.info("Using embedded search engine", path=settings.search_embedded_path)
+        else:
+            _search_client = AsyncOpenSearchClient()
+    return _search_client
+
+
+def _cluster_reachable() -> bool:
+    """Probe the cluster once, with a short timeout and no retries."""
+    auth = None
+    if settings.opensearch_username and settings.opensearch_password:
+        auth = (settings.opensearch_username, settings.opensearch_password)
+    client = OpenSearch(
+        hosts=[settings.opensearch_url],
+        http_auth=auth,
+        connection_class=RequestsHttpConnection,
+        timeout=settings.search_probe_timeout_seconds,
+        max_retries=0
+    )
+    try:
+        return client.ping()
+    except Exception:
+        return False
+    finally:
+        client.close()
+
+
+_bulk_indexer: Optional[BulkIndexer] = None
+
+
+def get_bulk_indexer() -> BulkIndexer:
+    """Get the application-scoped bulk indexer over the shared client."""
+    global _bulk_indexer
+    if _bulk_indexer is None:
+        _bulk_indexer = BulkIndexer.from_settings(get_search_client().client)
+    return _bulk_indexer
+
+
+async def close_search_client():
+    """Flush pending index writes, then close the shared client."""
+    global _search_client, _bulk_indexer
+    if _bulk_indexer is not None:
+        await _bulk_indexer.close()
+        _bulk_indexer = None
+    if _search_client is not None:
+        await _search_client.close()
+        logger.info("OpenSearch client pool closed")
+    _search_client = None
 
 
 class SearchService(LoggerMixin):
     """Service for search operations using OpenSearch."""
     
-    def __init__(self):
-        self.client = OpenSearchClient()
-        self._initialize_indices()
-    
-    def _initialize_indices(self):
-        """Initialize required indices."""
-        # Kolam images index
-        kolam_mapping = {
-            "properties": {
-                "title": {"type": "text", "analyzer": "custom_analyzer"},
-                "description": {"type": "text", "analyzer": "custom_analyzer"},
-                "tags": {"type": "keyword"},
-                "detected_patterns": {"type": "keyword"},
-                "symmetry_type": {"type": "keyword"},
-                "complexity_score": {"type": "float"},
-                "user_id": {"type": "integer"},
-                "is_public": {"type": "boolean"},
-                "created_at": {"type": "date"},
-                "image_vector": {"type": "dense_vector", "dims": 512}  # For vector search
-            }
-        }
-        self.client.create_index("kolam_images", kolam_mapping)
-        
-        # Trivia questions index
-        questions_mapping = {
-            "properties": {
-                "question_text": {"type": "text", "analyzer": "custom_analyzer"},
-                "question_type": {"type": "keyword"},
-                "difficulty_level": {"type": "integer"},
-                "category": {"type": "keyword"},
-                "tags": {"type": "keyword"},
-                "correct_answer": {"type": "text"},
-                "explanation": {"type": "text", "analyzer": "custom_analyzer"},
-                "is_active": {"type": "boolean"},
-                "created_at": {"type": "date"}
+    def __init__(
+        self,
+        client: Optional[AsyncOpenSearchClient] = None,
+        indexer: Optional[BulkIndexer] = None,
+        cache: Optional[SearchResultCache] = None,
+        suggester: Optional[Suggester] = None
+    ):
+        self._client = client
+        self._indexer = indexer
+        if indexer is not None:
+            indexer.subscribe(self._invalidate_written)
+        self.cache = cache if cache is not None else SearchResultCache.from_settings()
+        self.suggester = suggester if suggester is not None else get_suggester()
+        self._global_facets: Optional[Tuple[float, Dict[str, List[Dict[str, Any]]]]] = None
+    
+    @property
+    def client(self) -> AsyncOpenSearchClient:
+        """Search client: an injected one, else the application-wide pool."""
+        return self._client or get_search_client()
+    
+    @property
+    def indexer(self) -> BulkIndexer:
+        """Bulk indexer: an injected one, else the application-wide one."""
+        if self._indexer is None:
+            self._indexer = get_bulk_indexer()
+            self._indexer.subscribe(self._invalidate_written)
+        return self._indexer
+    
+    async def initialize(self):
+        """Create the search indices, each behind its alias, if they don't exist yet."""
+        if not await self.client.ping():
+            # Searches degrade to empty results; say so once, loudly, at startup
+            self.logger.error(
+                "OpenSearch is unreachable; searches return no results until it is back "
+                "(set SEARCH_BACKEND=auto or embedded to search without a cluster)",
+                url=settings.opensearch_url
+            )
+            return
+        await asyncio.gather(*[
+            self.client.create_index(
+                versioned_index_name(alias), mapping, alias=alias, extra_settings=INDEX_SETTINGS.get(alias)
+            )
+            for alias, mapping in MAPPINGS.items()
+        ])
+    
+    @staticmethod
+    def _kolam_text_query(query_text: str) -> Dict[str, Any]:
+        """BM25 match on the descriptive Kolam fields."""
+        return {
+            "multi_match": {
+                "query": query_text,
+                "fields": ["title^2", "description", "tags"],
+                "type": "best_fields"
             }
         }
-        self.client.create_index("trivia_questions", questions_mapping)
     
-    def search_similar_kolams(
-        self,
-        query_text: Optional[str] = None,
+    @staticmethod
+    def _kolam_filters(
         tags: Optional[List[str]] = None,
         pattern_types: Optional[List[str]] = None,
         complexity_range: Optional[tuple] = None,
-        user_id: Optional[int] = None,
-        size: int = 10
+        user_id: Optional[int] = None
     ) -> List[Dict[str, Any]]:
-        """Search for similar Kolam images."""
-        query = {"query": {"bool": {"must": []}}}
-        
-        # Text search
-        if query_text:
-            query["query"]["bool"]["must"].append({
-                "multi_match": {
-                    "query": query_text,
-                    "fields": ["title^2", "description", "tags"],
-                    "type": "best_fields"
-                }
-            })
+        """Clauses restricting which Kolam images may match."""
+        clauses = []
         
         # Filter by tags
         if tags:
-            query["query"]["bool"]["must"].append({
-                "terms": {"tags": tags}
-            })
+            clauses.append({"terms": {"tags": tags}})
         
         # Filter by pattern types
         if pattern_types:
-            query["query"]["bool"]["must"].append({
-                "terms": {"detected_patterns": pattern_types}
-            })
+            clauses.append({"terms": {"detected_patterns": pattern_types}})
         
-        # Filter by complexity range
+        # Filter by complexity range (either end may be open)
         if complexity_range:
-            query["query"]["bool"]["must"].append({
+            bounds = {"gte": complexity_range[0], "lte": complexity_range[1]}
+            clauses.append({
                 "range": {
-                    "complexity_score": {
-                        "gte": complexity_range[0],
-                        "lte": complexity_range[1]
-                    }
+                    "complexity_score": {op: value for op, value in bounds.items() if value is not None}
                 }
             })
         
         # Filter by user or public images
         if user_id:
-            query["query"]["bool"]["must"].append({
+            clauses.append({
                 "bool": {
                     "should": [
                         {"term": {"user_id": user_id}},
@@ -272,14 +598,219 @@ class SearchService(LoggerMixin):
                 }
             })
         else:
-            query["query"]["bool"]["must"].append({
-                "term": {"is_public": True}
-            })
+            clauses.append({"term": {"is_public": True}})
         
-        response = self.client.search_documents("kolam_images", query, size=size)
-        return [hit["_source"] for hit in response["hits"]["hits"]]
+        return clauses
     
-    def search_trivia_questions(
+    @classmethod
+    def _kolam_query(cls, query_text: Optional[str], filters: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Bool query scoring only the text match; filters run in filter context."""
+        bool_query: Dict[str, Any] = {"filter": filters}
+        if query_text:
+            bool_query["must"] = [cls._kolam_text_query(query_text)]
+        return {"bool": bool_query}
+    
+    @staticmethod
+    def _kolam_sort(query_text: Optional[str]) -> List[Dict[str, str]]:
+        """Gallery order: relevance for text searches, else newest first; id breaks ties."""
+        order = {"_score": "desc"} if query_text else {"created_at": "desc"}
+        return [order, {"id": "desc"}]
+    
+    @staticmethod
+    def _kolam_knn_query(vector: List[float], k: int, filters: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Approximate nearest-neighbour query, filtered during the graph search."""
+        return {
+            "knn": {
+                "image_vector": {
+                    "vector": vector,
+                    "k": k,
+                    "filter": {"bool": {"filter": filters}}
+                }
+            }
+        }
+    
+    async def search_similar_kolams(
+        self,
+        query_text: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        pattern_types: Optional[List[str]] = None,
+        complexity_range: Optional[tuple] = None,
+        user_id: Optional[int] = None,
+        size: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Search for similar Kolam images.
+        
+        Results are cached briefly under the normalized query, so repeated
+        gallery and filter requests skip the cluster.
+        """
+        filters = self._kolam_filters(tags, pattern_types, complexity_range, user_id)
+        query = {"query": self._kolam_query(query_text, filters), "_source": KOLAM_SOURCE_FIELDS}
+        
+        key = self.cache.make_key(KOLAM_IMAGES, query, size)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        
+        generation = self.cache.generation
+        response = await self.client.search_documents(KOLAM_IMAGES, query, size=size)
+        hits = response["hits"]["hits"]
+        results = [hit["_source"] for hit in hits]
+        # An empty result may mean OpenSearch was unreachable; don't hold on to it
+        if results:
+            self.cache.put(
+                key, results, [hit["_id"] for hit in hits], tags=tags, user_id=user_id, generation=generation
+            )
+        return results
+    
+    @staticmethod
+    def _kolam_facet_aggs() -> Dict[str, Any]:
+        """Aggregations counting results per facet value and complexity band."""
+        aggs: Dict[str, Any] = {
+            field: {"terms": {"field": field, "size": settings.search_facet_size}}
+            for field in KOLAM_FACET_FIELDS
+        }
+        ranges = []
+        for key, low, high in COMPLEXITY_RANGES:
+            bucket: Dict[str, Any] = {"key": key}
+            if low is not None:
+                bucket["from"] = low
+            if high is not None:
+                bucket["to"] = high
+            ranges.append(bucket)
+        aggs["complexity"] = {"range": {"field": "complexity_score", "ranges": ranges}}
+        return aggs
+    
+    @staticmethod
+    def _facet_counts(aggregations: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+        """Facet name -> [{"value", "count"}] from an aggregations response."""
+        return {
+            name: [
+                {"value": str(bucket["key"]), "count": bucket["doc_count"]}
+                for bucket in aggregations.get(name, {}).get("buckets", [])
+            ]
+            for name in [*KOLAM_FACET_FIELDS, "complexity"]
+        }
+    
+    async def facet_kolams(
+        self,
+        query_text: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        pattern_types: Optional[List[str]] = None,
+        complexity_range: Optional[tuple] = None,
+        user_id: Optional[int] = None,
+        size: int = 20
+    ) -> Dict[str, Any]:
+        """Kolam images with facet counts for the same query, in one search.
+        
+        Counts cover everything the query matches, by tag, detected pattern,
+        symmetry type and complexity band. Counts for the unfiltered public
+        gallery are reused for search_facet_cache_ttl_seconds, and those
+        searches then skip the aggregations. Whole responses are cached
+        briefly like search_similar_kolams results. Hits are in page_kolams
+        order, and next_cursor (None on a short page) continues from the
+        last one there.
+        """
+        filters = self._kolam_filters(tags, pattern_types, complexity_range, user_id)
+        query = {
+            "query": self._kolam_query(query_text, filters),
+            "sort": self._kolam_sort(query_text),
+            "_source": KOLAM_SOURCE_FIELDS
+        }
+        
+        unfiltered = not (query_text or tags or pattern_types or complexity_range or user_id)
+        facets = self._cached_global_facets() if unfiltered else None
+        if facets is None:
+            query["aggs"] = self._kolam_facet_aggs()
+        
+        key = self.cache.make_key(KOLAM_IMAGES, query, size)
+        cached = self.cache.get(key)
+        if cached is not None:
+            # The whole response is cached as a single item
+            return cached[0]
+        
+        generation = self.cache.generation
+        response = await self.client.search_documents(KOLAM_IMAGES, query, size=size)
+        if facets is None:
+            facets = self._facet_counts(response.get("aggregations", {}))
+            # A response without aggregations means the search failed
+            if unfiltered and "aggregations" in response and settings.search_facet_cache_ttl_seconds > 0:
+                self._global_facets = (time.monotonic() + settings.search_facet_cache_ttl_seconds, facets)
+        
+        hits = response["hits"]["hits"]
+        next_cursor = None
+        if hits and len(hits) == size and "sort" in hits[-1]:
+            next_cursor = encode_cursor(None, hits[-1]["sort"])
+        
+        page = {"results": [hit["_source"] for hit in hits], "facets": facets, "next_cursor": next_cursor}
+        if hits:
+            self.cache.put(
+                key, [page], [hit["_id"] for hit in hits], tags=tags, user_id=user_id, generation=generation
+            )
+        return page
+    
+    def _cached_global_facets(self) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        if self._global_facets is None or self._global_facets[0] <= time.monotonic():
+            return None
+        return self._global_facets[1]
+    
+    async def page_kolams(
+        self,
+        query_text: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        pattern_types: Optional[List[str]] = None,
+        complexity_range: Optional[tuple] = None,
+        user_id: Optional[int] = None,
+        size: int = 20,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """One page of Kolam images, with a cursor for the next page.
+        
+        Pages follow on with search_after over a point in time, so each page
+        costs the same however deep the scroll and sees the same snapshot.
+        Text searches are ordered by relevance, others newest first; id
+        breaks ties. A cursor without a point in time (from facet_kolams)
+        opens one for the pages after it. next_cursor is None on the last
+        page. Raises
+        InvalidCursorError for a cursor this method did not issue, and
+        ExpiredCursorError when a later page cannot be searched (typically
+        an expired point in time), since an empty page would look like the
+        end of the gallery.
+        """
+        pit_id, search_after = decode_cursor(cursor) if cursor else (None, None)
+        if pit_id is None:
+            pit_id = await self.client.open_point_in_time(KOLAM_IMAGES, settings.search_pit_keep_alive)
+        
+        filters = self._kolam_filters(tags, pattern_types, complexity_range, user_id)
+        query = {
+            "query": self._kolam_query(query_text, filters),
+            "sort": self._kolam_sort(query_text),
+            "track_total_hits": False,
+            "_source": KOLAM_SOURCE_FIELDS
+        }
+        # Without a point in time (e.g. the cluster doesn't support it) pages
+        # still use search_after, just against the live index
+        if pit_id:
+            query["pit"] = {"id": pit_id, "keep_alive": settings.search_pit_keep_alive}
+        if search_after:
+            query["search_after"] = search_after
+        
+        try:
+            response = await self.client.search_documents(
+                KOLAM_IMAGES, query, size=size, raise_errors=bool(cursor)
+            )
+        except Exception as e:
+            raise ExpiredCursorError("Pagination cursor expired; start again without a cursor") from e
+        hits = response["hits"]["hits"]
+        pit_id = response.get("pit_id", pit_id)
+        
+        next_cursor = None
+        if hits and len(hits) == size:
+            next_cursor = encode_cursor(pit_id, hits[-1]["sort"])
+        elif pit_id:
+            await self.client.close_point_in_time(pit_id)
+        return {"results": [hit["_source"] for hit in hits], "next_cursor": next_cursor}
+    
+    async def search_trivia_questions(
         self,
         query_text: Optional[str] = None,
         category: Optional[str] = None,
@@ -288,7 +819,7 @@ class SearchService(LoggerMixin):
         size: int = 10
     ) -> List[Dict[str, Any]]:
         """Search for trivia questions."""
-        query = {"query": {"bool": {"must": []}}}
+        query = {"query": {"bool": {"must": [], "filter": []}}}
         
         # Text search
         if query_text:
@@ -302,31 +833,31 @@ class SearchService(LoggerMixin):
         
         # Filter by category
         if category:
-            query["query"]["bool"]["must"].append({
+            query["query"]["bool"]["filter"].append({
                 "term": {"category": category}
             })
         
         # Filter by difficulty level
         if difficulty_level:
-            query["query"]["bool"]["must"].append({
+            query["query"]["bool"]["filter"].append({
                 "term": {"difficulty_level": difficulty_level}
             })
         
         # Filter by tags
         if tags:
-            query["query"]["bool"]["must"].append({
+            query["query"]["bool"]["filter"].append({
                 "terms": {"tags": tags}
             })
         
         # Only active questions
-        query["query"]["bool"]["must"].append({
+        query["query"]["bool"]["filter"].append({
             "term": {"is_active": True}
         })
         
-        response = self.client.search_documents("trivia_questions", query, size=size)
+        response = await self.client.search_documents("trivia_questions", query, size=size)
         return [hit["_source"] for hit in response["hits"]["hits"]]
     
-    def vector_search_similar_kolams(
+    async def vector_search_similar_kolams(
         self,
         vector: List[float],
         size: int = 10,
@@ -334,47 +865,142 @@ class SearchService(LoggerMixin):
     ) -> List[Dict[str, Any]]:
         """Search for similar Kolam images using vector similarity."""
         query = {
-            "query": {
-                "knn": {
-                    "image_vector": {
-                        "vector": vector,
-                        "k": size
-                    }
-                }
-            }
+            "query": self._kolam_knn_query(vector, size, self._kolam_filters(user_id=user_id)),
+            "_source": KOLAM_SOURCE_FIELDS
         }
         
-        # Filter by user or public images
-        if user_id:
-            query["query"]["knn"]["filter"] = {
-                "bool": {
-                    "should": [
-                        {"term": {"user_id": user_id}},
-                        {"term": {"is_public": True}}
-                    ]
-                }
-            }
+        response = await self.client.search_documents(KOLAM_IMAGES, query, size=size)
+        return [hit["_source"] for hit in response["hits"]["hits"]]
+    
+    async def hybrid_search_kolams(
+        self,
+        query_text: str,
+        vector: List[float],
+        tags: Optional[List[str]] = None,
+        pattern_types: Optional[List[str]] = None,
+        complexity_range: Optional[tuple] = None,
+        user_id: Optional[int] = None,
+        size: int = 10,
+        fusion: str = "rrf",
+        vector_weight: float = 0.5
+    ) -> List[Dict[str, Any]]:
+        """Search Kolam images by text and vector similarity together.
+        
+        The BM25 and k-NN queries go out in one _msearch round trip, each
+        over-fetching candidates, and their rankings are merged with
+        reciprocal rank fusion ("rrf") or min-max normalized score fusion
+        ("score", weighting the vector side by vector_weight).
+        """
+        filters = self._kolam_filters(tags, pattern_types, complexity_range, user_id)
+        candidates = size * settings.search_hybrid_candidate_factor
+        lexical = {
+            "query": self._kolam_query(query_text, filters),
+            "_source": KOLAM_SOURCE_FIELDS
+        }
+        semantic = {"query": self._kolam_knn_query(vector, candidates, filters), "_source": KOLAM_SOURCE_FIELDS}
+        
+        responses = await self.client.multi_search(
+            [(KOLAM_IMAGES, lexical), (KOLAM_IMAGES, semantic)], size=candidates
+        )
+        rankings = [response["hits"]["hits"] for response in responses]
+        
+        if fusion == "score":
+            fused = normalized_score_fusion(rankings, [1 - vector_weight, vector_weight])
         else:
-            query["query"]["knn"]["filter"] = {
-                "term": {"is_public": True}
-            }
+            fused = reciprocal_rank_fusion(rankings, settings.search_rrf_rank_constant)
+        return [hit["_source"] for hit in fused[:size]]
+    
+    async def search_all(
+        self,
+        query_text: str,
+        user_id: Optional[int] = None,
+        size: int = 10
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Search Kolam images and trivia questions concurrently."""
+        kolams, questions = await asyncio.gather(
+            self.search_similar_kolams(query_text=query_text, user_id=user_id, size=size),
+            self.search_trivia_questions(query_text=query_text, size=size)
+        )
+        return {"kolams": kolams, "questions": questions}
+    
+    async def suggest(self, prefix: str, size: int = 10) -> List[Dict[str, str]]:
+        """Typeahead completions for prefix, as {"text", "kind"}.
         
-        response = self.client.search_documents("kolam_images", query, size=size)
-        return [hit["_source"] for hit in response["hits"]["hits"]]
+        Asks the completion suggester with a timeout of a few milliseconds
+        and answers from the in-memory trie when it is unavailable, or right
+        away when the client is the embedded engine (configured, or the
+        "auto" fallback), which keeps suggestions in memory only.
+        """
+        if not prefix.strip():
+            return []
+        
+        if not isinstance(self.client.client, EmbeddedSearchEngine):
+            response = await self.client.search_documents(
+                SUGGESTIONS,
+                self.suggester.completion_query(prefix, size),
+                size=0,
+                request_timeout=settings.search_suggest_timeout_seconds
+            )
+            # Only a failed search lacks the suggest section
+            if "suggest" in response:
+                return [
+                    {"text": option["_source"]["text"], "kind": option["_source"]["kind"]}
+                    for option in response["suggest"]["terms"][0]["options"]
+                ]
+        return self.suggester.complete(prefix, size)
+    
+    def _invalidate_written(self, actions: List[Dict[str, Any]]):
+        """Drop cached results the flushed Kolam image writes may have changed.
+
+        Runs after the flush, once the writes are searchable; invalidating
+        when they are queued would let a search in between cache old results.
+        """
+        for action in actions:
+            if action["_index"] == KOLAM_IMAGES:
+                self.cache.invalidate(str(action["_id"]), action.get("_source"))
+    
+    def queue_suggestions(self, source: str, terms: List[Term]):
+        """Set a document's typeahead terms in the trie and the suggest index.
+
+        An empty terms list withdraws the document's earlier terms.
+        """
+        for doc_id, document in self.suggester.add(source, terms):
+            if document is None:
+                self.indexer.delete(SUGGESTIONS, doc_id)
+            else:
+                self.indexer.add(SUGGESTIONS, document, doc_id)
     
-    def index_kolam_image(self, kolam_data: Dict[str, Any]) -> bool:
-        """Index a Kolam image for search."""
-        return self.client.index_document("kolam_images", kolam_data, str(kolam_data["id"]))
+    async def index_kolam_image(self, kolam_data: Dict[str, Any]) -> bool:
+        """Queue a Kolam image for indexing with the next bulk flush."""
+        doc_id = str(kolam_data["id"])
+        self.indexer.add("kolam_images", kolam_data, doc_id)
+        # Private titles and tags must not show up in anyone's typeahead
+        terms = kolam_terms(kolam_data) if kolam_data.get("is_public") else []
+        self.queue_suggestions(f"{KOLAM_IMAGES}:{doc_id}", terms)
+        return True
     
-    def index_trivia_question(self, question_data: Dict[str, Any]) -> bool:
-        """Index a trivia question for search."""
-        return self.client.index_document("trivia_questions", question_data, str(question_data["id"]))
+    async def index_trivia_question(self, question_data: Dict[str, Any]) -> bool:
+        """Queue a trivia question for indexing with the next bulk flush."""
+        doc_id = str(question_data["id"])
+        self.indexer.add("trivia_questions", question_data, doc_id)
+        terms = question_terms(question_data) if question_data.get("is_active", True) else []
+        self.queue_suggestions(f"{TRIVIA_QUESTIONS}:{doc_id}", terms)
+        return True
     
-    def delete_kolam_image(self, image_id: int) -> bool:
-        """Remove a Kolam image from search index."""
-        return self.client.delete_document("kolam_images", str(image_id))
+    async def delete_kolam_image(self, image_id: int) -> bool:
+        """Queue removal of a Kolam image from the search index."""
+        self.indexer.delete("kolam_images", str(image_id))
+        self.queue_suggestions(f"{KOLAM_IMAGES}:{image_id}", [])
+        return True
     
-    def delete_trivia_question(self, question_id: int) -> bool:
-        """Remove a trivia question from search index."""
-        return self.client.delete_document("trivia_questions", str(question_id))
+    async def delete_trivia_question(self, question_id: int) -> bool:
+        """Queue removal of a trivia question from the search index."""
+        self.indexer.delete("trivia_questions", str(question_id))
+        self.queue_suggestions(f"{TRIVIA_QUESTIONS}:{question_id}", [])
+        return True
+
 
+@lru_cache()
+def get_search_service() -> SearchService:
+    """Get the shared search service (FastAPI dependency)."""
+    return SearchService()
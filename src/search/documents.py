@@ -0,0 +1,35 @@
+from typing import Any, Dict
+
+from src.db.models.models import KolamImage, TriviaQuestion
+
+
+def kolam_image_document(image: KolamImage) -> Dict[str, Any]:
+    """Search document for a Kolam image row."""
+    return {
+        "id": image.id,
+        "title": image.title,
+        "description": image.description,
+        "tags": image.tags or [],
+        "detected_patterns": image.detected_patterns or [],
+        "symmetry_type": image.symmetry_type,
+        "complexity_score": image.complexity_score,
+        "user_id": image.user_id,
+        "is_public": bool(image.is_public),
+        "created_at": image.created_at.isoformat() if image.created_at else None
+    }
+
+
+def trivia_question_document(question: TriviaQuestion) -> Dict[str, Any]:
+    """Search document for a trivia question row."""
+    return {
+        "id": question.id,
+        "question_text": question.question_text,
+        "question_type": question.question_type,
+        "difficulty_level": question.difficulty_level,
+        "category": question.category,
+        "tags": question.tags or [],
+        "correct_answer": question.correct_answer,
+        "explanation": question.explanation,
+        "is_active": bool(question.is_active),
+        "created_at": question.created_at.isoformat() if question.created_at else None
+    }
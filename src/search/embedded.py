@@ -0,0 +1,569 @@
+import asyncio
+import json
+import math
+import re
+import sqlite3
+import threading
+import uuid
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from opensearchpy.serializer import JSONSerializer
+
+from src.core.logging import LoggerMixin
+from src.search.indices import MAPPINGS
+
+PIT_PREFIX = "embedded:"
+WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+TEXT_TYPES = {"text", "keyword"}
+
+
+class UnsupportedQueryError(ValueError):
+    """Raised for query DSL the embedded engine does not implement."""
+
+
+class _Transport:
+    """What the bulk helpers need from a client transport."""
+
+    def __init__(self):
+        self.serializer = JSONSerializer()
+
+
+class EmbeddedIndices:
+    """The indices API subset used by AsyncOpenSearchClient."""
+
+    def __init__(self, engine: "EmbeddedSearchEngine"):
+        self.engine = engine
+
+    async def exists(self, index: str) -> bool:
+        return index in self.engine.mappings
+
+    async def create(self, index: str, body: Dict[str, Any]):
+        # Data lives under the alias name; versioned names are an OpenSearch concern
+        name = next(iter(body.get("aliases", {})), index)
+        await asyncio.to_thread(self.engine.create_index, name, body.get("mappings", {}))
+
+
+class EmbeddedSearchEngine(LoggerMixin):
+    """In-process stand-in for AsyncOpenSearch, backed by SQLite FTS5.
+
+    Implements the calls AsyncOpenSearchClient and BulkIndexer make (search,
+    msearch, bulk, index, delete, point in time, indices.exists/create) for
+    the query DSL SearchService builds: bool, multi_match (BM25 over an FTS5
+    table per index, with field boosts), term, terms, range, match_all and
+    brute-force knn, plus terms/range aggregations, sort, search_after and
+    _source includes. Documents are kept in SQLite for restarts and in
+    memory for filtering; meant for small deployments and tests, where
+    scanning every document of an index per query is cheap. SQLite work
+    runs in worker threads, one transaction per bulk request.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self.indices = EmbeddedIndices(self)
+        self.transport = _Transport()
+        self.mappings: Dict[str, Dict[str, Any]] = {}
+        self._columns: Dict[str, List[str]] = {}
+        self._documents: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._rowids: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS search_indices (name TEXT PRIMARY KEY, mapping TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS search_documents (
+                id INTEGER PRIMARY KEY,
+                index_name TEXT NOT NULL,
+                doc_id TEXT NOT NULL,
+                source TEXT NOT NULL,
+                UNIQUE (index_name, doc_id)
+            );
+        """)
+        self._load()
+
+    def _load(self):
+        for name, mapping in self._db.execute("SELECT name, mapping FROM search_indices"):
+            self._register(name, json.loads(mapping))
+        for rowid, index, doc_id, source in self._db.execute(
+            "SELECT id, index_name, doc_id, source FROM search_documents"
+        ):
+            if index in self.mappings:
+                self._documents[index][doc_id] = json.loads(source)
+                self._rowids[index][doc_id] = rowid
+
+    # Index management
+
+    def create_index(self, name: str, mapping: Dict[str, Any]):
+        with self._lock:
+            if name in self.mappings:
+                return
+            columns = self._register(name, mapping)
+            self._db.execute("INSERT INTO search_indices VALUES (?, ?)", (name, json.dumps(mapping)))
+            column_list = ", ".join(columns) or "_empty"
+            self._db.execute(
+                f'CREATE VIRTUAL TABLE IF NOT EXISTS "{self._fts_table(name)}" '
+                f"USING fts5({column_list}, tokenize='porter unicode61')"
+            )
+            self._db.commit()
+
+    def _register(self, name: str, mapping: Dict[str, Any]) -> List[str]:
+        properties = mapping.get("properties", {})
+        columns = [field for field, spec in properties.items() if spec.get("type") in TEXT_TYPES]
+        self.mappings[name] = mapping
+        self._columns[name] = columns
+        self._documents.setdefault(name, {})
+        self._rowids.setdefault(name, {})
+        return columns
+
+    def _ensure_index(self, name: str):
+        """Create an index on first write, as OpenSearch does."""
+        if name not in self.mappings:
+            self.create_index(name, MAPPINGS.get(name, {}))
+
+    @staticmethod
+    def _fts_table(name: str) -> str:
+        return "fts_" + re.sub(r"\W", "_", name)
+
+    # Writes
+
+    async def index(self, index: str, body: Dict[str, Any], id: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        doc_id = str(id) if id is not None else uuid.uuid4().hex
+        await asyncio.to_thread(self._apply, [("index", index, doc_id, body)])
+        return {"_index": index, "_id": doc_id, "result": "created"}
+
+    async def delete(self, index: str, id: str, **kwargs) -> Dict[str, Any]:
+        found, = await asyncio.to_thread(self._apply, [("delete", index, str(id), None)])
+        if not found:
+            raise KeyError(f"Document {id} not found in {index}")
+        return {"_index": index, "_id": id, "result": "deleted"}
+
+    async def bulk(self, body: Any, *args, **kwargs) -> Dict[str, Any]:
+        return await asyncio.to_thread(self._bulk, body)
+
+    def _bulk(self, body: Any) -> Dict[str, Any]:
+        if isinstance(body, bytes):
+            body = body.decode("utf-8")
+        lines = [json.loads(line) for line in body.strip().split("\n") if line.strip()]
+
+        operations = []
+        position = 0
+        while position < len(lines):
+            op, meta = next(iter(lines[position].items()))
+            position += 1
+            source = None
+            if op != "delete":
+                source = lines[position]
+                position += 1
+            doc_id = meta.get("_id")
+            operations.append((op, meta["_index"], str(doc_id) if doc_id is not None else uuid.uuid4().hex, source))
+
+        found = self._apply(operations)
+        return {
+            "errors": False,
+            "items": [
+                {op: {"_index": index, "_id": doc_id, "status": 200 if ok else 404}}
+                for (op, index, doc_id, _), ok in zip(operations, found)
+            ]
+        }
+
+    def _apply(self, operations: List[Tuple[str, str, str, Optional[Dict[str, Any]]]]) -> List[bool]:
+        """Apply (op, index, doc_id, source) writes in one SQLite transaction.
+
+        Blocking; callers run it in a worker thread. The in-memory documents
+        only change once the commit succeeded. Returns, per operation,
+        whether the document existed (always True for writes).
+        """
+        for index in {index for _, index, _, _ in operations}:
+            self._ensure_index(index)
+
+        with self._lock:
+            # Rowid and source per (index, doc_id) written so far; None once removed
+            rowids: Dict[Tuple[str, str], Optional[int]] = {}
+            sources: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
+            found = []
+            try:
+                for op, index, doc_id, source in operations:
+                    key = (index, doc_id)
+                    rowid = rowids[key] if key in rowids else self._rowids[index].get(doc_id)
+                    if op == "delete":
+                        if rowid is not None:
+                            self._erase(index, rowid)
+                        rowids[key] = sources[key] = None
+                        found.append(rowid is not None)
+                        continue
+                    if op == "update":
+                        current = sources[key] if key in sources else self._documents[index].get(doc_id)
+                        source = {**(current or {}), **source.get("doc", {})}
+                    rowids[key] = self._write(index, doc_id, source, rowid)
+                    sources[key] = source
+                    found.append(True)
+                self._db.commit()
+            except Exception:
+                self._db.rollback()
+                raise
+
+            for (index, doc_id), rowid in rowids.items():
+                if rowid is None:
+                    self._rowids[index].pop(doc_id, None)
+                    self._documents[index].pop(doc_id, None)
+                else:
+                    self._rowids[index][doc_id] = rowid
+                    self._documents[index][doc_id] = sources[(index, doc_id)]
+        return found
+
+    def _write(self, index: str, doc_id: str, source: Dict[str, Any], rowid: Optional[int]) -> int:
+        table = self._fts_table(index)
+        if rowid is None:
+            rowid = self._db.execute(
+                "INSERT INTO search_documents (index_name, doc_id, source) VALUES (?, ?, ?)",
+                (index, doc_id, json.dumps(source, default=str))
+            ).lastrowid
+        else:
+            self._db.execute(
+                "UPDATE search_documents SET source = ? WHERE id = ?", (json.dumps(source, default=str), rowid)
+            )
+            self._db.execute(f'DELETE FROM "{table}" WHERE rowid = ?', (rowid,))
+
+        columns = self._columns[index]
+        if columns:
+            self._db.execute(
+                f'INSERT INTO "{table}" (rowid, {", ".join(columns)}) VALUES (?{", ?" * len(columns)})',
+                (rowid, *[self._text(source.get(column)) for column in columns])
+            )
+        return rowid
+
+    def _erase(self, index: str, rowid: int):
+        self._db.execute("DELETE FROM search_documents WHERE id = ?", (rowid,))
+        self._db.execute(f'DELETE FROM "{self._fts_table(index)}" WHERE rowid = ?', (rowid,))
+
+    @staticmethod
+    def _text(value: Any) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, list):
+            return " ".join(str(item) for item in value)
+        return str(value)
+
+    # Searches
+
+    async def search(
+        self,
+        body: Optional[Dict[str, Any]] = None,
+        index: Optional[str] = None,
+        size: int = 10,
+        from_: int = 0,
+        **kwargs
+    ) -> Dict[str, Any]:
+        body = body or {}
+        if index is None and "pit" in body:
+            index = body["pit"]["id"][len(PIT_PREFIX):]
+        response = await asyncio.to_thread(self._search, index, body, body.get("size", size), from_)
+        if "pit" in body:
+            response["pit_id"] = body["pit"]["id"]
+        return response
+
+    async def msearch(self, body: List[Dict[str, Any]], **kwargs) -> Dict[str, Any]:
+        return await asyncio.to_thread(self._msearch, body)
+
+    def _msearch(self, body: List[Dict[str, Any]]) -> Dict[str, Any]:
+        responses = []
+        for header, query in zip(body[::2], body[1::2]):
+            try:
+                responses.append(self._search(header["index"], query, query.get("size", 10), 0))
+            except Exception as e:
+                responses.append({"error": {"type": type(e).__name__, "reason": str(e)}})
+        return {"responses": responses}
+
+    async def create_pit(self, index: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+        # No snapshot: later pages see the live index
+        return {"pit_id": PIT_PREFIX + index}
+
+    async def delete_pit(self, body: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+        return {"pits": [{"pit_id": pit_id, "successful": True} for pit_id in (body or {}).get("pit_id", [])]}
+
+    async def ping(self, **kwargs) -> bool:
+        return True
+
+    async def close(self):
+        with self._lock:
+            self._db.close()
+
+    def _search(self, index: str, body: Dict[str, Any], size: int, from_: int) -> Dict[str, Any]:
+        query = body.get("query", {"match_all": {}})
+
+        # Snapshot under the lock, so a concurrent bulk cannot change the index mid-query
+        with self._lock:
+            documents = dict(self._documents.get(index, {}))
+            text_scores = {
+                key: self._bm25(index, clause)
+                for key, clause in self._text_clauses(query)
+            }
+        knn_scores = self._knn_scores(query, documents, text_scores)
+
+        matched: List[Tuple[float, str, Dict[str, Any]]] = []
+        for doc_id, source in documents.items():
+            score = self._score(query, doc_id, source, text_scores, knn_scores)
+            if score is not None:
+                matched.append((score, doc_id, source))
+
+        hits = [self._hit(index, doc_id, score, source, body) for score, doc_id, source in matched]
+        sort = body.get("sort")
+        if sort:
+            hits.sort(key=lambda hit: self._sort_key(hit["sort"], sort))
+            if "search_after" in body:
+                after = self._sort_key(body["search_after"], sort)
+                hits = [hit for hit in hits if self._sort_key(hit["sort"], sort) > after]
+        else:
+            hits.sort(key=lambda hit: -hit["_score"])
+
+        response: Dict[str, Any] = {
+            "took": 0,
+            "timed_out": False,
+            "hits": {
+                "hits": hits[from_:from_ + size],
+                "max_score": max((hit["_score"] for hit in hits), default=None)
+            }
+        }
+        if body.get("track_total_hits", True) is not False:
+            response["hits"]["total"] = {"value": len(hits), "relation": "eq"}
+        if "aggs" in body or "aggregations" in body:
+            sources = [source for _, _, source in matched]
+            response["aggregations"] = {
+                name: self._aggregate(agg, sources)
+                for name, agg in (body.get("aggs") or body.get("aggregations")).items()
+            }
+        return response
+
+    def _hit(self, index: str, doc_id: str, score: float, source: Dict[str, Any], body: Dict[str, Any]) -> Dict[str, Any]:
+        includes = body.get("_source")
+        if isinstance(includes, dict):
+            includes = includes.get("includes")
+        if isinstance(includes, list):
+            source = {field: value for field, value in source.items() if field in includes}
+        hit = {"_index": index, "_id": doc_id, "_score": score, "_source": source}
+        if body.get("sort"):
+            hit["sort"] = [
+                score if field == "_score" else (doc_id if field == "_id" else source.get(field))
+                for field, _ in (self._sort_field(spec) for spec in body["sort"])
+            ]
+        return hit
+
+    @staticmethod
+    def _sort_field(spec: Any) -> Tuple[str, str]:
+        if isinstance(spec, str):
+            return spec, "desc" if spec == "_score" else "asc"
+        field, order = next(iter(spec.items()))
+        if isinstance(order, dict):
+            order = order.get("order", "asc")
+        return field, order
+
+    @classmethod
+    def _sort_key(cls, values: List[Any], sort: List[Any]) -> Tuple:
+        """Tuple ordering values by sort; missing values go last either way."""
+        key = []
+        for value, spec in zip(values, sort):
+            _, order = cls._sort_field(spec)
+            if value is None:
+                key.append((1, 0))
+            elif isinstance(value, (int, float)):
+                key.append((0, -value if order == "desc" else value))
+            else:
+                key.append((0, _Descending(value) if order == "desc" else value))
+        return tuple(key)
+
+    # Query evaluation
+
+    @classmethod
+    def _text_clauses(cls, clause: Any) -> Iterable[Tuple[str, Dict[str, Any]]]:
+        """Every multi_match/match clause in a query, keyed for score lookup."""
+        if isinstance(clause, dict):
+            for name, value in clause.items():
+                if name in ("multi_match", "match"):
+                    yield json.dumps(clause, sort_keys=True, default=str), clause
+                else:
+                    yield from cls._text_clauses(value)
+        elif isinstance(clause, list):
+            for item in clause:
+                yield from cls._text_clauses(item)
+
+    def _bm25(self, index: str, clause: Dict[str, Any]) -> Dict[str, float]:
+        """BM25 score per matching document for a multi_match or match clause."""
+        if "multi_match" in clause:
+            text, fields = clause["multi_match"]["query"], clause["multi_match"].get("fields", [])
+        else:
+            field, spec = next(iter(clause["match"].items()))
+            text, fields = (spec["query"] if isinstance(spec, dict) else spec), [field]
+
+        columns = self._columns.get(index, [])
+        boosts = {}
+        for field in fields or columns:
+            name, _, boost = field.partition("^")
+            if name in columns:
+                boosts[name] = float(boost or 1)
+        terms = WORD_PATTERN.findall(str(text).lower())
+        if not boosts or not terms:
+            return {}
+
+        match = "{%s} : (%s)" % (" ".join(boosts), " OR ".join(f'"{term}"' for term in terms))
+        weights = ", ".join(str(boosts.get(column, 0.0)) for column in columns)
+        rows = self._db.execute(
+            f'SELECT d.doc_id, bm25("{self._fts_table(index)}", {weights}) '
+            f'FROM "{self._fts_table(index)}" f JOIN search_documents d ON d.id = f.rowid '
+            f'WHERE "{self._fts_table(index)}" MATCH ?',
+            (match,)
+        )
+        # FTS5 ranks better matches more negative
+        return {doc_id: -score for doc_id, score in rows}
+
+    def _knn_scores(
+        self,
+        query: Dict[str, Any],
+        documents: Dict[str, Dict[str, Any]],
+        text_scores: Dict[str, Dict[str, float]]
+    ) -> Dict[str, float]:
+        """Top-k cosine scores for a top-level knn query, by brute force."""
+        if "knn" not in query:
+            return {}
+        field, spec = next(iter(query["knn"].items()))
+        target = spec["vector"]
+        candidates = []
+        for doc_id, source in documents.items():
+            vector = source.get(field)
+            if not vector:
+                continue
+            if "filter" in spec and self._score(spec["filter"], doc_id, source, text_scores, {}) is None:
+                continue
+            candidates.append(((1 + _cosine(target, vector)) / 2, doc_id))
+        candidates.sort(reverse=True)
+        return {doc_id: score for score, doc_id in candidates[:spec.get("k", 10)]}
+
+    def _score(
+        self,
+        clause: Dict[str, Any],
+        doc_id: str,
+        source: Dict[str, Any],
+        text_scores: Dict[str, Dict[str, float]],
+        knn_scores: Dict[str, float]
+    ) -> Optional[float]:
+        """Score of a document for a clause, or None if it does not match."""
+        kind, spec = next(iter(clause.items()))
+
+        if kind == "bool":
+            total = 0.0
+            for sub in _as_list(spec.get("must")):
+                score = self._score(sub, doc_id, source, text_scores, knn_scores)
+                if score is None:
+                    return None
+                total += score
+            for sub in _as_list(spec.get("filter")):
+                if self._score(sub, doc_id, source, text_scores, knn_scores) is None:
+                    return None
+            for sub in _as_list(spec.get("must_not")):
+                if self._score(sub, doc_id, source, text_scores, knn_scores) is not None:
+                    return None
+            should = [self._score(sub, doc_id, source, text_scores, knn_scores) for sub in _as_list(spec.get("should"))]
+            matched = [score for score in should if score is not None]
+            required = spec.get("minimum_should_match", 0 if spec.get("must") or spec.get("filter") else 1)
+            if should and len(matched) < int(required):
+                return None
+            return total + sum(matched)
+
+        if kind in ("multi_match", "match"):
+            return text_scores.get(json.dumps(clause, sort_keys=True, default=str), {}).get(doc_id)
+        if kind == "match_all":
+            return 1.0
+        if kind == "knn":
+            return knn_scores.get(doc_id)
+        if kind == "term":
+            field, value = next(iter(spec.items()))
+            if isinstance(value, dict):
+                value = value.get("value")
+            return 1.0 if value in _values(source.get(field)) else None
+        if kind == "terms":
+            field, values = next(iter(spec.items()))
+            return 1.0 if set(map(_hashable, values)) & set(map(_hashable, _values(source.get(field)))) else None
+        if kind == "range":
+            field, bounds = next(iter(spec.items()))
+            return 1.0 if _in_range(source.get(field), bounds) else None
+        if kind == "exists":
+            return 1.0 if source.get(spec["field"]) not in (None, []) else None
+        raise UnsupportedQueryError(f"Query clause {kind!r} is not supported by the embedded search engine")
+
+    # Aggregations
+
+    def _aggregate(self, agg: Dict[str, Any], sources: List[Dict[str, Any]]) -> Dict[str, Any]:
+        kind, spec = next(iter(agg.items()))
+        field = spec["field"]
+
+        if kind == "terms":
+            counts = Counter(
+                _hashable(value) for source in sources for value in _values(source.get(field)) if value is not None
+            )
+            ordered = sorted(counts.items(), key=lambda item: (-item[1], str(item[0])))
+            return {"buckets": [{"key": key, "doc_count": count} for key, count in ordered[:spec.get("size", 10)]]}
+
+        if kind == "range":
+            buckets = []
+            for bounds in spec["ranges"]:
+                count = sum(
+                    1 for source in sources
+                    if _in_range(source.get(field), {"gte": bounds.get("from"), "lt": bounds.get("to")})
+                )
+                bucket = {"key": bounds.get("key", f"{bounds.get('from', '*')}-{bounds.get('to', '*')}"), "doc_count": count}
+                bucket.update({name: bounds[name] for name in ("from", "to") if name in bounds})
+                buckets.append(bucket)
+            return {"buckets": buckets}
+
+        raise UnsupportedQueryError(f"Aggregation {kind!r} is not supported by the embedded search engine")
+
+
+class _Descending:
+    """Wrapper inverting comparison, for descending sorts on strings."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return self.value > other.value
+
+    def __gt__(self, other: "_Descending") -> bool:
+        return self.value < other.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and self.value == other.value
+
+
+def _as_list(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _values(value: Any) -> List[Any]:
+    return value if isinstance(value, list) else [value]
+
+
+def _hashable(value: Any) -> Any:
+    return json.dumps(value, sort_keys=True) if isinstance(value, (dict, list)) else value
+
+
+def _in_range(value: Any, bounds: Dict[str, Any]) -> bool:
+    if value is None:
+        return False
+    checks = {
+        "gte": lambda bound: value >= bound,
+        "gt": lambda bound: value > bound,
+        "lte": lambda bound: value <= bound,
+        "lt": lambda bound: value < bound,
+    }
+    try:
+        return all(checks[op](bound) for op, bound in bounds.items() if op in checks and bound is not None)
+    except TypeError:
+        return False
+
+
+def _cosine(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
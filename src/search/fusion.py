@@ -0,0 +1,40 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+Hit = Dict[str, Any]
+
+
+def reciprocal_rank_fusion(rankings: Sequence[List[Hit]], k: int = 60) -> List[Hit]:
+    """Merge ranked hit lists by summing 1 / (k + rank) per document.
+
+    Only ranks are used, so BM25 and vector scores need no calibration.
+    """
+    scores: Dict[str, float] = {}
+    hits: Dict[str, Hit] = {}
+    for ranking in rankings:
+        for rank, hit in enumerate(ranking, start=1):
+            scores[hit["_id"]] = scores.get(hit["_id"], 0.0) + 1.0 / (k + rank)
+            hits.setdefault(hit["_id"], hit)
+    return [hits[doc_id] for doc_id in sorted(scores, key=lambda doc_id: -scores[doc_id])]
+
+
+def normalized_score_fusion(
+    rankings: Sequence[List[Hit]],
+    weights: Optional[Sequence[float]] = None
+) -> List[Hit]:
+    """Merge hit lists by a weighted sum of min-max normalized scores.
+
+    A document missing from a list contributes 0 for it.
+    """
+    weights = weights or [1.0] * len(rankings)
+    scores: Dict[str, float] = {}
+    hits: Dict[str, Hit] = {}
+    for ranking, weight in zip(rankings, weights):
+        if not ranking:
+            continue
+        values = [hit["_score"] or 0.0 for hit in ranking]
+        low, high = min(values), max(values)
+        for hit, value in zip(ranking, values):
+            normalized = (value - low) / (high - low) if high > low else 1.0
+            scores[hit["_id"]] = scores.get(hit["_id"], 0.0) + weight * normalized
+            hits.setdefault(hit["_id"], hit)
+    return [hits[doc_id] for doc_id in sorted(scores, key=lambda doc_id: -scores[doc_id])]
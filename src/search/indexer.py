@@ -0,0 +1,247 @@
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from opensearchpy.helpers import async_streaming_bulk
+
+from src.core.config import settings
+from src.core.logging import LoggerMixin
+from src.core.metrics import (
+    SEARCH_BULK_FLUSH_SECONDS,
+    SEARCH_INDEX_BUFFERED,
+    SEARCH_INDEXED_DOCUMENTS,
+)
+
+# Item statuses worth sending again: throttling, server errors, and
+# transport failures that never got a status
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+@dataclass
+class BulkFailure:
+    """One action the cluster rejected, after any retries."""
+
+    op: str
+    index: str
+    doc_id: Optional[str]
+    status: Any
+    error: Any
+
+
+@dataclass
+class FlushResult:
+    """Outcome of one flush of the buffer."""
+
+    succeeded: int = 0
+    failed: List[BulkFailure] = field(default_factory=list)
+    retries: int = 0
+    # Actions the index accepted
+    written: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class BulkIndexer(LoggerMixin):
+    """Buffer index and delete actions and send them with the bulk API.
+
+    Actions are queued by add()/delete() and sent by a background task when
+    the buffer reaches max_docs actions or max_bytes of payload, or when
+    flush_interval passes, whichever comes first. Only the last action per
+    document is sent, so a retried item can never overwrite a later write
+    to the same document. Items that fail with a retryable status are sent
+    again with exponential backoff; permanent failures are logged and
+    returned per item from flush(). With refresh "wait_for" a flush returns
+    only once its writes are searchable, and then calls the subscribed
+    listeners with the accepted actions.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        max_docs: int = 500,
+        max_bytes: int = 5 * 1024 * 1024,
+        flush_interval: float = 1.0,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        refresh: Optional[str] = "wait_for"
+    ):
+        self.client = client
+        self.max_docs = max_docs
+        self.max_bytes = max_bytes
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.refresh = refresh
+        self._listeners: List[Callable[[List[Dict[str, Any]]], None]] = []
+        self._buffer: List[Dict[str, Any]] = []
+        self._buffered_bytes = 0
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_settings(cls, client: Any) -> "BulkIndexer":
+        return cls(
+            client,
+            settings.search_bulk_max_docs,
+            settings.search_bulk_max_bytes,
+            settings.search_bulk_flush_interval_seconds,
+            settings.search_bulk_max_retries,
+            settings.search_bulk_retry_backoff_seconds
+        )
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    def add(self, index: str, document: Dict[str, Any], doc_id: Optional[str] = None):
+        """Queue a document to be indexed (replacing any with the same id)."""
+        self._queue({"_op_type": "index", "_index": index, "_id": doc_id, "_source": document})
+
+    def delete(self, index: str, doc_id: str):
+        """Queue a document to be removed."""
+        self._queue({"_op_type": "delete", "_index": index, "_id": doc_id})
+
+    def subscribe(self, listener: Callable[[List[Dict[str, Any]]], None]):
+        """Call listener with the actions each flush got accepted."""
+        self._listeners.append(listener)
+
+    def _queue(self, action: Dict[str, Any]):
+        self._buffer.append(action)
+        self._buffered_bytes += len(json.dumps(action.get("_source", {}), default=str))
+        SEARCH_INDEX_BUFFERED.set(len(self._buffer))
+        if len(self._buffer) >= self.max_docs or self._buffered_bytes >= self.max_bytes:
+            self._wakeup.set()
+
+    def start(self):
+        """Start the background flush loop (from the application lifespan)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        """Stop the flush loop and send whatever is still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                self.logger.error("Bulk flush failed", error=str(e))
+
+    async def flush(self) -> FlushResult:
+        """Send every buffered action now."""
+        async with self._flush_lock:
+            actions, self._buffer, self._buffered_bytes = self._buffer, [], 0
+            SEARCH_INDEX_BUFFERED.set(0)
+            result = FlushResult()
+            if not actions:
+                return result
+            actions = self._collapse(actions)
+
+            started = time.monotonic()
+            for attempt in range(self.max_retries + 1):
+                retry = await self._send(actions, result, final=attempt == self.max_retries)
+                if not retry:
+                    break
+                result.retries += len(retry)
+                actions = retry
+                await asyncio.sleep(self.retry_backoff * 2 ** attempt)
+            SEARCH_BULK_FLUSH_SECONDS.observe(time.monotonic() - started)
+
+            SEARCH_INDEXED_DOCUMENTS.labels("ok").inc(result.succeeded)
+            if result.failed:
+                SEARCH_INDEXED_DOCUMENTS.labels("failed").inc(len(result.failed))
+                for failure in result.failed:
+                    self.logger.error(
+                        "Bulk item failed",
+                        op=failure.op,
+                        index=failure.index,
+                        doc_id=failure.doc_id,
+                        status=failure.status,
+                        error=failure.error
+                    )
+            self.logger.info(
+                "Bulk flush completed",
+                succeeded=result.succeeded,
+                failed=len(result.failed),
+                retries=result.retries
+            )
+            for listener in self._listeners:
+                try:
+                    listener(result.written)
+                except Exception as e:
+                    self.logger.error("Bulk flush listener failed", error=str(e))
+            return result
+
+    async def _send(
+        self,
+        actions: List[Dict[str, Any]],
+        result: FlushResult,
+        final: bool
+    ) -> List[Dict[str, Any]]:
+        """Send actions once; return the ones to retry."""
+        retry = []
+        options = {"refresh": self.refresh} if self.refresh else {}
+        responses = async_streaming_bulk(
+            self.client,
+            actions,
+            chunk_size=self.max_docs,
+            max_chunk_bytes=self.max_bytes,
+            raise_on_error=False,
+            raise_on_exception=False,
+            **options
+        )
+        # With retries left to the caller, results come back in action order
+        position = 0
+        async for ok, item in responses:
+            action = actions[position]
+            position += 1
+            status, error = self._outcome(item)
+            if ok or (action["_op_type"] == "delete" and status == 404):
+                result.succeeded += 1
+                result.written.append(action)
+            elif not final and self._retryable(status):
+                retry.append(action)
+            else:
+                result.failed.append(BulkFailure(
+                    action["_op_type"], action["_index"], action.get("_id"), status, error
+                ))
+        return retry
+
+    @staticmethod
+    def _collapse(actions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Keep only the last action per (index, id), in queue order.
+
+        Actions without an id (auto-generated ids) are all kept.
+        """
+        last = {
+            (action["_index"], action["_id"]): position
+            for position, action in enumerate(actions)
+            if action.get("_id") is not None
+        }
+        return [
+            action for position, action in enumerate(actions)
+            if action.get("_id") is None or last[(action["_index"], action["_id"])] == position
+        ]
+
+    @staticmethod
+    def _outcome(item: Dict[str, Any]) -> Tuple[Any, Any]:
+        details = next(iter(item.values()), {})
+        return details.get("status"), details.get("error") or details.get("exception")
+
+    @staticmethod
+    def _retryable(status: Any) -> bool:
+        return not isinstance(status, int) or status in RETRYABLE_STATUSES
@@ -0,0 +1,118 @@
+import time
+from typing import Any, Dict
+
+from src.core.config import settings
+
+KOLAM_IMAGES = "kolam_images"
+TRIVIA_QUESTIONS = "trivia_questions"
+SUGGESTIONS = "search_suggestions"
+
+ANALYSIS = {
+    "analyzer": {
+        "custom_analyzer": {
+            "type": "custom",
+            "tokenizer": "standard",
+            "filter": ["lowercase", "stop", "snowball"]
+        }
+    }
+}
+
+MAPPINGS: Dict[str, Dict[str, Any]] = {
+    KOLAM_IMAGES: {
+        "properties": {
+            # Tiebreaker for search_after pagination
+            "id": {"type": "integer"},
+            "title": {"type": "text", "analyzer": "custom_analyzer"},
+            "description": {"type": "text", "analyzer": "custom_analyzer"},
+            "tags": {"type": "keyword"},
+            "detected_patterns": {"type": "keyword"},
+            "symmetry_type": {"type": "keyword"},
+            "complexity_score": {"type": "float"},
+            "user_id": {"type": "integer"},
+            "is_public": {"type": "boolean"},
+            "created_at": {"type": "date"},
+            # HNSW graph for approximate nearest-neighbour search
+            "image_vector": {
+                "type": "knn_vector",
+                "dimension": settings.kolam_vector_dimension,
+                "method": {
+                    "name": "hnsw",
+                    "engine": settings.opensearch_knn_engine,
+                    "space_type": settings.opensearch_knn_space_type,
+                    "parameters": {
+                        "ef_construction": settings.opensearch_knn_ef_construction,
+                        "m": settings.opensearch_knn_m
+                    }
+                }
+            }
+        }
+    },
+    TRIVIA_QUESTIONS: {
+        "properties": {
+            "question_text": {"type": "text", "analyzer": "custom_analyzer"},
+            "question_type": {"type": "keyword"},
+            "difficulty_level": {"type": "integer"},
+            "category": {"type": "keyword"},
+            "tags": {"type": "keyword"},
+            "correct_answer": {"type": "text"},
+            "explanation": {"type": "text", "analyzer": "custom_analyzer"},
+            "is_active": {"type": "boolean"},
+            "created_at": {"type": "date"}
+        }
+    },
+    # Typeahead terms (titles, tags, patterns, styles, categories)
+    SUGGESTIONS: {
+        "properties": {
+            "text": {"type": "keyword"},
+            "kind": {"type": "keyword"},
+            "suggest": {"type": "completion", "analyzer": "simple"}
+        }
+    },
+}
+
+
+# Fields returned in search results; image_vector is only needed by OpenSearch
+KOLAM_SOURCE_FIELDS = [
+    "id", "title", "description", "tags", "detected_patterns", "symmetry_type",
+    "complexity_score", "user_id", "is_public", "created_at"
+]
+
+
+# Keyword fields counted next to gallery results
+KOLAM_FACET_FIELDS = ["tags", "detected_patterns", "symmetry_type"]
+
+# complexity_score bands (the score is a 0-1 estimate) as (key, from, to)
+COMPLEXITY_RANGES = [("low", None, 0.33), ("medium", 0.33, 0.66), ("high", 0.66, None)]
+
+
+# Settings specific to one index, on top of index_settings()
+INDEX_SETTINGS: Dict[str, Dict[str, Any]] = {
+    KOLAM_IMAGES: {"knn": True},
+}
+
+
+def index_settings(**overrides: Any) -> Dict[str, Any]:
+    """Settings for a new index, with per-phase overrides (e.g. refresh_interval)."""
+    return {
+        "number_of_shards": 1,
+        "number_of_replicas": settings.opensearch_number_of_replicas,
+        "analysis": ANALYSIS,
+        **overrides
+    }
+
+
+def index_body(alias: str, **overrides: Any) -> Dict[str, Any]:
+    """Create-index body for one of the search indices."""
+    return {
+        "settings": index_settings(**{**INDEX_SETTINGS.get(alias, {}), **overrides}),
+        "mappings": MAPPINGS[alias]
+    }
+
+
+def versioned_index_name(alias: str) -> str:
+    """Concrete index name behind an alias, e.g. kolam_images_1760860800000.
+
+    Applications only ever read and write through the alias, so a rebuilt
+    index can be swapped in without downtime.
+    """
+    return f"{alias}_{int(time.time() * 1000)}"
@@ -0,0 +1,12 @@
+from sqlalchemy.orm import Session
+
+from src.db.models.models import SearchOutbox
+
+
+def record_search_change(db: Session, index_name: str, doc_id: int):
+    """Queue a search index refresh for a row, in the caller's transaction.
+
+    Call before the commit that writes the row, so the change and its
+    outbox entry are stored (or rolled back) together.
+    """
+    db.add(SearchOutbox(index_name=index_name, doc_id=str(doc_id)))
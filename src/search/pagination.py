@@ -0,0 +1,30 @@
+import base64
+import binascii
+import json
+from typing import Any, List, Optional, Tuple
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+class ExpiredCursorError(InvalidCursorError):
+    """Raised when the search behind a cursor (e.g. its point in time) is gone."""
+
+
+def encode_cursor(pit_id: Optional[str], search_after: List[Any]) -> str:
+    """Opaque cursor for the page after the hit with sort values search_after."""
+    payload = json.dumps({"pit": pit_id, "after": search_after}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[str], List[Any]]:
+    """Point-in-time id and search_after values from a cursor."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        pit_id, search_after = payload["pit"], payload["after"]
+    except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+    if not isinstance(search_after, list) or not (pit_id is None or isinstance(pit_id, str)):
+        raise InvalidCursorError("Invalid pagination cursor")
+    return pit_id, search_after
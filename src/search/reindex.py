@@ -0,0 +1,211 @@
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from opensearchpy import OpenSearch, helpers
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Query, Session
+
+from src.core.config import settings
+from src.core.logging import LoggerMixin
+from src.db.models.models import KolamImage, TriviaQuestion
+from src.search.documents import kolam_image_document, trivia_question_document
+from src.search.indices import KOLAM_IMAGES, TRIVIA_QUESTIONS, index_body, versioned_index_name
+
+# Where each search index's documents come from
+SOURCES: Dict[str, Tuple[Any, Callable[[Any], Dict[str, Any]]]] = {
+    KOLAM_IMAGES: (KolamImage, kolam_image_document),
+    TRIVIA_QUESTIONS: (TriviaQuestion, trivia_question_document),
+}
+
+
+class ReindexError(Exception):
+    """Raised when a rebuilt index is incomplete and was not swapped in."""
+
+
+class Reindexer(LoggerMixin):
+    """Rebuild a search index from the database and swap it in atomically.
+
+    Rows are streamed with yield_per (a server-side cursor on PostgreSQL)
+    into a new versioned index, sent as parallel bulk requests. During the
+    load the index has no replicas and refreshing is off; both are restored
+    before the alias is moved from the old index to the new one in a single
+    update_aliases call. Rows created or updated while the load ran are
+    indexed again after the swap, documents whose rows were deleted while it
+    ran are removed, and the newest previous indices are kept for rollback.
+    """
+
+    def __init__(
+        self,
+        client: OpenSearch,
+        db: Session,
+        batch_size: int = 500,
+        thread_count: int = 4,
+        keep_previous: int = 1
+    ):
+        self.client = client
+        self.db = db
+        self.batch_size = batch_size
+        self.thread_count = thread_count
+        self.keep_previous = keep_previous
+
+    def reindex(self, alias: str) -> Dict[str, Any]:
+        """Rebuild the index behind alias; returns counts and index names."""
+        model, to_document = SOURCES[alias]
+        new_index = versioned_index_name(alias)
+        started = self.db.execute(select(func.now())).scalar()
+
+        self.client.indices.create(
+            index=new_index,
+            body=index_body(alias, number_of_replicas=0, refresh_interval="-1")
+        )
+        self.logger.info("Reindex started", alias=alias, index=new_index)
+
+        try:
+            indexed, failed = self._load(new_index, self.db.query(model).order_by(model.id), to_document)
+            if failed:
+                raise ReindexError(f"{failed} documents failed to index into {new_index}")
+
+            self.client.indices.put_settings(
+                index=new_index,
+                body={"index": {
+                    "number_of_replicas": settings.opensearch_number_of_replicas,
+                    "refresh_interval": settings.opensearch_refresh_interval
+                }}
+            )
+            self.client.indices.refresh(index=new_index)
+        except Exception:
+            self.client.indices.delete(index=new_index, ignore=[404])
+            raise
+
+        previous = self._swap_alias(alias, new_index)
+        caught_up, _ = self._load(new_index, self._changed_since(model, started), to_document)
+        removed = self._remove_deleted(new_index, model)
+        dropped = self._drop_old_indices(alias, new_index)
+
+        stats = {
+            "alias": alias,
+            "index": new_index,
+            "indexed": indexed,
+            "caught_up": caught_up,
+            "removed": removed,
+            "previous": previous,
+            "dropped": dropped
+        }
+        self.logger.info("Reindex completed", **stats)
+        return stats
+
+    def _changed_since(self, model: Any, started: Optional[datetime]) -> Query:
+        """Rows written after the load began (they may have gone to the old index)."""
+        return self.db.query(model).filter(
+            or_(model.created_at >= started, model.updated_at >= started)
+        ).order_by(model.id)
+
+    def _remove_deleted(self, index: str, model: Any) -> int:
+        """Delete documents whose rows no longer exist; returns how many.
+
+        A row deleted during the load may already have been copied into the
+        new index, while its delete went to the old one. Index ids are read
+        before the table, so a missing row was really deleted.
+        """
+        removed = 0
+        chunk: List[str] = []
+
+        def prune():
+            nonlocal removed
+            existing = {
+                str(row_id) for row_id in self.db.scalars(
+                    select(model.id).where(model.id.in_([int(doc_id) for doc_id in chunk]))
+                )
+            }
+            deletes = [
+                {"_op_type": "delete", "_index": index, "_id": doc_id}
+                for doc_id in chunk if doc_id not in existing
+            ]
+            if deletes:
+                helpers.bulk(self.client, deletes, raise_on_error=False)
+                removed += len(deletes)
+
+        for hit in helpers.scan(
+            self.client,
+            index=index,
+            query={"_source": False, "query": {"match_all": {}}},
+            size=self.batch_size
+        ):
+            chunk.append(hit["_id"])
+            if len(chunk) >= self.batch_size:
+                prune()
+                chunk = []
+        if chunk:
+            prune()
+
+        if removed:
+            self.logger.info("Reindex removed deleted rows", index=index, removed=removed)
+        return removed
+
+    def _load(self, index: str, query: Query, to_document: Callable[[Any], Dict[str, Any]]) -> Tuple[int, int]:
+        """Stream query rows into index; returns (indexed, failed).
+
+        Rows are read on this thread and sent a few chunks at a time, so the
+        database session is never shared with the bulk worker threads.
+        """
+        indexed = failed = 0
+        batch: List[Dict[str, Any]] = []
+
+        def send():
+            nonlocal indexed, failed
+            for ok, item in helpers.parallel_bulk(
+                self.client,
+                batch,
+                thread_count=self.thread_count,
+                chunk_size=self.batch_size,
+                raise_on_error=False,
+                raise_on_exception=False
+            ):
+                if ok:
+                    indexed += 1
+                    continue
+                failed += 1
+                details = item.get("index", {})
+                self.logger.error(
+                    "Reindex item failed",
+                    index=index,
+                    doc_id=details.get("_id"),
+                    status=details.get("status"),
+                    error=details.get("error")
+                )
+
+        for row in query.yield_per(self.batch_size):
+            batch.append({"_index": index, "_id": str(row.id), "_source": to_document(row)})
+            if len(batch) >= self.batch_size * self.thread_count:
+                send()
+                batch = []
+        if batch:
+            send()
+        return indexed, failed
+
+    def _swap_alias(self, alias: str, new_index: str) -> List[str]:
+        """Point alias at new_index alone, in one atomic update."""
+        actions = [{"add": {"index": new_index, "alias": alias}}]
+        if self.client.indices.exists_alias(name=alias):
+            previous = sorted(self.client.indices.get_alias(name=alias))
+            actions = [{"remove": {"index": index, "alias": alias}} for index in previous] + actions
+        elif self.client.indices.exists(index=alias):
+            # An index created before aliases were used; replace it in the same step
+            previous = [alias]
+            actions.append({"remove_index": {"index": alias}})
+        else:
+            previous = []
+
+        self.client.indices.update_aliases(body={"actions": actions})
+        return previous
+
+    def _drop_old_indices(self, alias: str, current: str) -> List[str]:
+        """Delete versioned indices beyond the newest keep_previous ones."""
+        older = sorted(
+            (index for index in self.client.indices.get(index=f"{alias}_*") if index != current),
+            reverse=True
+        )
+        dropped = older[self.keep_previous:]
+        for index in dropped:
+            self.client.indices.delete(index=index)
+        return dropped
@@ -0,0 +1,211 @@
+import asyncio
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.database import SessionLocal
+from src.core.logging import LoggerMixin
+from src.core.metrics import SEARCH_OUTBOX_RELAYED
+from src.db.models.models import SearchOutbox
+from src.search.client import SearchService, get_search_client, get_search_service
+from src.search.indexer import RETRYABLE_STATUSES, BulkFailure, BulkIndexer
+from src.search.indices import KOLAM_IMAGES, TRIVIA_QUESTIONS
+from src.search.reindex import SOURCES
+
+# (index name, document id)
+DocKey = Tuple[str, str]
+
+
+class OutboxRelay(LoggerMixin):
+    """Move search_outbox entries into the search index.
+
+    Each pass reads the oldest batch_size entries, looks up the current
+    state of their rows, and sends one bulk request through a private
+    BulkIndexer: an index action for rows that exist, a delete for rows that
+    are gone. Entries are removed only after the index accepted their
+    document, so delivery is at least once; a crash or failed item means the
+    document is sent again, which is harmless since each action carries the
+    whole document. Entries whose document the index rejected outright
+    (e.g. one the mapping refuses) and that still fail after max_attempts
+    passes are dead-lettered: marked with failed_at, logged, and no longer
+    read, so they cannot block the entries behind them. Clearing failed_at
+    queues them again. Transient failures (throttling, server errors, an
+    unreachable cluster) never count as attempts; the relay backs off
+    instead, doubling its wait after each pass that delivered nothing, up
+    to max_backoff seconds.
+    """
+
+    def __init__(
+        self,
+        search: SearchService,
+        session_factory: Callable[[], Session] = SessionLocal,
+        batch_size: int = 500,
+        poll_interval: float = 1.0,
+        max_attempts: int = 5,
+        max_backoff: float = 60.0
+    ):
+        self.search = search
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.max_backoff = max_backoff
+        # Consecutive passes that failed transiently without delivering anything
+        self.failed_passes = 0
+
+    @classmethod
+    def from_settings(cls) -> "OutboxRelay":
+        # Own indexer, so a flush result covers exactly this relay's actions;
+        # the result cache is shared with request handlers
+        search = SearchService(
+            indexer=BulkIndexer.from_settings(get_search_client().client),
+            cache=get_search_service().cache
+        )
+        return cls(search, batch_size=settings.search_outbox_batch_size,
+                   poll_interval=settings.search_outbox_poll_interval_seconds,
+                   max_attempts=settings.search_outbox_max_attempts,
+                   max_backoff=settings.search_outbox_max_backoff_seconds)
+
+    async def run(self):
+        """Relay continuously (from the application lifespan)."""
+        while True:
+            try:
+                relayed = await self.relay_once()
+            except Exception as e:
+                self.logger.error("Search outbox relay failed", error=str(e))
+                self.failed_passes += 1
+                relayed = 0
+            # A fully delivered batch means there is probably more waiting;
+            # after failures, wait before trying them again
+            if relayed < self.batch_size:
+                await asyncio.sleep(self.delay())
+
+    def delay(self) -> float:
+        """Seconds to wait before the next pass."""
+        return min(self.poll_interval * 2 ** self.failed_passes, self.max_backoff)
+
+    async def relay_once(self) -> int:
+        """Relay one batch of outbox entries; returns how many were delivered."""
+        entries, documents = await asyncio.to_thread(self._read_batch)
+        if not entries:
+            return 0
+
+        writers = {
+            KOLAM_IMAGES: (self.search.index_kolam_image, self.search.delete_kolam_image),
+            TRIVIA_QUESTIONS: (self.search.index_trivia_question, self.search.delete_trivia_question),
+        }
+        for (index, doc_id), document in documents.items():
+            index_document, delete_document = writers[index]
+            if document is None:
+                await delete_document(int(doc_id))
+            else:
+                await index_document(document)
+
+        result = await self.search.indexer.flush()
+        failures = {(failure.index, failure.doc_id): failure for failure in result.failed}
+
+        delivered = [entry_id for key, ids in entries.items() if key not in failures for entry_id in ids]
+        retry = [
+            entry_id for key, ids in entries.items()
+            if key in failures and self._permanent(failures[key]) for entry_id in ids
+        ]
+        deferred = sum(len(ids) for key, ids in entries.items() if key in failures) - len(retry)
+        dead = await asyncio.to_thread(self._acknowledge, delivered, retry)
+        self.failed_passes = self.failed_passes + 1 if deferred and not delivered else 0
+
+        for key, ids in entries.items():
+            if dead.intersection(ids):
+                failure = failures[key]
+                self.logger.error(
+                    "Search outbox entry dead-lettered",
+                    index=key[0],
+                    doc_id=key[1],
+                    entries=sorted(dead.intersection(ids)),
+                    status=failure.status,
+                    error=failure.error
+                )
+
+        SEARCH_OUTBOX_RELAYED.labels("ok").inc(len(delivered))
+        if retry:
+            SEARCH_OUTBOX_RELAYED.labels("failed").inc(len(retry) - len(dead))
+        if dead:
+            SEARCH_OUTBOX_RELAYED.labels("dead_letter").inc(len(dead))
+        if deferred:
+            SEARCH_OUTBOX_RELAYED.labels("deferred").inc(deferred)
+        self.logger.info(
+            "Search outbox relayed",
+            documents=len(documents),
+            delivered=len(delivered),
+            retry=len(retry) - len(dead),
+            dead_lettered=len(dead),
+            deferred=deferred
+        )
+        return len(delivered)
+
+    @staticmethod
+    def _permanent(failure: BulkFailure) -> bool:
+        """Whether the index rejected the document itself, so sending it again cannot help.
+
+        Transport errors carry no status; 429 and 5xx are throttling or
+        server trouble, and a 404 is an index still being created.
+        """
+        status = failure.status
+        return isinstance(status, int) and status not in RETRYABLE_STATUSES and status != 404
+
+    def _read_batch(self) -> Tuple[Dict[DocKey, List[int]], Dict[DocKey, Optional[Dict[str, Any]]]]:
+        """Oldest entries grouped by document, and each document's current state."""
+        db = self.session_factory()
+        try:
+            rows = (
+                db.query(SearchOutbox)
+                .filter(SearchOutbox.failed_at.is_(None))
+                .order_by(SearchOutbox.id)
+                .limit(self.batch_size)
+                .all()
+            )
+            entries: Dict[DocKey, List[int]] = defaultdict(list)
+            for row in rows:
+                entries[(row.index_name, row.doc_id)].append(row.id)
+
+            ids_by_index: Dict[str, Set[int]] = defaultdict(set)
+            for index, doc_id in entries:
+                ids_by_index[index].add(int(doc_id))
+
+            documents: Dict[DocKey, Optional[Dict[str, Any]]] = {key: None for key in entries}
+            for index, ids in ids_by_index.items():
+                model, to_document = SOURCES[index]
+                for record in db.query(model).filter(model.id.in_(ids)):
+                    documents[(index, str(record.id))] = to_document(record)
+            return dict(entries), documents
+        finally:
+            db.close()
+
+    def _acknowledge(self, delivered: List[int], retry: List[int]) -> Set[int]:
+        """Remove delivered entries and count a failed attempt on those in retry.
+
+        Returns the ids of entries dead-lettered by this attempt.
+        """
+        db = self.session_factory()
+        try:
+            dead: Set[int] = set()
+            if delivered:
+                db.query(SearchOutbox).filter(SearchOutbox.id.in_(delivered)).delete(synchronize_session=False)
+            if retry:
+                db.query(SearchOutbox).filter(SearchOutbox.id.in_(retry)).update(
+                    {SearchOutbox.attempts: SearchOutbox.attempts + 1}, synchronize_session=False
+                )
+                exhausted = db.query(SearchOutbox.id).filter(
+                    SearchOutbox.id.in_(retry), SearchOutbox.attempts >= self.max_attempts
+                )
+                dead = {entry_id for entry_id, in exhausted}
+                if dead:
+                    db.query(SearchOutbox).filter(SearchOutbox.id.in_(dead)).update(
+                        {SearchOutbox.failed_at: func.now()}, synchronize_session=False
+                    )
+            db.commit()
+            return dead
+        finally:
+            db.close()
@@ -0,0 +1,254 @@
+import asyncio
+import hashlib
+import heapq
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.database import SessionLocal
+from src.core.logging import LoggerMixin
+from src.db.models.models import KolamImage, TriviaQuestion
+from src.search.documents import kolam_image_document, trivia_question_document
+from src.search.indices import KOLAM_IMAGES, TRIVIA_QUESTIONS
+
+# (kind, text) of one suggestion, e.g. ("tag", "Festival")
+Term = Tuple[str, str]
+
+
+def normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def kolam_terms(document: Dict[str, Any]) -> List[Term]:
+    """Suggestions from a Kolam image document: title, tags and patterns."""
+    terms = [("title", document["title"])] if document.get("title") else []
+    terms += [("tag", tag) for tag in document.get("tags") or []]
+    terms += [("pattern", pattern) for pattern in document.get("detected_patterns") or []]
+    return terms
+
+
+def question_terms(document: Dict[str, Any]) -> List[Term]:
+    """Suggestions from a trivia question document: category and tags."""
+    terms = [("category", document["category"])] if document.get("category") else []
+    return terms + [("tag", tag) for tag in document.get("tags") or []]
+
+
+class _Node:
+    __slots__ = ("children", "terms", "best")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        # Every term reachable through this node, to re-rank after a removal
+        self.terms: Set[Term] = set()
+        self.best: List[Term] = []
+
+
+class PrefixTrie:
+    """Character trie answering top-k completions in O(len(prefix)).
+
+    Every node keeps its capacity highest-weighted terms, updated on insert,
+    so a lookup never walks the subtree. Terms are reachable from the start
+    of each of their words ("kol" finds "Lotus kolam"), up to max_depth
+    characters deep. Lowering a weight or removing a term re-ranks only the
+    nodes on that term's paths.
+    """
+
+    def __init__(self, capacity: int = 10, max_depth: int = 32):
+        self.capacity = capacity
+        self.max_depth = max_depth
+        self.weights: Dict[Term, float] = {}
+        self._root = _Node()
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+    def insert(self, term: Term, weight: float):
+        lighter = weight < self.weights.get(term, weight)
+        self.weights[term] = weight
+        for key in self._keys(term):
+            node = self._root
+            for char in key:
+                node = node.children.setdefault(char, _Node())
+                node.terms.add(term)
+                if lighter:
+                    self._rank(node)
+                else:
+                    self._offer(node, term)
+
+    def remove(self, term: Term):
+        if self.weights.pop(term, None) is None:
+            return
+        for key in self._keys(term):
+            node = self._root
+            for char in key:
+                child = node.children.get(char)
+                if child is None:
+                    break
+                child.terms.discard(term)
+                if not child.terms:
+                    # Nothing else below: drop the whole branch
+                    del node.children[char]
+                    break
+                if term in child.best:
+                    self._rank(child)
+                node = child
+
+    def _keys(self, term: Term) -> List[str]:
+        key = normalize(term[1])
+        starts = [0] + [i + 1 for i, char in enumerate(key) if char == " "]
+        return [key[start:start + self.max_depth] for start in starts]
+
+    def _offer(self, node: _Node, term: Term):
+        best = node.best
+        if term not in best:
+            if len(best) >= self.capacity and self.weights[best[-1]] >= self.weights[term]:
+                return
+            best.append(term)
+        best.sort(key=self._rank_key)
+        del best[self.capacity:]
+
+    def _rank(self, node: _Node):
+        node.best = heapq.nsmallest(self.capacity, node.terms, key=self._rank_key)
+
+    def _rank_key(self, term: Term) -> Tuple[float, str]:
+        return -self.weights[term], term[1]
+
+    def complete(self, prefix: str, limit: int) -> List[Term]:
+        node = self._root
+        for char in normalize(prefix)[:self.max_depth]:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return node.best[:limit]
+
+
+class Suggester(LoggerMixin):
+    """Typeahead terms: an in-memory trie plus documents for the suggest index.
+
+    A term's weight is the number of distinct documents that currently
+    contribute it (design principle names count once). Re-adding a source
+    replaces its terms, so edits, deletes and documents turning private or
+    inactive lower the weights of the terms they dropped; a term left with
+    no source is removed.
+    """
+
+    def __init__(self, capacity: int = 10):
+        self.trie = PrefixTrie(capacity)
+        self._sources: Dict[str, Set[Term]] = {}
+
+    def add(self, source: str, terms: Iterable[Term]) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+        """Set the terms of one source document (e.g. "kolam_images:7").
+
+        Returns (doc_id, document) for each suggestion whose weight changed,
+        for the completion suggester index; document is None for one no
+        source contributes any more, to be deleted.
+        """
+        current = []
+        for kind, text in terms:
+            term = (kind, " ".join(str(text).split()))
+            if term[1] and term not in current:
+                current.append(term)
+        previous = self._sources.pop(source, set())
+        if current:
+            self._sources[source] = set(current)
+
+        changed: List[Tuple[str, Optional[Dict[str, Any]]]] = []
+        for term in current:
+            if term not in previous:
+                weight = self.trie.weights.get(term, 0) + 1
+                self.trie.insert(term, weight)
+                changed.append(self.document(term, weight))
+        for term in sorted(previous.difference(current)):
+            weight = self.trie.weights[term] - 1
+            if weight > 0:
+                self.trie.insert(term, weight)
+                changed.append(self.document(term, weight))
+            else:
+                self.trie.remove(term)
+                changed.append((self.document_id(term), None))
+        return changed
+
+    def complete(self, prefix: str, size: int) -> List[Dict[str, str]]:
+        """Completions from memory, best first, one per distinct text."""
+        results, texts = [], set()
+        for kind, text in self.trie.complete(prefix, self.trie.capacity):
+            if text.lower() not in texts:
+                texts.add(text.lower())
+                results.append({"text": text, "kind": kind})
+        return results[:size]
+
+    @staticmethod
+    def document_id(term: Term) -> str:
+        kind, text = term
+        return hashlib.sha1(f"{kind}:{text}".encode("utf-8")).hexdigest()
+
+    @classmethod
+    def document(cls, term: Term, weight: float) -> Tuple[str, Dict[str, Any]]:
+        kind, text = term
+        words = text.split()
+        return cls.document_id(term), {
+            "text": text,
+            "kind": kind,
+            # Each word start is an input, so completions match mid-phrase too
+            "suggest": {"input": [" ".join(words[i:]) for i in range(len(words))], "weight": int(weight)}
+        }
+
+    @staticmethod
+    def completion_query(prefix: str, size: int) -> Dict[str, Any]:
+        return {
+            "_source": ["text", "kind"],
+            "suggest": {
+                "terms": {
+                    "prefix": normalize(prefix),
+                    "completion": {"field": "suggest", "size": size, "skip_duplicates": True}
+                }
+            }
+        }
+
+
+_suggester: Optional[Suggester] = None
+
+
+def get_suggester() -> Suggester:
+    """Get the process-wide suggestion trie."""
+    global _suggester
+    if _suggester is None:
+        _suggester = Suggester(settings.search_suggest_max_results)
+    return _suggester
+
+
+def _suggestion_sources(session_factory: Callable[[], Session]) -> List[Tuple[str, List[Term]]]:
+    db = session_factory()
+    try:
+        sources = [
+            (f"{KOLAM_IMAGES}:{image.id}", kolam_terms(kolam_image_document(image)))
+            for image in db.query(KolamImage).filter(KolamImage.is_public == True)
+        ]
+        sources += [
+            (f"{TRIVIA_QUESTIONS}:{question.id}", question_terms(trivia_question_document(question)))
+            for question in db.query(TriviaQuestion).filter(TriviaQuestion.is_active == True)
+        ]
+        return sources
+    finally:
+        db.close()
+
+
+async def load_suggestions(
+    search: Any,
+    styles: Iterable[str] = (),
+    session_factory: Callable[[], Session] = SessionLocal
+):
+    """Fill the trie and suggest index from the database (background job).
+
+    search is the SearchService whose indexer receives the suggestion
+    documents; styles are Kolam style names to always suggest.
+    """
+    try:
+        sources = await asyncio.to_thread(_suggestion_sources, session_factory)
+        sources.append(("styles", [("style", style.title()) for style in styles]))
+        for source, terms in sources:
+            search.queue_suggestions(source, terms)
+        search.logger.info("Search suggestions loaded", terms=len(search.suggester.trie))
+    except Exception as e:
+        search.logger.error("Loading search suggestions failed", error=str(e))
@@ -0,0 +1,106 @@
+import time
+from enum import Enum
+from typing import Optional
+
+from src.core.logging import LoggerMixin
+from src.core.metrics import LLM_CIRCUIT_STATE, LLM_CIRCUIT_TRANSITIONS
+
+
+class CircuitState(Enum):
+    """Circuit breaker states, with the value exported as a gauge."""
+
+    CLOSED = 0
+    HALF_OPEN = 1
+    OPEN = 2
+
+
+class CircuitOpenError(Exception):
+    """Raised when every backend that could serve a request has an open circuit."""
+
+
+class CircuitBreaker(LoggerMixin):
+    """Stop sending requests to a backend that keeps failing.
+
+    The circuit opens after failure_threshold consecutive failures, where a
+    call slower than slow_call_seconds counts as a failure. While open, the
+    backend receives no traffic. After recovery_seconds it goes half-open
+    and lets up to half_open_max_calls probe requests through: a success
+    closes the circuit, a failure opens it again for another period.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        recovery_seconds: float = 30.0,
+        slow_call_seconds: Optional[float] = None,
+        half_open_max_calls: int = 1
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.slow_call_seconds = slow_call_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self._state = CircuitState.CLOSED
+        self._probes = 0
+        LLM_CIRCUIT_STATE.labels(name).set(self._state.value)
+
+    @property
+    def state(self) -> CircuitState:
+        if self._state == CircuitState.OPEN and time.monotonic() >= self.opened_at + self.recovery_seconds:
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    @property
+    def available(self) -> bool:
+        """Whether a request may be sent now, without claiming a probe."""
+        state = self.state
+        if state == CircuitState.HALF_OPEN:
+            return self._probes < self.half_open_max_calls
+        return state == CircuitState.CLOSED
+
+    def acquire(self):
+        """Claim a probe slot if the circuit is half-open."""
+        if self.state == CircuitState.HALF_OPEN:
+            self._probes += 1
+
+    def release(self):
+        """Give back a probe slot whose request ended without an outcome."""
+        if self._state == CircuitState.HALF_OPEN and self._probes:
+            self._probes -= 1
+
+    def record(self, latency: Optional[float], ok: bool):
+        """Fold one request outcome into the circuit state."""
+        slow = (
+            ok and latency is not None and self.slow_call_seconds is not None
+            and latency > self.slow_call_seconds
+        )
+        state = self.state
+
+        if ok and not slow:
+            self.consecutive_failures = 0
+            if state == CircuitState.HALF_OPEN:
+                self._transition(CircuitState.CLOSED)
+            return
+
+        self.consecutive_failures += 1
+        if state == CircuitState.HALF_OPEN or (
+            state == CircuitState.CLOSED and self.consecutive_failures >= self.failure_threshold
+        ):
+            self.opened_at = time.monotonic()
+            self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState):
+        previous, self._state = self._state, state
+        self._probes = 0
+        LLM_CIRCUIT_STATE.labels(self.name).set(state.value)
+        LLM_CIRCUIT_TRANSITIONS.labels(self.name, state.name.lower()).inc()
+        self.logger.info(
+            "Circuit state changed",
+            backend=self.name,
+            previous=previous.name.lower(),
+            state=state.name.lower(),
+            consecutive_failures=self.consecutive_failures
+        )
@@ -0,0 +1,141 @@
+import hashlib
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.core.config import settings
+from src.core.logging import LoggerMixin
+
+
+# Rough characters-per-token ratio for English text; good enough for budgeting
+CHARS_PER_TOKEN = 4
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens in a piece of text."""
+    if not text:
+        return 0
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Truncate text to roughly max_tokens, cutting on a word boundary."""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    cut = text[:max_tokens * CHARS_PER_TOKEN]
+    if " " in cut:
+        cut = cut[:cut.rindex(" ")]
+    return cut.rstrip() + "…"
+
+
+@lru_cache(maxsize=32)
+def static_prompt(text: str) -> Tuple[str, int]:
+    """Normalize a static prompt once and cache it with its token count."""
+    normalized = re.sub(r"\s+", " ", text).strip()
+    return normalized, estimate_tokens(normalized)
+
+
+class ContextAssembler(LoggerMixin):
+    """Rank, dedupe and token-budget retrieved knowledge chunks for prompts."""
+
+    def __init__(self, min_chunk_tokens: int = 32):
+        self.min_chunk_tokens = min_chunk_tokens
+
+    def assemble(
+        self,
+        query: str,
+        documents: Sequence[Any],
+        token_budget: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Build a context string from retrieved documents within a token budget.
+
+        Returns the context text, its estimated token count and a record of
+        which chunks were used, truncated or dropped.
+        """
+        if token_budget is None:
+            token_budget = settings.knowledge_context_token_budget
+
+        candidates = self._rank(query, documents)
+
+        selected: List[str] = []
+        chunks: List[Dict[str, Any]] = []
+        seen_hashes = set()
+        used_tokens = 0
+        dropped = 0
+
+        for candidate in candidates:
+            content = candidate["content"]
+            digest = hashlib.sha1(
+                re.sub(r"\s+", " ", content).strip().lower().encode("utf-8")
+            ).hexdigest()
+
+            # Skip exact duplicates and chunks already contained in a chosen one
+            if digest in seen_hashes or any(content in text for text in selected):
+                dropped += 1
+                continue
+
+            remaining = token_budget - used_tokens
+            tokens = estimate_tokens(content)
+            truncated = False
+
+            if tokens > remaining:
+                if remaining < self.min_chunk_tokens:
+                    dropped += 1
+                    continue
+                content = truncate_to_tokens(content, remaining)
+                tokens = estimate_tokens(content)
+                truncated = True
+
+            seen_hashes.add(digest)
+            selected.append(content)
+            used_tokens += tokens
+            chunks.append({
+                "id": candidate["id"],
+                "score": round(candidate["score"], 4),
+                "tokens": tokens,
+                "truncated": truncated
+            })
+
+        self.logger.info(
+            "Context assembled",
+            chunks_used=len(chunks),
+            chunks_dropped=dropped,
+            tokens=used_tokens,
+            token_budget=token_budget
+        )
+
+        return {
+            "text": "\n\n".join(selected),
+            "tokens": used_tokens,
+            "chunks": chunks,
+            "dropped": dropped
+        }
+
+    def _rank(self, query: str, documents: Sequence[Any]) -> List[Dict[str, Any]]:
+        """Score documents by retrieval rank/reranking score and query overlap."""
+        query_terms = set(_WORD_RE.findall(query.lower()))
+        candidates = []
+
+        for position, doc in enumerate(documents):
+            content = (getattr(doc, "content", None) or str(doc)).strip()
+            if not content:
+                continue
+
+            reranking_score = getattr(doc, "reranking_score", None)
+            score = reranking_score if reranking_score is not None else 1.0 / (position + 1)
+
+            if query_terms:
+                doc_terms = set(_WORD_RE.findall(content.lower()))
+                score += 0.5 * len(query_terms & doc_terms) / len(query_terms)
+
+            candidates.append({
+                "id": getattr(doc, "id", None) or getattr(doc, "name", None) or str(position),
+                "content": content,
+                "score": score
+            })
+
+        candidates.sort(key=lambda c: c["score"], reverse=True)
+        return candidates
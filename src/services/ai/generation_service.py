@@ -1,6 +1,13 @@
 import os
-import base64
-from io import BytesIO
+import hashlib
+import json
+import math
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
 from dotenv import load_dotenv
 from agno.knowledge.knowledge import Knowledge
 from agno.vectordb.pineconedb import PineconeDb
@@ -8,6 +15,12 @@ from agno.knowledge.embedder.mistral import MistralEmbedder
 from google import genai
 from google.genai import types
 
+from src.core.config import settings
+from src.core.logging import LoggerMixin, get_logger
+from src.services.ai.context_assembler import ContextAssembler, estimate_tokens, static_prompt
+from src.services.ai.svg_emitter import render_svg
+from src.services.image_store import get_generated_image_store
+
 load_dotenv()
 
 # --- System prompt ---
@@ -24,39 +37,511 @@ You are an AI assistant that specializes in retrieving knowledge from a Pinecone
 """
 
 # --- Pinecone setup ---
-vector_db = PineconeDb(
-    name="kolams",
-    dimension=1024,
-    metric="cosine",
-    spec={"serverless": {"cloud": "aws", "region": "us-east-1"}},
-    api_key=os.getenv("PINECONE_API_KEY"),
-    use_hybrid_search=False,
-    embedder=MistralEmbedder(api_key=os.getenv("MISTRAL_API_KEY"))
-)
-knowledge = Knowledge(vector_db=vector_db)
+@lru_cache()
+def get_knowledge() -> Knowledge:
+    """Get the Pinecone-backed knowledge base, connecting on first use."""
+    vector_db = PineconeDb(
+        name="kolams",
+        dimension=1024,
+        metric="cosine",
+        spec={"serverless": {"cloud": "aws", "region": "us-east-1"}},
+        api_key=os.getenv("PINECONE_API_KEY"),
+        use_hybrid_search=False,
+        embedder=MistralEmbedder(api_key=os.getenv("MISTRAL_API_KEY"))
+    )
+    return Knowledge(vector_db=vector_db)
+
 
 # --- Imagen client ---
-client = genai.Client()
+@lru_cache()
+def get_imagen_client() -> genai.Client:
+    """Get the Imagen client, creating it on first use."""
+    return genai.Client()
 
 
-from io import BytesIO
-import base64
+IMAGEN_MODEL = "imagen-4.0-generate-001"
+
+logger = get_logger(__name__)
+context_assembler = ContextAssembler()
+
 
 def query_knowledge_and_generate(query: str, generate_image: bool = False):
-    context = knowledge.search(query)
-    explanation = f"Query: {query}\nContext: {context}\n\n{system_prompt}"
+    """Answer a query from the knowledge base and optionally generate an image.
+
+    Returns the explanation and the generated image store key (or None).
+    Identical image prompts are served from the image store without calling
+    Imagen again.
+    """
+    documents = get_knowledge().search(query)
+    instructions, instruction_tokens = static_prompt(system_prompt)
 
-    image_base64 = None
+    context = context_assembler.assemble(query, documents)
+    explanation = f"Query: {query}\nContext: {context['text']}\n\n{system_prompt}"
+
+    image_key = None
     if generate_image:
-        response = client.models.generate_images(
-            model="imagen-4.0-generate-001",
-            prompt=f"{query} + {context} + {system_prompt}",
-            config=types.GenerateImagesConfig(number_of_images=1),
+        # Imagen prompts have a hard size limit, so the context gets whatever
+        # budget is left after the query and the fixed instructions
+        image_budget = (
+            settings.image_prompt_token_budget
+            - instruction_tokens
+            - estimate_tokens(query)
+        )
+        image_context = context_assembler.assemble(
+            query, documents, token_budget=max(image_budget, 0)
         )
+        prompt = f"{query} + {image_context['text']} + {instructions}"
+        image_params = {"number_of_images": 1}
+
+        logger.info(
+            "Image prompt assembled",
+            prompt_tokens=estimate_tokens(prompt),
+            chunks=[chunk["id"] for chunk in image_context["chunks"]]
+        )
+
+        store = get_generated_image_store()
+        image_key = store.make_key(prompt, IMAGEN_MODEL, image_params)
+
+        if store.get(image_key) is None:
+            response = get_imagen_client().models.generate_images(
+                model=IMAGEN_MODEL,
+                prompt=prompt,
+                config=types.GenerateImagesConfig(**image_params),
+            )
+
+            image_bytes = None
+            for generated_image in response.generated_images:
+                # ✅ Use image_bytes instead of image.data
+                image_bytes = generated_image.image.image_bytes
+
+            if image_bytes:
+                store.put(image_key, image_bytes)
+            else:
+                image_key = None
+
+    return explanation, image_key
+
+
+# --- Procedural pattern engine ---
+Point = Tuple[float, float]
+
+
+class GenerationService(LoggerMixin):
+    """Local procedural Kolam generator that renders SVG without a remote model.
+
+    Point and symmetry math is done with NumPy: every point of a base motif is
+    gathered into one array and each symmetry is applied as a batch of affine
+    transforms, so a pattern costs a few array operations rather than a Python
+    loop per point and copy.
+    """
+
+    SIZE_PRESETS = {"small": 200, "medium": 400, "large": 600}
+    POINT_FIELDS = ("center", "start", "end", "control", "control1", "control2")
+
+    def __init__(self, output_dir: Optional[str] = None):
+        self.output_dir = Path(output_dir or settings.generated_image_dir) / "patterns"
+
+        self.pattern_generators: Dict[str, Callable[[int, Dict[str, Any]], List[Dict[str, Any]]]] = {
+            "geometric": self._generate_geometric_pattern,
+            "floral": self._generate_floral_pattern,
+            "traditional": self._generate_traditional_pattern,
+            "modern": self._generate_modern_pattern,
+        }
+        self.symmetry_generators: Dict[str, Callable[..., List[Dict[str, Any]]]] = {
+            "radial": self._apply_radial_symmetry,
+            "bilateral": self._apply_bilateral_symmetry,
+            "rotational": self._apply_rotational_symmetry,
+        }
+
+    async def generate_pattern(
+        self,
+        pattern_type: str = "traditional",
+        complexity_level: int = 3,
+        symmetry_type: str = "radial",
+        size: str = "medium"
+    ) -> Dict[str, Any]:
+        """Generate a Kolam pattern and save it as SVG."""
+        started = time.perf_counter()
+
+        if pattern_type not in self.pattern_generators:
+            self.logger.warning("Unknown pattern type, using traditional", pattern_type=pattern_type)
+            pattern_type = "traditional"
+
+        if symmetry_type not in self.symmetry_generators:
+            self.logger.warning("Unknown symmetry type, using radial", symmetry_type=symmetry_type)
+            symmetry_type = "radial"
+
+        if size not in self.SIZE_PRESETS:
+            size = "medium"
+
+        complexity_level = min(max(int(complexity_level), 1), 5)
+        size_params = self._get_size_parameters(size)
+
+        base_pattern = self.pattern_generators[pattern_type](complexity_level, size_params)
+        elements = self.symmetry_generators[symmetry_type](
+            base_pattern, complexity_level, size_params["center"]
+        )
+
+        svg_data = self._render_svg(elements, size_params)
+        image_path = self._save_svg(svg_data)
+        generation_time_ms = (time.perf_counter() - started) * 1000
+
+        self.logger.info(
+            "Pattern generated",
+            pattern_type=pattern_type,
+            symmetry_type=symmetry_type,
+            elements=len(elements),
+            generation_time_ms=round(generation_time_ms, 2)
+        )
+
+        return {
+            "svg_data": svg_data,
+            "image_path": str(image_path),
+            "pattern_type": pattern_type,
+            "complexity_level": complexity_level,
+            "symmetry_type": symmetry_type,
+            "size": size,
+            "element_count": len(elements),
+            "generation_time_ms": generation_time_ms
+        }
+
+    def _get_size_parameters(self, size: str) -> Dict[str, Any]:
+        """Get canvas dimensions for a size preset, defaulting to medium."""
+        side = self.SIZE_PRESETS.get(size, self.SIZE_PRESETS["medium"])
+        return {"width": side, "height": side, "center": (side // 2, side // 2)}
+
+    # Base pattern generators
+
+    def _generate_geometric_pattern(self, complexity: int, size_params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Generate concentric circles and polygons around a central square."""
+        center = size_params["center"]
+        max_radius = min(size_params["width"], size_params["height"]) * 0.45
+        radii = np.linspace(max_radius / (complexity + 1), max_radius, complexity)
+
+        square_points = self._polygon_vertices(center, 4, radii[0] * 0.6, math.pi / 4)
+        pattern = [{
+            "type": "square",
+            "points": [tuple(p) for p in square_points.tolist()],
+            "style": {"stroke": "#b22222", "stroke_width": 2, "fill": "none"}
+        }]
+
+        for ring, radius in enumerate(radii.tolist()):
+            vertices = self._polygon_vertices(center, ring + 3, radius, ring * math.pi / (ring + 3))
+            pattern.append({
+                "type": "polygon",
+                "points": [tuple(p) for p in vertices.tolist()],
+                "style": {"stroke": "#1f4e79", "stroke_width": 2, "fill": "none"}
+            })
+            pattern.append({
+                "type": "circle",
+                "center": center,
+                "radius": radius,
+                "style": {"stroke": "#444444", "stroke_width": 1, "fill": "none"}
+            })
+
+        return pattern
+
+    def _generate_floral_pattern(self, complexity: int, size_params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Generate layered rings of petals around a center flower."""
+        center = np.asarray(size_params["center"], dtype=float)
+        max_radius = min(size_params["width"], size_params["height"]) * 0.45
+        inner_radius = max_radius * 0.12
+
+        pattern = [{
+            "type": "circle",
+            "center": tuple(center.tolist()),
+            "radius": inner_radius,
+            "style": {"stroke": "#c0392b", "stroke_width": 2, "fill": "#f5b041"}
+        }]
+
+        layers = 1 + complexity // 2
+        layer_depth = (max_radius - inner_radius) / layers
+        petal_style = {"stroke": "#c0392b", "stroke_width": 2, "fill": "none"}
+
+        for layer in range(layers):
+            petals = 4 + 2 * complexity
+            angles = np.arange(petals) * (2 * math.pi / petals) + layer * math.pi / petals
+            directions = np.stack([np.cos(angles), np.sin(angles)], axis=1)
+
+            starts = center + directions * (inner_radius + layer * layer_depth)
+            ends = center + directions * (inner_radius + (layer + 1) * layer_depth)
+            controls1 = self._petal_control_points(starts, ends, angles)
+            controls2 = self._petal_control_points(starts, ends, angles + math.pi)
+
+            for start, end, control1, control2 in zip(
+                starts.tolist(), ends.tolist(), controls1.tolist(), controls2.tolist()
+            ):
+                pattern.append({
+                    "type": "petal",
+                    "start": tuple(start),
+                    "end": tuple(end),
+                    "control1": tuple(control1),
+                    "control2": tuple(control2),
+                    "style": petal_style
+                })
+
+        return pattern
+
+    def _generate_traditional_pattern(self, complexity: int, size_params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Generate a diamond-shaped pulli (dot) grid with loops around each dot."""
+        cx, cy = size_params["center"]
+        n = 2 * complexity + 1
+        half = n // 2
+        spacing = min(size_params["width"], size_params["height"]) * 0.85 / n
+
+        rows, cols = np.mgrid[0:n, 0:n]
+        in_diamond = (np.abs(rows - half) + np.abs(cols - half)) <= half
+        dots = np.stack([
+            cx + (cols[in_diamond] - half) * spacing,
+            cy + (rows[in_diamond] - half) * spacing
+        ], axis=1)
+
+        dot_style = {"stroke": "none", "stroke_width": 0, "fill": "#333333"}
+        line_style = {"stroke": "#8b0000", "stroke_width": 2, "fill": "none"}
+
+        pattern = [
+            {"type": "circle", "center": tuple(dot), "radius": 3, "style": dot_style}
+            for dot in dots.tolist()
+        ]
+
+        # A diamond loop around every dot, touching its neighbours' loops
+        offsets = np.array([[spacing / 2, 0], [0, spacing / 2], [-spacing / 2, 0], [0, -spacing / 2]])
+        corners = dots[:, None, :] + offsets[None, :, :]
+        starts = corners.reshape(-1, 2)
+        ends = np.roll(corners, -1, axis=1).reshape(-1, 2)
+
+        pattern.extend(
+            {"type": "line", "start": tuple(start), "end": tuple(end), "style": line_style}
+            for start, end in zip(starts.tolist(), ends.tolist())
+        )
+
+        return pattern
+
+    def _generate_modern_pattern(self, complexity: int, size_params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Generate sweeping cubic curves radiating from the center."""
+        center = np.asarray(size_params["center"], dtype=float)
+        max_radius = min(size_params["width"], size_params["height"]) * 0.45
+
+        count = 3 * complexity
+        angles = np.arange(count) * (2 * math.pi / count)
+        starts = center + np.stack([np.cos(angles), np.sin(angles)], axis=1) * max_radius * 0.15
+        sweep = angles + math.pi / 2
+        ends = center + np.stack([np.cos(sweep), np.sin(sweep)], axis=1) * max_radius
+
+        controls1 = self._curve_control_points(starts, ends, 1)
+        controls2 = self._curve_control_points(starts, ends, 2)
+        curve_style = {"stroke": "#6c3483", "stroke_width": 2, "fill": "none"}
+
+        return [
+            {
+                "type": "curve",
+                "start": tuple(start),
+                "end": tuple(end),
+                "control1": tuple(control1),
+                "control2": tuple(control2),
+                "style": curve_style
+            }
+            for start, end, control1, control2 in zip(
+                starts.tolist(), ends.tolist(), controls1.tolist(), controls2.tolist()
+            )
+        ]
+
+    # Symmetry generators
+
+    def _apply_radial_symmetry(
+        self,
+        pattern: List[Dict[str, Any]],
+        complexity: int,
+        center: Optional[Point] = None
+    ) -> List[Dict[str, Any]]:
+        """Apply dihedral (mandala) symmetry: n rotations, each also mirrored."""
+        center = center or self._get_size_parameters("medium")["center"]
+        folds = self._symmetry_folds(complexity)
+        rotations = self._rotation_matrices(np.arange(folds) * (2 * math.pi / folds), center)
+        mirrored = rotations @ self._reflection_matrix(center)
+        return self._transform_pattern(pattern, np.concatenate([rotations, mirrored]))
+
+    def _apply_bilateral_symmetry(
+        self,
+        pattern: List[Dict[str, Any]],
+        complexity: int,
+        center: Optional[Point] = None
+    ) -> List[Dict[str, Any]]:
+        """Mirror the pattern across the vertical axis through the center."""
+        center = center or self._get_size_parameters("medium")["center"]
+        matrices = np.stack([np.eye(3), self._reflection_matrix(center)])
+        return self._transform_pattern(pattern, matrices)
+
+    def _apply_rotational_symmetry(
+        self,
+        pattern: List[Dict[str, Any]],
+        complexity: int,
+        center: Optional[Point] = None
+    ) -> List[Dict[str, Any]]:
+        """Apply cyclic symmetry: n evenly spaced rotations about the center."""
+        center = center or self._get_size_parameters("medium")["center"]
+        folds = self._symmetry_folds(complexity)
+        angles = np.arange(folds) * (2 * math.pi / folds)
+        return self._transform_pattern(pattern, self._rotation_matrices(angles, center))
+
+    def _symmetry_folds(self, complexity: int) -> int:
+        """Number of rotational copies for a complexity level."""
+        return 2 + complexity
+
+    @staticmethod
+    def _rotation_matrices(angles: np.ndarray, center: Point) -> np.ndarray:
+        """Build a batch of 3x3 affine matrices rotating about a center."""
+        cx, cy = center
+        cos, sin = np.cos(angles), np.sin(angles)
+
+        matrices = np.zeros((len(angles), 3, 3))
+        matrices[:, 0, 0] = cos
+        matrices[:, 0, 1] = -sin
+        matrices[:, 1, 0] = sin
+        matrices[:, 1, 1] = cos
+        matrices[:, 0, 2] = cx - cos * cx + sin * cy
+        matrices[:, 1, 2] = cy - sin * cx - cos * cy
+        matrices[:, 2, 2] = 1.0
+        return matrices
+
+    @staticmethod
+    def _reflection_matrix(center: Point) -> np.ndarray:
+        """Affine matrix mirroring across the vertical line through the center."""
+        return np.array([[-1.0, 0.0, 2.0 * center[0]], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+
+    def _transform_pattern(self, pattern: List[Dict[str, Any]], matrices: np.ndarray) -> List[Dict[str, Any]]:
+        """Apply a batch of affine transforms to every point of a pattern at once.
+
+        Copies that land exactly on an element already emitted are dropped:
+        base motifs are often symmetric themselves (the pulli diamond is
+        mirror symmetric, concentric circles are unchanged by any rotation
+        about the center), so many symmetry copies would only redraw the
+        same shapes on top of each other.
+        """
+        coords, slots = self._flatten_points(pattern)
+        if not len(coords):
+            return [dict(element) for _ in range(len(matrices)) for element in pattern]
+
+        homogeneous = np.hstack([coords, np.ones((len(coords), 1))])
+        transformed = np.round(np.einsum("kij,nj->kni", matrices, homogeneous)[..., :2], 2)
+
+        element_slots: List[List[Tuple[str, int, Optional[int]]]] = [[] for _ in pattern]
+        for index, field, offset, count in slots:
+            element_slots[index].append((field, offset, count))
+
+        result = []
+        seen = set()
+        for points in transformed.tolist():
+            for element, fields in zip(pattern, element_slots):
+                values = {
+                    field: tuple(points[offset]) if count is None
+                    else [tuple(p) for p in points[offset:offset + count]]
+                    for field, offset, count in fields
+                }
+                key = self._element_key(element, values)
+                if key in seen:
+                    continue
+                seen.add(key)
+                copy = dict(element)
+                copy.update(values)
+                result.append(copy)
+
+        return result
+
+    @staticmethod
+    def _element_key(element: Dict[str, Any], values: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Identity of an element's drawn shape, independent of point order."""
+        kind = element["type"]
+        if kind == "line":
+            geometry: Any = frozenset((values["start"], values["end"]))
+        elif kind == "petal":
+            # Two quadratic sides between the same tips, in either order
+            geometry = (
+                frozenset((values["start"], values["end"])),
+                frozenset((values["control1"], values["control2"]))
+            )
+        elif kind == "curve":
+            forward = (values["start"], values["control1"], values["control2"], values["end"])
+            geometry = min(forward, forward[::-1])
+        elif "points" in values:
+            geometry = (frozenset(values["points"]), len(values["points"]))
+        else:
+            geometry = tuple(sorted(values.items()))
+        style = json.dumps(element.get("style"), sort_keys=True, default=str)
+        return kind, element.get("radius"), style, geometry
+
+    def _flatten_points(self, pattern: List[Dict[str, Any]]) -> Tuple[np.ndarray, List[Tuple[int, str, int, Optional[int]]]]:
+        """Collect every point of a pattern into one (N, 2) array with slot records."""
+        coords: List[Point] = []
+        slots = []
+
+        for index, element in enumerate(pattern):
+            for field in self.POINT_FIELDS:
+                if field in element:
+                    slots.append((index, field, len(coords), None))
+                    coords.append(element[field])
+            if "points" in element:
+                slots.append((index, "points", len(coords), len(element["points"])))
+                coords.extend(element["points"])
+
+        return np.asarray(coords, dtype=float).reshape(-1, 2), slots
+
+    # Geometry helpers
+
+    @staticmethod
+    def _polygon_vertices(center: Point, sides: int, radius: float, rotation: float = 0.0) -> np.ndarray:
+        """Vertices of a regular polygon as an (n, 2) array."""
+        angles = rotation + np.arange(sides) * (2 * math.pi / sides)
+        return np.stack([
+            center[0] + radius * np.cos(angles),
+            center[1] + radius * np.sin(angles)
+        ], axis=1)
+
+    def _generate_polygon_points(self, center: Point, sides: int, radius: float) -> List[Point]:
+        """Generate the vertices of a regular polygon."""
+        return [tuple(p) for p in self._polygon_vertices(center, sides, radius).tolist()]
+
+    @staticmethod
+    def _petal_control_points(starts: np.ndarray, ends: np.ndarray, angles: np.ndarray) -> np.ndarray:
+        """Quadratic control points bulging sideways from each petal's axis."""
+        starts = np.atleast_2d(starts)
+        ends = np.atleast_2d(ends)
+        lengths = np.linalg.norm(ends - starts, axis=1)
+        side = np.atleast_1d(angles) + math.pi / 2
+        offsets = np.stack([np.cos(side), np.sin(side)], axis=1) * (0.4 * lengths)[:, None]
+        return (starts + ends) / 2 + offsets
+
+    def _calculate_petal_control_point(self, start: Point, end: Point, angle: float) -> Point:
+        """Control point for one side of a petal."""
+        point = self._petal_control_points(np.asarray(start, float), np.asarray(end, float), angle)
+        return tuple(point[0].tolist())
+
+    @staticmethod
+    def _curve_control_points(starts: np.ndarray, ends: np.ndarray, control_num: int) -> np.ndarray:
+        """Cubic control points placed along each chord and pushed off it."""
+        starts = np.atleast_2d(starts)
+        ends = np.atleast_2d(ends)
+        chords = ends - starts
+        normals = np.stack([-chords[:, 1], chords[:, 0]], axis=1)
+        direction = 1 if control_num % 2 else -1
+        return starts + chords * (control_num / 3) + normals * (0.3 * direction)
+
+    def _calculate_curve_control_point(self, start: Point, end: Point, control_num: int) -> Point:
+        """Control point for a cubic curve between two points."""
+        point = self._curve_control_points(np.asarray(start, float), np.asarray(end, float), control_num)
+        return tuple(point[0].tolist())
+
+    # Output
 
-        for generated_image in response.generated_images:
-            # ✅ Use image_bytes instead of image.data
-            image_bytes = generated_image.image.image_bytes
-            image_base64 = base64.b64encode(image_bytes).decode("utf-8")
+    def _render_svg(self, elements: List[Dict[str, Any]], size_params: Dict[str, Any]) -> str:
+        """Render pattern elements as a compact SVG document."""
+        return render_svg(elements, size_params["width"], size_params["height"])
 
-    return explanation, image_base64
\ No newline at end of file
+    def _save_svg(self, svg_data: str) -> Path:
+        """Save SVG content under its content hash and return the path."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256(svg_data.encode("utf-8")).hexdigest()
+        path = self.output_dir / f"{digest}.svg"
+        if not path.exists():
+            path.write_text(svg_data, encoding="utf-8")
+        return path
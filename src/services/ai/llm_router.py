@@ -0,0 +1,190 @@
+import asyncio
+import time
+from typing import Dict, List, Optional, Set
+
+import httpx
+
+from src.core.config import settings
+from src.core.logging import LoggerMixin
+from src.core.metrics import LLM_BACKEND_ERRORS, LLM_BACKEND_HEALTHY, LLM_BACKEND_LATENCY_SECONDS
+from src.services.ai.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.services.ai.llm_scheduler import LLMScheduler
+
+
+def parse_backends(value: str) -> List[str]:
+    """Parse a comma-separated list of backend base URLs."""
+    return [url.strip().rstrip("/") for url in value.split(",") if url.strip()]
+
+
+def parse_task_models(value: str) -> Dict[str, str]:
+    """Parse "task=model,task=model" into a mapping (model tags may contain ':')."""
+    models = {}
+    for item in value.split(","):
+        if "=" in item:
+            task, model = item.split("=", 1)
+            models[task.strip()] = model.strip()
+    return models
+
+
+class Backend:
+    """One model server with its own admission queue and health statistics."""
+
+    # Weight of the newest observation in the moving averages
+    ALPHA = 0.2
+
+    def __init__(self, url: str, max_in_flight: int, max_queue: int, breaker: CircuitBreaker):
+        self.url = url
+        self.scheduler = LLMScheduler(max_in_flight, max_queue, name=url)
+        self.breaker = breaker
+        self.latency = 1.0
+        self.error_rate = 0.0
+        # None until a health check reports what the server has pulled
+        self.models: Optional[Set[str]] = None
+
+    @property
+    def healthy(self) -> bool:
+        return self.breaker.available
+
+    @property
+    def load(self) -> float:
+        """Occupied and queued slots relative to capacity."""
+        scheduler = self.scheduler
+        return (scheduler.in_flight + scheduler.queue_depth) / scheduler.max_in_flight
+
+    def serves(self, model: str) -> bool:
+        if self.models is None:
+            return True
+        return model in self.models or f"{model}:latest" in self.models
+
+    def record(self, latency: Optional[float], ok: bool):
+        """Fold one request outcome into the backend's statistics."""
+        if latency is not None:
+            self.latency += self.ALPHA * (latency - self.latency)
+            LLM_BACKEND_LATENCY_SECONDS.labels(self.url).observe(latency)
+        self.error_rate += self.ALPHA * ((0.0 if ok else 1.0) - self.error_rate)
+
+        if not ok:
+            LLM_BACKEND_ERRORS.labels(self.url).inc()
+        self.breaker.record(latency, ok)
+        LLM_BACKEND_HEALTHY.labels(self.url).set(1 if self.healthy else 0)
+
+
+class LLMRouter(LoggerMixin):
+    """Spread LLM requests over several Ollama hosts.
+
+    Each request goes to the healthy backend serving the requested model
+    with the lowest load, breaking ties on smoothed latency and error rate.
+    Each backend sits behind a circuit breaker: backends that fail or answer
+    slowly several times in a row are taken out of rotation until a probe
+    request succeeds. If every candidate's circuit is open the request fails
+    fast with CircuitOpenError instead of waiting on a dead server.
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        max_in_flight: int,
+        max_queue: int,
+        cooldown_seconds: float = 30.0,
+        max_failures: int = 3,
+        slow_call_seconds: Optional[float] = None,
+        half_open_max_calls: int = 1
+    ):
+        if not urls:
+            raise ValueError("At least one LLM backend is required")
+        self.backends = [
+            Backend(
+                url,
+                max_in_flight,
+                max_queue,
+                CircuitBreaker(url, max_failures, cooldown_seconds, slow_call_seconds, half_open_max_calls)
+            )
+            for url in urls
+        ]
+        self.cooldown_seconds = cooldown_seconds
+        self.max_failures = max_failures
+
+    @classmethod
+    def from_settings(cls, urls: Optional[List[str]] = None) -> "LLMRouter":
+        """Build a router from settings, optionally for other backend URLs."""
+        urls = urls or parse_backends(settings.ollama_backends) or [settings.ollama_base_url.rstrip("/")]
+        return cls(
+            urls,
+            settings.ollama_max_in_flight,
+            settings.ollama_max_queue,
+            settings.ollama_backend_cooldown_seconds,
+            settings.ollama_backend_max_failures,
+            settings.ollama_slow_call_seconds,
+            settings.ollama_half_open_max_calls
+        )
+
+    def choose(self, model: str, exclude: Optional[Set[str]] = None) -> Backend:
+        """Pick the backend for a request, or raise if none can serve the model.
+
+        The caller must report the outcome with record(), or call release()
+        if the request ends without one, so a half-open probe slot is freed.
+        """
+        candidates = [
+            backend for backend in self.backends
+            if backend.serves(model) and backend.url not in (exclude or set())
+        ]
+        if not candidates:
+            raise LookupError(f"No backend serves model {model}")
+
+        healthy = [backend for backend in candidates if backend.healthy]
+        if not healthy:
+            raise CircuitOpenError(f"Every backend serving {model} is unavailable")
+
+        backend = min(
+            healthy,
+            key=lambda backend: (backend.load, backend.latency * (1 + backend.error_rate))
+        )
+        backend.breaker.acquire()
+        return backend
+
+    def record(self, backend: Backend, latency: Optional[float], ok: bool):
+        backend.record(latency, ok)
+        if not ok and not backend.healthy:
+            self.logger.warning(
+                "LLM backend ejected", backend=backend.url, cooldown=self.cooldown_seconds
+            )
+
+    def release(self, backend: Backend):
+        backend.breaker.release()
+
+    async def check_health(self, client: httpx.AsyncClient):
+        """Probe every backend and refresh the models it has available."""
+        async def probe(backend: Backend):
+            started = time.monotonic()
+            try:
+                response = await client.get(f"{backend.url}/api/tags", timeout=5.0)
+                response.raise_for_status()
+                # Reachability says nothing about completion latency, so a
+                # passing check leaves the circuit to the next probe request
+                backend.models = {model["name"] for model in response.json().get("models", [])}
+            except Exception as e:
+                self.logger.warning("LLM backend health check failed", backend=backend.url, error=str(e))
+                self.record(backend, time.monotonic() - started, False)
+
+        await asyncio.gather(*[probe(backend) for backend in self.backends])
+
+    async def monitor(self, client: httpx.AsyncClient, interval: float):
+        """Run health checks forever (started from the application lifespan)."""
+        while True:
+            await self.check_health(client)
+            await asyncio.sleep(interval)
+
+    def stats(self) -> List[Dict[str, object]]:
+        """Per-backend routing statistics."""
+        return [
+            {
+                "url": backend.url,
+                "healthy": backend.healthy,
+                "circuit": backend.breaker.state.name.lower(),
+                "load": round(backend.load, 3),
+                "latency": round(backend.latency, 3),
+                "error_rate": round(backend.error_rate, 3),
+                "models": sorted(backend.models) if backend.models is not None else None
+            }
+            for backend in self.backends
+        ]
@@ -0,0 +1,147 @@
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import AsyncIterator, List, Optional, Tuple
+
+from src.core.logging import LoggerMixin
+from src.core.metrics import (
+    LLM_IN_FLIGHT,
+    LLM_QUEUE_DEPTH,
+    LLM_QUEUE_WAIT_SECONDS,
+    LLM_REJECTED_REQUESTS,
+)
+
+
+class Priority(IntEnum):
+    """Scheduling priority; lower values are served first."""
+
+    INTERACTIVE = 0
+    STANDARD = 1
+    BACKGROUND = 2
+
+
+class SchedulerRejectedError(Exception):
+    """Raised when a request is not admitted to the model server."""
+
+
+class QueueFullError(SchedulerRejectedError):
+    """Raised immediately when the wait queue is at capacity."""
+
+
+class DeadlineExceededError(SchedulerRejectedError):
+    """Raised when a request could not start before its deadline."""
+
+
+_Waiter = Tuple[int, int, Optional[float], asyncio.Future]
+
+
+class LLMScheduler(LoggerMixin):
+    """Admission control in front of a single model server.
+
+    At most max_in_flight requests run at once. Others wait in a priority
+    queue (FIFO within a priority) of at most max_queue entries; when it is
+    full new requests are rejected straight away so callers can fall back
+    instead of piling up timeouts. Waiters whose deadline passes are dropped
+    from the queue without ever reaching the server.
+    """
+
+    def __init__(self, max_in_flight: int, max_queue: int, name: str = "ollama"):
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.name = name
+        self._in_flight = 0
+        self._queue: List[_Waiter] = []
+        self._sequence = itertools.count()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for *_, future in self._queue if not future.done())
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        priority: Priority = Priority.STANDARD,
+        timeout: Optional[float] = None
+    ) -> AsyncIterator[None]:
+        """Hold one in-flight slot for the duration of the block.
+
+        timeout bounds how long the request may wait in the queue.
+        """
+        await self._acquire(priority, timeout)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: Priority, timeout: Optional[float]):
+        started = time.monotonic()
+
+        if self._in_flight < self.max_in_flight and not self.queue_depth:
+            self._in_flight += 1
+            self._record_admission(priority, started)
+            return
+
+        if self.queue_depth >= self.max_queue:
+            self._reject("queue_full", priority)
+            raise QueueFullError(f"{self.name} queue is full ({self.max_queue} waiting)")
+
+        deadline = started + timeout if timeout is not None else None
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (int(priority), next(self._sequence), deadline, future))
+        self._update_gauges()
+
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self._reject("deadline", priority)
+            raise DeadlineExceededError(f"{self.name} request waited longer than {timeout}s")
+        except DeadlineExceededError:
+            self._reject("deadline", priority)
+            raise
+        except asyncio.CancelledError:
+            # The slot may have been handed over just as we were cancelled
+            if future.done() and not future.cancelled() and future.exception() is None:
+                self._release()
+            raise
+        finally:
+            self._update_gauges()
+
+        self._record_admission(priority, started)
+
+    def _release(self):
+        """Hand the freed slot to the best live waiter, or give it back."""
+        now = time.monotonic()
+        while self._queue:
+            _, _, deadline, future = heapq.heappop(self._queue)
+            if future.done():
+                continue
+            if deadline is not None and deadline <= now:
+                future.set_exception(DeadlineExceededError(f"{self.name} request expired in queue"))
+                continue
+            future.set_result(None)
+            self._update_gauges()
+            return
+
+        self._in_flight -= 1
+        self._update_gauges()
+
+    def _record_admission(self, priority: Priority, started: float):
+        LLM_QUEUE_WAIT_SECONDS.labels(self.name, priority.name.lower()).observe(time.monotonic() - started)
+        self._update_gauges()
+
+    def _reject(self, reason: str, priority: Priority):
+        LLM_REJECTED_REQUESTS.labels(self.name, reason).inc()
+        self.logger.warning(
+            "LLM request rejected", backend=self.name, reason=reason, priority=priority.name.lower()
+        )
+
+    def _update_gauges(self):
+        LLM_QUEUE_DEPTH.labels(self.name).set(self.queue_depth)
+        LLM_IN_FLIGHT.labels(self.name).set(self._in_flight)
@@ -1,34 +1,174 @@
+import hashlib
 import httpx
 import json
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import AsyncIterator, Callable, Dict, List, Any, Optional, Sequence, Set
 import asyncio
+import time
+from collections import deque
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
 
 from src.core.config import settings
+from src.core.database import SessionLocal
+from src.core.http import get_http_client
 from src.core.logging import LoggerMixin
+from src.core.metrics import (
+    LLM_COMPLETION_TOKENS,
+    LLM_GENERATION_SECONDS,
+    LLM_PROMPT_EVAL_SECONDS,
+    LLM_PROMPT_TOKENS,
+    OLLAMA_COALESCED_REQUESTS,
+    OLLAMA_HEDGE_WINS,
+    OLLAMA_HEDGED_REQUESTS,
+    OLLAMA_REQUESTS,
+    OLLAMA_UPSTREAM_REQUESTS,
+)
+from src.core.singleflight import SingleFlight
+from src.db.models.models import TriviaQuestion
+from src.services.ai.circuit_breaker import CircuitOpenError
+from src.services.ai.llm_router import Backend, LLMRouter, parse_task_models
+from src.services.ai.llm_scheduler import Priority, SchedulerRejectedError
+
+
+# Bump when a prompt template changes so cached responses are regenerated
+HINT_PROMPT_VERSION = "2"
+EXPLANATION_PROMPT_VERSION = "2"
+
+
+class OllamaError(Exception):
+    """Raised when Ollama fails to produce a response."""
+
+
+class OllamaTimeoutError(OllamaError):
+    """Raised when an Ollama request times out."""
+
+
+class OllamaOverloadedError(OllamaError):
+    """Raised when the scheduler sheds a request instead of queueing it."""
+
+
+class OllamaBackendError(OllamaError):
+    """Raised when a backend is unreachable or fails; safe to retry elsewhere."""
+
+
+class OllamaUnavailableError(OllamaError):
+    """Raised without calling Ollama when every backend's circuit is open."""
+
+
+class OllamaStreamError(OllamaError):
+    """Raised by a stream that could not be completed; the message is safe to show users."""
+
+
+BUSY_MESSAGE = "Our AI tutor is busy right now. Please try again in a moment."
+
+# Tasks that can be routed to their own model via OLLAMA_TASK_MODELS
+TASK_HINT = "hint"
+TASK_EXPLANATION = "explanation"
+TASK_ANALYSIS = "analysis"
+TASK_TIP = "tip"
+
+# Fixed instructions per task. They are sent as Ollama's system prompt so
+# every request for a task starts with the same tokens, letting the server
+# reuse its cached prefix and evaluate only the variable part.
+SYSTEM_PROMPTS = {
+    TASK_EXPLANATION: """You are an expert teacher explaining Kolam (traditional Indian art) concepts.
+
+You will be given a question, its correct answer and possibly the learner's answer and some context. Please provide a clear, educational explanation that:
+1. Explains why the correct answer is right
+2. Provides cultural and historical context about Kolam
+3. Includes interesting facts or details
+4. Is appropriate for learners of all levels
+5. Keeps the explanation concise but informative""",
+    TASK_HINT: """You are a helpful tutor providing hints for Kolam learning questions.
+
+You will be given a question and its difficulty level. Please provide a helpful hint that:
+1. Guides the learner toward the correct answer without giving it away
+2. Is appropriate for the difficulty level
+3. Includes relevant Kolam cultural context
+4. Encourages further learning
+5. Is encouraging and supportive""",
+    TASK_ANALYSIS: """You are an expert in traditional Indian Kolam art analyzing a pattern.
+
+You will be given a pattern description and its detected features. Please provide an analysis that includes:
+1. Pattern type and style classification
+2. Cultural significance and traditional meaning
+3. Geometric and artistic elements
+4. Difficulty level assessment
+5. Suggestions for learning or creating similar patterns
+6. Historical or regional context if applicable""",
+    TASK_TIP: """You are a Kolam art instructor providing personalized learning tips.
+
+You will be given the current topic, the learner's level and the topics covered so far. Please provide a learning tip that:
+1. Is tailored to the user's level
+2. Connects to previous learning if applicable
+3. Provides practical advice for learning Kolam
+4. Includes cultural context
+5. Encourages practice and exploration
+6. Is motivating and supportive""",
+}
 
 
 class OllamaService(LoggerMixin):
     """Service for interacting with Ollama for AI-powered explanations and hints."""
     
-    def __init__(self):
-        self.base_url = settings.ollama_base_url
+    # Latencies kept per model for the hedge percentile, and how many are
+    # needed before hedging starts
+    HEDGE_WINDOW = 200
+    HEDGE_MIN_SAMPLES = 20
+    
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        router: Optional[LLMRouter] = None
+    ):
         self.model = settings.ollama_model
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.task_models = parse_task_models(settings.ollama_task_models)
+        self._client = client
+        self.router = router or LLMRouter.from_settings()
+        self._single_flight = SingleFlight()
+        # Recent completion latencies per model, used to pick the hedge delay
+        self._latencies: Dict[str, deque] = {}
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client: an injected one, else the application-wide pool."""
+        return self._client or get_http_client()
+    
+    @client.setter
+    def client(self, client: httpx.AsyncClient):
+        self._client = client
+    
+    def model_for(self, task: Optional[str]) -> str:
+        """Model to use for a task, defaulting to the configured model."""
+        return self.task_models.get(task, self.model)
     
     async def generate_explanation(
         self,
         question: str,
         correct_answer: str,
         user_answer: Optional[str] = None,
-        context: Optional[str] = None
+        context: Optional[str] = None,
+        fail_silently: bool = True,
+        priority: Priority = Priority.INTERACTIVE
     ) -> str:
-        """Generate an explanation for a trivia question."""
+        """Generate an explanation for a trivia question.
+        
+        With fail_silently=False errors raise OllamaError instead of
+        returning an apology, so callers can avoid caching failures.
+        """
+        if not fail_silently:
+            prompt = self._build_explanation_prompt(question, correct_answer, user_answer, context)
+            return await self._generate(prompt, priority, TASK_EXPLANATION)
+        
         try:
             prompt = self._build_explanation_prompt(
                 question, correct_answer, user_answer, context
             )
             
-            response = await self._call_ollama(prompt)
+            response = await self._call_ollama(prompt, priority, TASK_EXPLANATION)
             
             self.logger.info("Explanation generated successfully")
             return response
@@ -41,13 +181,19 @@ class OllamaService(LoggerMixin):
         self,
         question: str,
         difficulty_level: int,
-        category: Optional[str] = None
+        category: Optional[str] = None,
+        fail_silently: bool = True,
+        priority: Priority = Priority.INTERACTIVE
     ) -> str:
         """Generate a hint for a trivia question."""
+        if not fail_silently:
+            prompt = self._build_hint_prompt(question, difficulty_level, category)
+            return await self._generate(prompt, priority, TASK_HINT)
+        
         try:
             prompt = self._build_hint_prompt(question, difficulty_level, category)
             
-            response = await self._call_ollama(prompt)
+            response = await self._call_ollama(prompt, priority, TASK_HINT)
             
             self.logger.info("Hint generated successfully")
             return response
@@ -65,7 +211,7 @@ class OllamaService(LoggerMixin):
         try:
             prompt = self._build_pattern_analysis_prompt(pattern_description, detected_features)
             
-            response = await self._call_ollama(prompt)
+            response = await self._call_ollama(prompt, Priority.BACKGROUND, TASK_ANALYSIS)
             
             self.logger.info("Pattern analysis generated successfully")
             return response
@@ -84,7 +230,7 @@ class OllamaService(LoggerMixin):
         try:
             prompt = self._build_learning_tip_prompt(topic, user_level, previous_topics)
             
-            response = await self._call_ollama(prompt)
+            response = await self._call_ollama(prompt, Priority.STANDARD, TASK_TIP)
             
             self.logger.info("Learning tip generated successfully")
             return response
@@ -93,31 +239,478 @@ class OllamaService(LoggerMixin):
             self.logger.error("Failed to generate learning tip", error=str(e))
             return "I apologize, but I couldn't generate a learning tip at this time. Please try again later."
     
-    async def _call_ollama(self, prompt: str) -> str:
-        """Make a call to Ollama API."""
+    def stream_explanation(
+        self,
+        question: str,
+        correct_answer: str,
+        user_answer: Optional[str] = None,
+        context: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Stream an explanation for a trivia question token by token."""
+        prompt = self._build_explanation_prompt(question, correct_answer, user_answer, context)
+        return self._stream_ollama(prompt, TASK_EXPLANATION)
+    
+    def stream_hint(
+        self,
+        question: str,
+        difficulty_level: int,
+        category: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Stream a hint for a trivia question token by token."""
+        prompt = self._build_hint_prompt(question, difficulty_level, category)
+        return self._stream_ollama(prompt, TASK_HINT)
+    
+    def stream_pattern_analysis(
+        self,
+        pattern_description: str,
+        detected_features: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """Stream an analysis of a Kolam pattern token by token."""
+        prompt = self._build_pattern_analysis_prompt(pattern_description, detected_features)
+        return self._stream_ollama(prompt, TASK_ANALYSIS)
+    
+    def stream_learning_tip(
+        self,
+        topic: str,
+        user_level: int,
+        previous_topics: Optional[List[str]] = None
+    ) -> AsyncIterator[str]:
+        """Stream a learning tip for a specific topic token by token."""
+        prompt = self._build_learning_tip_prompt(topic, user_level, previous_topics)
+        return self._stream_ollama(prompt, TASK_TIP)
+    
+    def build_prompt(self, task: str, **fields: Any) -> str:
+        """Build the prompt for a task from its fields (for batch jobs)."""
+        builders = {
+            TASK_HINT: self._build_hint_prompt,
+            TASK_EXPLANATION: self._build_explanation_prompt,
+            TASK_ANALYSIS: self._build_pattern_analysis_prompt,
+            TASK_TIP: self._build_learning_tip_prompt,
+        }
+        return builders[task](**fields)
+    
+    async def generate_batch(
+        self,
+        prompts: Sequence[str],
+        task: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        checkpoint_path: Optional[str] = None,
+        priority: Priority = Priority.BACKGROUND
+    ) -> List[Optional[str]]:
+        """Generate completions for many prompts, returning results in order.
+        
+        At most `concurrency` prompts are in flight (by default the combined
+        capacity of all backends). With a checkpoint path every completion is
+        appended to a JSONL file as soon as it arrives, and completions found
+        there are reused, so an interrupted job resumes where it stopped.
+        Failed prompts yield None and are retried on the next run.
+        """
+        model = self.model_for(task)
+        keys = [
+            hashlib.sha256(f"{model}\0{task}\0{prompt}".encode("utf-8")).hexdigest()[:16]
+            for prompt in prompts
+        ]
+        results: List[Optional[str]] = [None] * len(prompts)
+        
+        checkpoint = Path(checkpoint_path) if checkpoint_path else None
+        if checkpoint is not None:
+            for index, response in self._load_checkpoint(checkpoint, keys).items():
+                results[index] = response
+        
+        pending = [index for index, result in enumerate(results) if result is None]
+        if concurrency is None:
+            concurrency = sum(backend.scheduler.max_in_flight for backend in self.router.backends)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        failed = 0
+        
+        self.logger.info(
+            "Batch generation started",
+            total=len(prompts), resumed=len(prompts) - len(pending), concurrency=concurrency
+        )
+        
+        checkpoint_file = None
+        if checkpoint is not None:
+            checkpoint.parent.mkdir(parents=True, exist_ok=True)
+            checkpoint_file = open(checkpoint, "a", encoding="utf-8")
+        
+        async def run(index: int):
+            nonlocal failed
+            async with semaphore:
+                try:
+                    response = await self._generate(prompts[index], priority, task)
+                except OllamaError as e:
+                    failed += 1
+                    self.logger.warning("Batch prompt failed", index=index, error=str(e))
+                    return
+            
+            results[index] = response
+            if checkpoint_file is not None:
+                checkpoint_file.write(json.dumps({"index": index, "key": keys[index], "response": response}) + "\n")
+                checkpoint_file.flush()
+        
+        try:
+            await asyncio.gather(*[run(index) for index in pending])
+        finally:
+            if checkpoint_file is not None:
+                checkpoint_file.close()
+        
+        self.logger.info(
+            "Batch generation finished",
+            total=len(prompts), generated=len(pending) - failed, failed=failed
+        )
+        return results
+    
+    @staticmethod
+    def _load_checkpoint(path: Path, keys: Sequence[str]) -> Dict[int, str]:
+        """Read completed entries that still match the batch's prompts."""
+        done: Dict[int, str] = {}
+        if not path.exists():
+            return done
+        
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash can leave a torn final line
+                    continue
+                index = entry.get("index")
+                if isinstance(index, int) and 0 <= index < len(keys) and entry.get("key") == keys[index]:
+                    done[index] = entry["response"]
+        return done
+    
+    def _request_payload(self, prompt: str, stream: bool, task: Optional[str] = None) -> Dict[str, Any]:
+        """Build the body of an Ollama generate request.
+        
+        The task's fixed instructions go in "system" ahead of the variable
+        prompt, and keep_alive keeps the model loaded between requests.
+        """
+        payload = {
+            "model": self.model_for(task),
+            "prompt": prompt,
+            "stream": stream,
+            "keep_alive": settings.ollama_keep_alive,
+            "options": {
+                "temperature": 0.7,
+                "top_p": 0.9,
+                "num_predict": 500
+            }
+        }
+        if task in SYSTEM_PROMPTS:
+            payload["system"] = SYSTEM_PROMPTS[task]
+        return payload
+    
+    def _record_usage(self, task: Optional[str], result: Dict[str, Any]):
+        """Record token counts and timings Ollama reports with a completion."""
+        label = task or "default"
+        prompt_tokens = result.get("prompt_eval_count")
+        completion_tokens = result.get("eval_count")
+        
+        if prompt_tokens is not None:
+            LLM_PROMPT_TOKENS.labels(label).observe(prompt_tokens)
+        if completion_tokens is not None:
+            LLM_COMPLETION_TOKENS.labels(label).observe(completion_tokens)
+        if result.get("prompt_eval_duration") is not None:
+            LLM_PROMPT_EVAL_SECONDS.labels(label).observe(result["prompt_eval_duration"] / 1e9)
+        if result.get("total_duration") is not None:
+            LLM_GENERATION_SECONDS.labels(label).observe(result["total_duration"] / 1e9)
+        
+        self.logger.debug(
+            "Ollama usage",
+            task=label,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            prompt_eval_ms=(result.get("prompt_eval_duration") or 0) / 1e6,
+            load_ms=(result.get("load_duration") or 0) / 1e6,
+            total_ms=(result.get("total_duration") or 0) / 1e6
+        )
+    
+    async def warm_up(self):
+        """Load every configured model on every backend that serves it.
+        
+        An empty generate request only loads the model, so the first real
+        request does not pay the load time.
+        """
+        models = {self.model, *self.task_models.values()}
+        requests = [
+            (backend, model)
+            for model in models for backend in self.router.backends if backend.serves(model)
+        ]
+        
+        async def load(backend: Backend, model: str):
+            try:
+                response = await self.client.post(
+                    f"{backend.url}/api/generate",
+                    json={"model": model, "keep_alive": settings.ollama_keep_alive}
+                )
+                response.raise_for_status()
+            except Exception as e:
+                self.logger.warning("Model warm-up failed", backend=backend.url, model=model, error=str(e))
+        
+        await asyncio.gather(*[load(backend, model) for backend, model in requests])
+    
+    async def _stream_ollama(self, prompt: str, task: Optional[str] = None) -> AsyncIterator[str]:
+        """Call Ollama in streaming mode, yielding text as it is generated.
+        
+        Ollama answers with newline-delimited JSON objects, each carrying the
+        next piece of the response, until one arrives with "done" set. A
+        failure, before or after the first token, raises OllamaStreamError
+        so callers never mistake a cut-off answer for a complete one.
+        """
+        payload = self._request_payload(prompt, stream=True, task=task)
+        received = False
+        backend = None
+        started = time.monotonic()
+        first_token = None
+        try:
+            backend = self.router.choose(payload["model"])
+            async with backend.scheduler.slot(Priority.INTERACTIVE, self._queue_timeout(Priority.INTERACTIVE)):
+                started = time.monotonic()
+                async with self.client.stream(
+                    "POST",
+                    f"{backend.url}/api/generate",
+                    json=payload
+                ) as response:
+                    if response.status_code != 200:
+                        self.logger.error("Ollama API error", status_code=response.status_code, backend=backend.url)
+                        self.router.record(backend, None, response.status_code < 500)
+                        raise OllamaStreamError("I apologize, but I couldn't process your request at this time.")
+                    
+                    async for line in response.aiter_lines():
+                        if not line.strip():
+                            continue
+                        chunk = json.loads(line)
+                        if chunk.get("error"):
+                            raise RuntimeError(chunk["error"])
+                        
+                        text = chunk.get("response", "")
+                        if text:
+                            if first_token is None:
+                                first_token = time.monotonic() - started
+                            received = True
+                            yield text
+                        if chunk.get("done"):
+                            self._record_usage(task, chunk)
+                            break
+                
+                # Stream length depends on the answer, so time to first token
+                # is what reflects how responsive the backend is
+                self.router.record(backend, first_token, True)
+                        
+        except OllamaStreamError:
+            raise
+        except (SchedulerRejectedError, CircuitOpenError) as e:
+            self.logger.warning("Ollama stream shed", error=str(e))
+            raise OllamaStreamError(BUSY_MESSAGE) from e
+        except httpx.TimeoutException as e:
+            self.logger.error("Ollama API stream timeout", partial=received)
+            self.router.record(backend, time.monotonic() - started, False)
+            raise OllamaStreamError("I apologize, but the request timed out. Please try again later.") from e
+        except Exception as e:
+            self.logger.error("Ollama API stream failed", error=str(e), partial=received)
+            if backend is not None:
+                self.router.record(backend, None, False)
+            raise OllamaStreamError("I apologize, but I couldn't process your request at this time.") from e
+        finally:
+            if backend is not None:
+                self.router.release(backend)
+    
+    def _queue_timeout(self, priority: Priority) -> Optional[float]:
+        """How long a request may wait for a slot; background work waits indefinitely."""
+        if priority == Priority.BACKGROUND:
+            return None
+        return settings.ollama_queue_timeout_seconds
+    
+    async def _generate(
+        self,
+        prompt: str,
+        priority: Priority = Priority.STANDARD,
+        task: Optional[str] = None
+    ) -> str:
+        """Call Ollama and return the completion, raising OllamaError on failure.
+        
+        Identical concurrent requests (same model, prompt and options) are
+        coalesced into a single upstream call whose result they all share.
+        The upstream call is admitted by the scheduler, so coalesced requests
+        occupy a single slot.
+        """
+        payload = self._request_payload(prompt, stream=False, task=task)
+        key = hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+        
+        OLLAMA_REQUESTS.inc()
+        result, shared = await self._single_flight.do(
+            key, lambda: self._scheduled_generate(payload, priority, task)
+        )
+        if shared:
+            OLLAMA_COALESCED_REQUESTS.inc()
+            self.logger.debug("Ollama request coalesced", key=key[:12])
+        return result
+    
+    async def _scheduled_generate(
+        self,
+        payload: Dict[str, Any],
+        priority: Priority,
+        task: Optional[str] = None
+    ) -> str:
+        """Route the request to a backend, wait for a slot there and send it.
+        
+        A request that fails because its backend is down or erroring is
+        retried once on another backend. When hedging is enabled, the first
+        attempt is also duplicated to a second backend if it runs past the
+        hedge delay.
+        """
+        tried = set()
+        last_error = None
+        attempts = min(2, len(self.router.backends))
+        for attempt in range(attempts):
+            try:
+                backend = self.router.choose(payload["model"], exclude=tried)
+            except (LookupError, CircuitOpenError) as e:
+                if last_error:
+                    raise last_error
+                if isinstance(e, CircuitOpenError):
+                    raise OllamaUnavailableError(str(e))
+                raise OllamaError(str(e))
+            tried.add(backend.url)
+            
+            try:
+                hedge_delay = self._hedge_delay(payload["model"], priority) if attempt == 0 else None
+                if hedge_delay is not None:
+                    return await self._hedged_generate(backend, payload, priority, task, tried, hedge_delay)
+                return await self._attempt(backend, payload, priority, task)
+            except OllamaBackendError as e:
+                last_error = e
+                self.logger.warning("Ollama backend failed", backend=backend.url, error=str(e))
+        
+        raise last_error
+    
+    async def _attempt(
+        self,
+        backend: Backend,
+        payload: Dict[str, Any],
+        priority: Priority,
+        task: Optional[str] = None
+    ) -> str:
+        """Wait for a slot on one backend and send the request there."""
+        try:
+            async with backend.scheduler.slot(priority, self._queue_timeout(priority)):
+                return await self._post_generate(backend, payload, task)
+        except SchedulerRejectedError as e:
+            raise OllamaOverloadedError(str(e))
+        finally:
+            self.router.release(backend)
+    
+    async def _hedged_generate(
+        self,
+        backend: Backend,
+        payload: Dict[str, Any],
+        priority: Priority,
+        task: Optional[str],
+        tried: Set[str],
+        delay: float
+    ) -> str:
+        """Send the request to a second backend if the first is slow.
+        
+        Whichever answers first wins and the other request is cancelled. A
+        failure of one attempt falls back to the other.
+        """
+        primary = asyncio.ensure_future(self._attempt(backend, payload, priority, task))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return primary.result()
+        
+        try:
+            second = self.router.choose(payload["model"], exclude=tried)
+        except (LookupError, CircuitOpenError):
+            return await primary
+        tried.add(second.url)
+        
+        OLLAMA_HEDGED_REQUESTS.inc()
+        self.logger.debug("Ollama request hedged", primary=backend.url, hedge=second.url, delay=delay)
+        hedge = asyncio.ensure_future(self._attempt(second, payload, priority, task))
+        
+        pending = {primary, hedge}
+        error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    if attempt.exception() is None:
+                        if attempt is hedge:
+                            OLLAMA_HEDGE_WINS.inc()
+                        return attempt.result()
+                    error = attempt.exception()
+            raise error
+        finally:
+            for attempt in pending:
+                attempt.cancel()
+    
+    def _hedge_delay(self, model: str, priority: Priority) -> Optional[float]:
+        """How long to wait before hedging, or None to not hedge.
+        
+        Background work is never hedged, and hedging waits until enough
+        latencies have been seen to estimate the percentile.
+        """
+        if not settings.ollama_hedge_enabled or priority == Priority.BACKGROUND:
+            return None
+        if len(self.router.backends) < 2:
+            return None
+        
+        latencies = sorted(self._latencies.get(model, ()))
+        if len(latencies) < self.HEDGE_MIN_SAMPLES:
+            return None
+        index = min(len(latencies) - 1, int(settings.ollama_hedge_percentile * len(latencies)))
+        return max(settings.ollama_hedge_min_delay_seconds, latencies[index])
+    
+    async def _post_generate(
+        self,
+        backend: Backend,
+        payload: Dict[str, Any],
+        task: Optional[str] = None
+    ) -> str:
+        """Send one non-streaming generate request to a backend."""
+        OLLAMA_UPSTREAM_REQUESTS.inc()
+        started = time.monotonic()
         try:
             response = await self.client.post(
-                f"{self.base_url}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.7,
-                        "top_p": 0.9,
-                        "max_tokens": 500
-                    }
-                }
+                f"{backend.url}/api/generate",
+                json=payload
             )
-            
-            if response.status_code == 200:
-                result = response.json()
-                return result.get("response", "").strip()
-            else:
-                self.logger.error("Ollama API error", status_code=response.status_code)
-                return "I apologize, but I couldn't process your request at this time."
-                
         except httpx.TimeoutException:
+            self.router.record(backend, time.monotonic() - started, False)
+            raise OllamaTimeoutError("Ollama request timed out")
+        except httpx.HTTPError as e:
+            self.router.record(backend, None, False)
+            raise OllamaBackendError(f"Ollama request failed: {e}")
+        
+        if response.status_code >= 500:
+            self.router.record(backend, None, False)
+            raise OllamaBackendError(f"Ollama API error: status {response.status_code}")
+        
+        latency = time.monotonic() - started
+        self.router.record(backend, latency, True)
+        if response.status_code != 200:
+            raise OllamaError(f"Ollama API error: status {response.status_code}")
+        
+        self._latencies.setdefault(payload["model"], deque(maxlen=self.HEDGE_WINDOW)).append(latency)
+        
+        result = response.json()
+        self._record_usage(task, result)
+        return result.get("response", "").strip()
+    
+    async def _call_ollama(
+        self,
+        prompt: str,
+        priority: Priority = Priority.STANDARD,
+        task: Optional[str] = None
+    ) -> str:
+        """Make a call to Ollama API."""
+        try:
+            return await self._generate(prompt, priority, task)
+        except (OllamaOverloadedError, OllamaUnavailableError) as e:
+            self.logger.warning("Ollama request shed", error=str(e))
+            return BUSY_MESSAGE
+        except OllamaTimeoutError:
             self.logger.error("Ollama API timeout")
             return "I apologize, but the request timed out. Please try again later."
         except Exception as e:
@@ -132,9 +725,7 @@ class OllamaService(LoggerMixin):
         context: Optional[str] = None
     ) -> str:
         """Build prompt for generating explanations."""
-        prompt = f"""You are an expert teacher explaining Kolam (traditional Indian art) concepts. 
-
-Question: {question}
+        prompt = f"""Question: {question}
 Correct Answer: {correct_answer}"""
 
         if user_answer:
@@ -143,18 +734,7 @@ Correct Answer: {correct_answer}"""
         if context:
             prompt += f"\nContext: {context}"
         
-        prompt += """
-
-Please provide a clear, educational explanation that:
-1. Explains why the correct answer is right
-2. Provides cultural and historical context about Kolam
-3. Includes interesting facts or details
-4. Is appropriate for learners of all levels
-5. Keeps the explanation concise but informative
-
-Explanation:"""
-        
-        return prompt
+        return prompt + "\n\nExplanation:"
     
     def _build_hint_prompt(
         self,
@@ -163,26 +743,13 @@ Explanation:"""
         category: Optional[str] = None
     ) -> str:
         """Build prompt for generating hints."""
-        prompt = f"""You are a helpful tutor providing hints for Kolam learning questions.
-
-Question: {question}
+        prompt = f"""Question: {question}
 Difficulty Level: {difficulty_level}/5"""
 
         if category:
             prompt += f"\nCategory: {category}"
         
-        prompt += """
-
-Please provide a helpful hint that:
-1. Guides the learner toward the correct answer without giving it away
-2. Is appropriate for the difficulty level
-3. Includes relevant Kolam cultural context
-4. Encourages further learning
-5. Is encouraging and supportive
-
-Hint:"""
-        
-        return prompt
+        return prompt + "\n\nHint:"
     
     def _build_pattern_analysis_prompt(
         self,
@@ -190,22 +757,10 @@ Hint:"""
         detected_features: Dict[str, Any]
     ) -> str:
         """Build prompt for analyzing Kolam patterns."""
-        prompt = f"""You are an expert in traditional Indian Kolam art analyzing a pattern.
-
-Pattern Description: {pattern_description}
-Detected Features: {json.dumps(detected_features, indent=2)}
-
-Please provide an analysis that includes:
-1. Pattern type and style classification
-2. Cultural significance and traditional meaning
-3. Geometric and artistic elements
-4. Difficulty level assessment
-5. Suggestions for learning or creating similar patterns
-6. Historical or regional context if applicable
+        return f"""Pattern Description: {pattern_description}
+Detected Features: {json.dumps(detected_features, indent=2, sort_keys=True)}
 
 Analysis:"""
-        
-        return prompt
     
     def _build_learning_tip_prompt(
         self,
@@ -214,46 +769,48 @@ Analysis:"""
         previous_topics: Optional[List[str]] = None
     ) -> str:
         """Build prompt for generating learning tips."""
-        prompt = f"""You are a Kolam art instructor providing personalized learning tips.
-
-Current Topic: {topic}
+        prompt = f"""Current Topic: {topic}
 User Level: {user_level}/5"""
 
         if previous_topics:
             prompt += f"\nPrevious Topics Covered: {', '.join(previous_topics)}"
         
-        prompt += """
-
-Please provide a learning tip that:
-1. Is tailored to the user's level
-2. Connects to previous learning if applicable
-3. Provides practical advice for learning Kolam
-4. Includes cultural context
-5. Encourages practice and exploration
-6. Is motivating and supportive
-
-Learning Tip:"""
-        
-        return prompt
+        return prompt + "\n\nLearning Tip:"
     
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Close an injected HTTP client; the shared pool is closed at shutdown."""
+        if self._client is not None:
+            await self._client.aclose()
 
 
 class AILearningAssistant(LoggerMixin):
-    """AI-powered learning assistant using Ollama."""
+    """AI-powered learning assistant using Ollama.
+
+    Hints and explanations for a stored question are served from the
+    persisted question content cache and only generated on a miss; without
+    a question id they are generated on every call.
+    """
     
-    def __init__(self):
-        self.ollama_service = OllamaService()
+    def __init__(
+        self,
+        ollama_service: Optional[OllamaService] = None,
+        session_factory: Callable[[], Session] = SessionLocal
+    ):
+        self.ollama_service = ollama_service or OllamaService()
+        self.session_factory = session_factory
     
     async def get_question_explanation(
         self,
-        question_id: int,
+        question_id: Optional[int],
         question_data: Dict[str, Any],
         user_answer: Optional[str] = None
     ) -> str:
         """Get explanation for a trivia question."""
+        if question_id is not None:
+            cached = await self._from_content_cache(question_id, TASK_EXPLANATION, user_answer)
+            if cached is not None:
+                return cached
+
         return await self.ollama_service.generate_explanation(
             question=question_data["question_text"],
             correct_answer=question_data["correct_answer"],
@@ -263,15 +820,74 @@ class AILearningAssistant(LoggerMixin):
     
     async def get_question_hint(
         self,
-        question_data: Dict[str, Any]
+        question_data: Dict[str, Any],
+        question_id: Optional[int] = None
     ) -> str:
         """Get hint for a trivia question."""
+        if question_id is not None:
+            cached = await self._from_content_cache(question_id, TASK_HINT)
+            if cached is not None:
+                return cached
+
         return await self.ollama_service.generate_hint(
             question=question_data["question_text"],
             difficulty_level=question_data["difficulty_level"],
             category=question_data.get("category")
         )
     
+    async def _from_content_cache(
+        self,
+        question_id: int,
+        task: str,
+        user_answer: Optional[str] = None
+    ) -> Optional[str]:
+        """Content for a stored question through QuestionContentService.
+
+        Returns None when the question is not in the database (or the
+        database is unavailable), so the caller generates directly.
+        """
+        # Imported here because the content service builds on this module
+        from src.services.question_content_service import QuestionContentService
+
+        db = self.session_factory()
+        try:
+            question = db.query(TriviaQuestion).filter(TriviaQuestion.id == question_id).first()
+            if question is None:
+                return None
+            content_service = QuestionContentService(db, self)
+            if task == TASK_HINT:
+                return await content_service.get_hint(question)
+            return await content_service.get_explanation(question, user_answer)
+        except SQLAlchemyError as e:
+            self.logger.warning("Question content cache unavailable", question_id=question_id, error=str(e))
+            return None
+        finally:
+            db.close()
+    
+    def stream_question_explanation(
+        self,
+        question_data: Dict[str, Any],
+        user_answer: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Stream the explanation for a trivia question."""
+        return self.ollama_service.stream_explanation(
+            question=question_data["question_text"],
+            correct_answer=question_data["correct_answer"],
+            user_answer=user_answer,
+            context=question_data.get("explanation")
+        )
+    
+    def stream_question_hint(
+        self,
+        question_data: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """Stream the hint for a trivia question."""
+        return self.ollama_service.stream_hint(
+            question=question_data["question_text"],
+            difficulty_level=question_data["difficulty_level"],
+            category=question_data.get("category")
+        )
+    
     async def analyze_user_kolam(
         self,
         kolam_data: Dict[str, Any]
@@ -307,3 +923,8 @@ class AILearningAssistant(LoggerMixin):
         """Close the AI service."""
         await self.ollama_service.close()
 
+
+@lru_cache()
+def get_ai_learning_assistant() -> AILearningAssistant:
+    """Get the application-wide AI learning assistant."""
+    return AILearningAssistant()
@@ -0,0 +1,509 @@
+import json
+import random
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.core.config import settings
+from src.core.logging import LoggerMixin
+from src.services.ai.svg_emitter import render_svg
+
+
+# Segment kinds inside a cell: each one joins two edge midpoints around the dot
+TOP_RIGHT, RIGHT_BOTTOM, BOTTOM_LEFT, LEFT_TOP = range(4)
+
+SYMMETRIES = ("none", "bilateral", "rotational", "radial")
+
+Point = Tuple[int, int]
+Transform = Callable[[int, int], Point]
+
+# (swap axes, mirror x, mirror y) of each grid symmetry; the four that swap
+# axes only map a square grid onto itself
+GRID_SYMMETRIES = {
+    "identity": (False, False, False),
+    "mirror_x": (False, True, False),
+    "mirror_y": (False, False, True),
+    "rot90": (True, True, False),
+    "rot180": (False, True, True),
+    "rot270": (True, False, True),
+    "transpose": (True, False, False),
+    "anti_transpose": (True, True, True),
+}
+
+
+class PulliGrid:
+    """Mirror-curve model of a dot-grid (pulli) Kolam.
+
+    Every dot sits in a cell whose four edge midpoints are joined by four
+    diagonal segments. At each internal cell edge the curve either crosses
+    straight through or, if a mirror is placed on that edge, bounces back.
+    The outer border always reflects. A configuration of mirrors is a sikku
+    (single-loop) Kolam when all segments form one closed loop.
+
+    Coordinates are doubled so every dot and edge midpoint is an integer
+    point: the dot of cell (row, col) is at (2 * col + 1, 2 * row + 1).
+    """
+
+    def __init__(self, rows: int, cols: int):
+        self.rows = rows
+        self.cols = cols
+        self.width = 2 * cols
+        self.height = 2 * rows
+        self.segment_count = 4 * rows * cols
+
+        # Internal edges as (midpoint, crossing pairs, mirror pairs)
+        self.edges: List[Tuple[Point, List[Tuple[int, int]], List[Tuple[int, int]]]] = []
+        self.boundary_pairs: List[Tuple[int, int, Point]] = []
+        self._build()
+
+        self.edge_index = {edge[0]: index for index, edge in enumerate(self.edges)}
+
+    def segment(self, row: int, col: int, kind: int) -> int:
+        """Index of a segment in a cell."""
+        return 4 * (row * self.cols + col) + kind
+
+    def segment_endpoints(self, segment: int) -> Tuple[Point, Point]:
+        """The two edge midpoints a segment joins."""
+        cell, kind = divmod(segment, 4)
+        row, col = divmod(cell, self.cols)
+        x, y = 2 * col + 1, 2 * row + 1
+        top, right, bottom, left = (x, y - 1), (x + 1, y), (x, y + 1), (x - 1, y)
+        return ((top, right), (right, bottom), (bottom, left), (left, top))[kind]
+
+    def _build(self):
+        """Precompute how segments connect across every cell edge."""
+        seg = self.segment
+
+        for row in range(self.rows):
+            for col in range(self.cols):
+                x, y = 2 * col + 1, 2 * row + 1
+
+                if col + 1 < self.cols:
+                    self.edges.append((
+                        (x + 1, y),
+                        [(seg(row, col, TOP_RIGHT), seg(row, col + 1, BOTTOM_LEFT)),
+                         (seg(row, col, RIGHT_BOTTOM), seg(row, col + 1, LEFT_TOP))],
+                        [(seg(row, col, TOP_RIGHT), seg(row, col, RIGHT_BOTTOM)),
+                         (seg(row, col + 1, LEFT_TOP), seg(row, col + 1, BOTTOM_LEFT))]
+                    ))
+                else:
+                    self.boundary_pairs.append((seg(row, col, TOP_RIGHT), seg(row, col, RIGHT_BOTTOM), (x + 1, y)))
+
+                if row + 1 < self.rows:
+                    self.edges.append((
+                        (x, y + 1),
+                        [(seg(row, col, RIGHT_BOTTOM), seg(row + 1, col, LEFT_TOP)),
+                         (seg(row, col, BOTTOM_LEFT), seg(row + 1, col, TOP_RIGHT))],
+                        [(seg(row, col, RIGHT_BOTTOM), seg(row, col, BOTTOM_LEFT)),
+                         (seg(row + 1, col, TOP_RIGHT), seg(row + 1, col, LEFT_TOP))]
+                    ))
+                else:
+                    self.boundary_pairs.append((seg(row, col, RIGHT_BOTTOM), seg(row, col, BOTTOM_LEFT), (x, y + 1)))
+
+                if row == 0:
+                    self.boundary_pairs.append((seg(row, col, TOP_RIGHT), seg(row, col, LEFT_TOP), (x, y - 1)))
+                if col == 0:
+                    self.boundary_pairs.append((seg(row, col, BOTTOM_LEFT), seg(row, col, LEFT_TOP), (x - 1, y)))
+
+    def transforms(self, symmetry: str) -> List[Transform]:
+        """Point maps of the symmetry group for a constraint on this grid."""
+        square = self.width == self.height
+        if symmetry == "none":
+            names = ["identity"]
+        elif symmetry == "bilateral":
+            names = ["identity", "mirror_x"]
+        elif symmetry == "rotational":
+            names = ["identity", "rot90", "rot180", "rot270"] if square else ["identity", "rot180"]
+        elif symmetry == "radial":
+            names = list(GRID_SYMMETRIES) if square else ["identity", "mirror_x", "mirror_y", "rot180"]
+        else:
+            raise ValueError(f"Unknown symmetry: {symmetry}")
+        return [self._transform(*GRID_SYMMETRIES[name]) for name in names]
+
+    def _transform(self, swap: bool, flip_x: bool, flip_y: bool) -> Transform:
+        """Point map that optionally swaps the axes, then mirrors either one."""
+        extent_x, extent_y = (self.height, self.width) if swap else (self.width, self.height)
+
+        def apply(x: int, y: int) -> Point:
+            if swap:
+                x, y = y, x
+            return (extent_x - x if flip_x else x, extent_y - y if flip_y else y)
+
+        return apply
+
+    def edge_orbits(self, symmetry: str) -> List[List[int]]:
+        """Group internal edges that a symmetry forces to share a mirror state."""
+        transforms = self.transforms(symmetry)
+        seen = set()
+        orbits = []
+
+        for index, (point, _, _) in enumerate(self.edges):
+            if index in seen:
+                continue
+            orbit = sorted({self.edge_index[t(*point)] for t in transforms})
+            seen.update(orbit)
+            orbits.append(orbit)
+
+        return orbits
+
+    def edge_permutations(self, symmetry: str) -> List[List[int]]:
+        """Edge index permutations for each element of a symmetry group."""
+        return [
+            [self.edge_index[t(*point)] for point, _, _ in self.edges]
+            for t in self.transforms(symmetry)
+        ]
+
+    def count_loops(self, mirrors: int) -> int:
+        """Count the closed loops drawn by a mirror bitmask."""
+        parent = list(range(self.segment_count))
+
+        def find(a: int) -> int:
+            while parent[a] != a:
+                parent[a] = parent[parent[a]]
+                a = parent[a]
+            return a
+
+        components = self.segment_count
+        pairs = [(a, b) for a, b, _ in self.boundary_pairs]
+        for index, (_, crossing, mirror) in enumerate(self.edges):
+            pairs.extend(mirror if mirrors >> index & 1 else crossing)
+
+        for a, b in pairs:
+            ra, rb = find(a), find(b)
+            if ra != rb:
+                parent[rb] = ra
+                components -= 1
+
+        return components
+
+    def trace_loop(self, mirrors: int) -> List[Point]:
+        """Edge midpoints visited by the loop through segment 0, in order."""
+        partner: Dict[Tuple[int, Point], int] = {}
+
+        def join(a: int, b: int, point: Point):
+            partner[(a, point)] = b
+            partner[(b, point)] = a
+
+        for a, b, point in self.boundary_pairs:
+            join(a, b, point)
+        for index, (point, crossing, mirror) in enumerate(self.edges):
+            for a, b in (mirror if mirrors >> index & 1 else crossing):
+                join(a, b, point)
+
+        path = []
+        segment, (entry, exit_point) = 0, self.segment_endpoints(0)
+        path.append(entry)
+        while True:
+            path.append(exit_point)
+            segment = partner[(segment, exit_point)]
+            first, second = self.segment_endpoints(segment)
+            entry, exit_point = exit_point, (second if first == exit_point else first)
+            if segment == 0:
+                break
+
+        return path[:-1]
+
+
+class _SearchState:
+    """Union-find with undo used by the backtracking search."""
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+        self.size = [1] * size
+        self.open_ends = [2] * size
+        self.history: List[Tuple[Any, ...]] = []
+        self.total = size
+
+    def find(self, a: int) -> int:
+        while self.parent[a] != a:
+            a = self.parent[a]
+        return a
+
+    def connect(self, a: int, b: int) -> bool:
+        """Join two segment ends; return False if a loop closed early."""
+        ra, rb = self.find(a), self.find(b)
+
+        if ra == rb:
+            self.history.append(("close", ra))
+            self.open_ends[ra] -= 2
+            root = ra
+        else:
+            if self.size[ra] < self.size[rb]:
+                ra, rb = rb, ra
+            self.history.append(("union", ra, rb, self.open_ends[ra]))
+            self.parent[rb] = ra
+            self.size[ra] += self.size[rb]
+            self.open_ends[ra] += self.open_ends[rb] - 2
+            root = ra
+
+        # A finished loop that does not cover every segment can never merge again
+        return not (self.open_ends[root] == 0 and self.size[root] < self.total)
+
+    def mark(self) -> int:
+        return len(self.history)
+
+    def undo(self, mark: int):
+        while len(self.history) > mark:
+            entry = self.history.pop()
+            if entry[0] == "close":
+                self.open_ends[entry[1]] += 2
+            else:
+                _, ra, rb, open_ends = entry
+                self.parent[rb] = rb
+                self.size[ra] -= self.size[rb]
+                self.open_ends[ra] = open_ends
+
+
+class PulliKolamGenerator(LoggerMixin):
+    """Search for single-loop (sikku) Kolams on a dot grid.
+
+    Mirror placements are searched by backtracking over symmetry orbits of
+    the grid edges, pruning as soon as a loop closes without covering every
+    segment. Results are deduplicated up to the grid's own symmetries and
+    memoized per grid configuration: in a bounded in-memory LRU and, for
+    unseeded searches, on disk. An unseeded search always finds designs in
+    the same order, so one entry per grid serves every max_results up to the
+    largest searched; seeded samples are only kept in memory.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_nodes: int = 50000,
+        memory_size: Optional[int] = None
+    ):
+        self.cache_dir = Path(cache_dir or settings.pulli_kolam_cache_dir)
+        self.max_nodes = max_nodes
+        self.memory_size = memory_size or settings.pulli_kolam_memory_cache_size
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def generate(
+        self,
+        rows: int,
+        cols: int,
+        symmetry: str = "none",
+        max_results: int = 20,
+        seed: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Find up to max_results distinct sikku Kolams for a grid.
+
+        With seed=None the search is deterministic and exhaustive up to the
+        node budget; with a seed the branch order is randomized to sample
+        different designs on large grids. Blocking; call from a worker thread
+        in async code.
+        """
+        if rows < 1 or cols < 1:
+            raise ValueError("Grid must have at least one row and one column")
+        if symmetry not in SYMMETRIES:
+            raise ValueError(f"Unknown symmetry: {symmetry}")
+
+        key = f"{rows}x{cols}-{symmetry}"
+        if seed is not None:
+            key += f"-{max_results}-seed{seed}"
+
+        entry = self._recall(key)
+        if entry is None and seed is None:
+            entry = self._load(key)
+            if entry is not None:
+                self._remember(key, entry)
+
+        if entry is not None and self._covers(entry, max_results):
+            return self._trim(entry["result"], max_results)
+
+        result = self._search(rows, cols, symmetry, max_results, seed)
+        entry = {"max_results": max_results, "result": result}
+        self._remember(key, entry)
+        if seed is None:
+            self._save(key, entry)
+        return result
+
+    @staticmethod
+    def _covers(entry: Dict[str, Any], max_results: int) -> bool:
+        """Whether a cached search answers a request for max_results designs.
+
+        A search that stopped short of its own limit ran out of designs or
+        node budget, so asking for more would find nothing new.
+        """
+        return (
+            entry["max_results"] >= max_results
+            or len(entry["result"]["kolams"]) < entry["max_results"]
+        )
+
+    @staticmethod
+    def _trim(result: Dict[str, Any], max_results: int) -> Dict[str, Any]:
+        if len(result["kolams"]) <= max_results:
+            return result
+        return {**result, "kolams": result["kolams"][:max_results], "exhaustive": False}
+
+    def _recall(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+            return entry
+
+    def _remember(self, key: str, entry: Dict[str, Any]):
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def _search(
+        self,
+        rows: int,
+        cols: int,
+        symmetry: str,
+        max_results: int,
+        seed: Optional[int]
+    ) -> Dict[str, Any]:
+        """Backtracking search over mirror orbits with early loop pruning."""
+        started = time.perf_counter()
+        grid = PulliGrid(rows, cols)
+        orbits = grid.edge_orbits(symmetry)
+        canonical_perms = grid.edge_permutations("radial")
+        rng = random.Random(seed) if seed is not None else None
+
+        state = _SearchState(grid.segment_count)
+        for a, b, _ in grid.boundary_pairs:
+            state.connect(a, b)
+
+        found: Dict[int, int] = {}
+        nodes = 0
+        exhausted = True
+
+        def canonical(mirrors: int) -> int:
+            return min(
+                sum(1 << perm[i] for i in range(len(perm)) if mirrors >> i & 1)
+                for perm in canonical_perms
+            )
+
+        def place(orbit: List[int], use_mirror: bool) -> bool:
+            for edge in orbit:
+                _, crossing, mirror = grid.edges[edge]
+                for a, b in (mirror if use_mirror else crossing):
+                    if not state.connect(a, b):
+                        return False
+            return True
+
+        def visit(depth: int, mirrors: int) -> bool:
+            nonlocal nodes, exhausted
+            nodes += 1
+            if nodes > self.max_nodes:
+                exhausted = False
+                return False
+
+            if depth == len(orbits):
+                # Every early loop closure was pruned, so this is a single loop
+                found.setdefault(canonical(mirrors), mirrors)
+                return len(found) < max_results
+
+            choices = [False, True]
+            if rng is not None:
+                rng.shuffle(choices)
+
+            for use_mirror in choices:
+                mark = state.mark()
+                if place(orbits[depth], use_mirror):
+                    bits = sum(1 << edge for edge in orbits[depth]) if use_mirror else 0
+                    if not visit(depth + 1, mirrors | bits):
+                        state.undo(mark)
+                        return False
+                state.undo(mark)
+
+            return True
+
+        completed = visit(0, 0)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        kolams = [
+            {
+                "mirrors": [list(grid.edges[i][0]) for i in range(len(grid.edges)) if mirrors >> i & 1],
+                "loop": [list(point) for point in grid.trace_loop(mirrors)]
+            }
+            for mirrors in found.values()
+        ]
+
+        self.logger.info(
+            "Pulli Kolam search finished",
+            rows=rows,
+            cols=cols,
+            symmetry=symmetry,
+            found=len(kolams),
+            nodes=nodes,
+            elapsed_ms=round(elapsed_ms, 2)
+        )
+
+        return {
+            "rows": rows,
+            "cols": cols,
+            "symmetry": symmetry,
+            "kolams": kolams,
+            "nodes_explored": nodes,
+            "exhaustive": completed and exhausted,
+            "search_time_ms": elapsed_ms
+        }
+
+    def render_svg(self, rows: int, cols: int, kolam: Dict[str, Any], spacing: float = 40) -> str:
+        """Render a generated Kolam as compact SVG: dots plus one smooth loop."""
+        half = spacing / 2
+        loop = [tuple(point) for point in kolam["loop"]]
+
+        # Each step goes around one dot; bending towards the cell corner keeps
+        # the curve tangent-continuous through every edge midpoint
+        controls = []
+        for p, q in zip(loop, loop[1:] + loop[:1]):
+            horizontal, vertical = (p, q) if p[0] % 2 else (q, p)
+            cx, cy = horizontal[0], vertical[1]
+            controls.append(((p[0] + q[0] - cx) * half, (p[1] + q[1] - cy) * half))
+
+        dot_style = {"stroke": "none", "stroke_width": 0, "fill": "#333333"}
+        elements: List[Dict[str, Any]] = [
+            {
+                "type": "circle",
+                "center": ((2 * col + 1) * half, (2 * row + 1) * half),
+                "radius": spacing * 0.08,
+                "style": dot_style
+            }
+            for row in range(rows) for col in range(cols)
+        ]
+        elements.append({
+            "type": "loop",
+            "points": [(x * half, y * half) for x, y in loop],
+            "controls": controls,
+            "style": {"stroke": "#8b0000", "stroke_width": 2, "fill": "none"}
+        })
+
+        return render_svg(elements, cols * spacing, rows * spacing)
+
+    def _cache_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load a persisted cache entry, if any."""
+        path = self._cache_path(key)
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning("Failed to read pulli Kolam cache", error=str(e), key=key)
+            return None
+
+    def _save(self, key: str, entry: Dict[str, Any]):
+        """Persist a cache entry for later requests."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._cache_path(key).write_text(json.dumps(entry), encoding="utf-8")
+        except OSError as e:
+            self.logger.warning("Failed to write pulli Kolam cache", error=str(e), key=key)
+
+
+@lru_cache()
+def get_pulli_kolam_generator() -> PulliKolamGenerator:
+    """Get the application-wide pulli Kolam generator."""
+    return PulliKolamGenerator()
@@ -0,0 +1,217 @@
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+Point = Tuple[float, float]
+StyleKey = Tuple[str, str, str]
+
+DEFAULT_BACKGROUND = "#fdf6e3"
+
+
+class SvgPathBuilder:
+    """Build compact SVG path data.
+
+    Coordinates are quantized to a fixed number of decimals and stored as
+    integers, every command is emitted in its relative form, repeated
+    command letters are dropped, axis-aligned lines use h/v and curves whose
+    control point mirrors the previous one use the smooth t/s shorthands.
+    """
+
+    def __init__(self, precision: int = 1):
+        self.precision = precision
+        self.scale = 10 ** precision
+        self.parts: List[str] = []
+        self._current = (0, 0)
+        self._start = (0, 0)
+        self._last_command: Optional[str] = None
+        self._last_number: Optional[str] = None
+        self._last_control: Optional[Tuple[int, int]] = None
+
+    def _quantize(self, point: Point) -> Tuple[int, int]:
+        return round(point[0] * self.scale), round(point[1] * self.scale)
+
+    def _number(self, value: int) -> str:
+        if self.precision == 0 or value % self.scale == 0:
+            return str(value // self.scale)
+        text = f"{value / self.scale:.{self.precision}f}".rstrip("0")
+        return text.replace("0.", ".", 1) if text.startswith(("0.", "-0.")) else text
+
+    def _join(self, previous: Optional[str], number: str) -> str:
+        """Separator needed between two numbers, if any."""
+        if previous is None or number.startswith("-"):
+            return ""
+        if number.startswith(".") and "." in previous:
+            return ""
+        return ","
+
+    def _emit(self, command: str, values: Sequence[int]):
+        numbers = [self._number(value) for value in values]
+
+        # Repeated commands (and l straight after m) can drop their letter
+        implicit = (
+            command == self._last_command and command != "m"
+        ) or (command == "l" and self._last_command == "m")
+
+        text = "" if implicit else command
+        previous = self._last_number if implicit else None
+        for number in numbers:
+            text += self._join(previous, number) + number
+            previous = number
+
+        self.parts.append(text)
+        self._last_command = command
+        self._last_number = previous
+
+    def _delta(self, point: Tuple[int, int]) -> Tuple[int, int]:
+        return point[0] - self._current[0], point[1] - self._current[1]
+
+    def move_to(self, point: Point):
+        target = self._quantize(point)
+        self._emit("m", self._delta(target))
+        self._current = self._start = target
+        self._last_control = None
+
+    def line_to(self, point: Point):
+        target = self._quantize(point)
+        dx, dy = self._delta(target)
+        if dx == 0 and dy == 0:
+            return
+        if dy == 0:
+            self._emit("h", (dx,))
+        elif dx == 0:
+            self._emit("v", (dy,))
+        else:
+            self._emit("l", (dx, dy))
+        self._current = target
+        self._last_control = None
+
+    def quad_to(self, control: Point, point: Point):
+        ctrl = self._quantize(control)
+        target = self._quantize(point)
+        reflected = self._reflect_last_control(("q", "t"))
+
+        if reflected == ctrl:
+            self._emit("t", self._delta(target))
+        else:
+            self._emit("q", self._delta(ctrl) + self._delta(target))
+        self._current = target
+        self._last_control = ctrl
+
+    def cubic_to(self, control1: Point, control2: Point, point: Point):
+        ctrl1 = self._quantize(control1)
+        ctrl2 = self._quantize(control2)
+        target = self._quantize(point)
+        reflected = self._reflect_last_control(("c", "s"))
+
+        if reflected == ctrl1:
+            self._emit("s", self._delta(ctrl2) + self._delta(target))
+        else:
+            self._emit("c", self._delta(ctrl1) + self._delta(ctrl2) + self._delta(target))
+        self._current = target
+        self._last_control = ctrl2
+
+    def arc_to(self, radius: float, large_arc: bool, sweep: bool, point: Point):
+        target = self._quantize(point)
+        r = round(radius * self.scale)
+        self._emit("a", (r, r, 0, int(large_arc) * self.scale, int(sweep) * self.scale) + self._delta(target))
+        self._current = target
+        self._last_control = None
+
+    def close(self):
+        self.parts.append("z")
+        self._last_command = "z"
+        self._last_number = None
+        self._current = self._start
+        self._last_control = None
+
+    def _reflect_last_control(self, commands: Tuple[str, str]) -> Optional[Tuple[int, int]]:
+        if self._last_command not in commands or self._last_control is None:
+            return None
+        cx, cy = self._current
+        lx, ly = self._last_control
+        return 2 * cx - lx, 2 * cy - ly
+
+    def d(self) -> str:
+        return "".join(self.parts)
+
+
+def add_element(path: SvgPathBuilder, element: Dict[str, Any]):
+    """Append one pattern element to a path as one or more subpaths."""
+    kind = element["type"]
+
+    if kind == "circle":
+        cx, cy = element["center"]
+        r = element["radius"]
+        path.move_to((cx - r, cy))
+        path.arc_to(r, True, False, (cx + r, cy))
+        path.arc_to(r, True, False, (cx - r, cy))
+        path.close()
+    elif kind in ("polygon", "square"):
+        points = element["points"]
+        path.move_to(points[0])
+        for point in points[1:]:
+            path.line_to(point)
+        path.close()
+    elif kind == "line":
+        path.move_to(element["start"])
+        path.line_to(element["end"])
+    elif kind == "petal":
+        path.move_to(element["start"])
+        path.quad_to(element["control1"], element["end"])
+        path.quad_to(element["control2"], element["start"])
+        path.close()
+    elif kind == "curve":
+        path.move_to(element["start"])
+        path.cubic_to(element["control1"], element["control2"], element["end"])
+    elif kind == "loop":
+        points, controls = element["points"], element["controls"]
+        path.move_to(points[0])
+        for control, point in zip(controls, list(points[1:]) + [points[0]]):
+            path.quad_to(control, point)
+        path.close()
+    else:
+        raise ValueError(f"Unsupported element type: {kind}")
+
+
+def _style_key(element: Dict[str, Any]) -> StyleKey:
+    style = element.get("style", {})
+    return (
+        str(style.get("stroke", "#000000")),
+        str(style.get("stroke_width", 1)),
+        str(style.get("fill", "none"))
+    )
+
+
+def render_svg(
+    elements: Sequence[Dict[str, Any]],
+    width: int,
+    height: int,
+    background: Optional[str] = DEFAULT_BACKGROUND,
+    precision: int = 1
+) -> str:
+    """Render pattern elements as a compact SVG document.
+
+    Elements sharing a style are merged into a single <path>, so the output
+    size grows with the geometry rather than with per-element markup.
+    """
+    groups: "OrderedDict[StyleKey, SvgPathBuilder]" = OrderedDict()
+    for element in elements:
+        key = _style_key(element)
+        if key not in groups:
+            groups[key] = SvgPathBuilder(precision)
+        add_element(groups[key], element)
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}">'
+    ]
+    if background:
+        parts.append(f'<rect width="{width}" height="{height}" fill="{background}"/>')
+
+    for (stroke, stroke_width, fill), path in groups.items():
+        attrs = f'fill="{fill}"'
+        if stroke != "none" and stroke_width not in ("0", "0.0"):
+            attrs += f' stroke="{stroke}" stroke-width="{stroke_width}" stroke-linecap="round" stroke-linejoin="round"'
+        parts.append(f'<path d="{path.d()}" {attrs}/>')
+
+    parts.append("</svg>")
+    return "".join(parts)
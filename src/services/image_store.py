@@ -0,0 +1,116 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.core.config import settings
+from src.core.logging import LoggerMixin
+
+
+class GeneratedImageStore(LoggerMixin):
+    """Content-addressed on-disk store for generated images.
+
+    Images are keyed by a hash of the prompt and generation parameters, so a
+    repeated prompt is served from disk instead of being regenerated. The
+    store is bounded by total size and evicts least recently used images.
+    """
+
+    def __init__(self, root_dir: str, max_bytes: int, extension: str = "png"):
+        self.root_dir = Path(root_dir)
+        self.max_bytes = max_bytes
+        self.extension = extension
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        self._load_existing()
+
+    @staticmethod
+    def make_key(prompt: str, model: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build the content key for a prompt, model and generation parameters."""
+        payload = json.dumps(
+            {"prompt": prompt, "model": model, "params": params or {}},
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        """Get the on-disk path for a key."""
+        return self.root_dir / f"{key}.{self.extension}"
+
+    def get(self, key: str) -> Optional[Path]:
+        """Return the stored image path for a key, or None if it is missing."""
+        with self._lock:
+            if key not in self._entries:
+                return None
+
+            path = self.path_for(key)
+            if not path.exists():
+                self._total_bytes -= self._entries.pop(key)
+                return None
+
+            # Refresh recency for LRU eviction
+            self._entries.move_to_end(key)
+            os.utime(path)
+
+        self.logger.info("Generated image cache hit", key=key)
+        return path
+
+    def put(self, key: str, data: bytes) -> Path:
+        """Store image bytes under a key and evict old images if over budget."""
+        path = self.path_for(key)
+        tmp_path = path.with_suffix(f".{self.extension}.tmp")
+
+        # Write to a temporary file first so readers never see partial images
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            if key in self._entries:
+                self._total_bytes -= self._entries.pop(key)
+            self._entries[key] = len(data)
+            self._total_bytes += len(data)
+            self._evict()
+
+        self.logger.info("Generated image stored", key=key, size=len(data))
+        return path
+
+    def _evict(self):
+        """Remove least recently used images until the store fits its budget."""
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                self.path_for(key).unlink()
+            except FileNotFoundError:
+                pass
+            self.logger.info("Generated image evicted", key=key, size=size)
+
+    def _load_existing(self):
+        """Index images already on disk, oldest first."""
+        files = sorted(
+            self.root_dir.glob(f"*.{self.extension}"),
+            key=lambda p: p.stat().st_mtime
+        )
+        for path in files:
+            size = path.stat().st_size
+            self._entries[path.stem] = size
+            self._total_bytes += size
+
+        with self._lock:
+            self._evict()
+
+
+@lru_cache()
+def get_generated_image_store() -> GeneratedImageStore:
+    """Get the application-wide generated image store."""
+    return GeneratedImageStore(
+        settings.generated_image_dir,
+        settings.generated_image_max_bytes
+    )
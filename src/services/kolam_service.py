@@ -9,6 +9,8 @@ from src.schemas import (
     KolamImageAnalysis
 )
 from src.core.logging import LoggerMixin
+from src.search.indices import KOLAM_IMAGES
+from src.search.outbox import record_search_change
 
 
 class KolamService(LoggerMixin):
@@ -40,6 +42,8 @@ class KolamService(LoggerMixin):
             is_public=kolam_data.is_public
         )
         self.db.add(db_kolam)
+        self.db.flush()
+        record_search_change(self.db, KOLAM_IMAGES, db_kolam.id)
         self.db.commit()
         self.db.refresh(db_kolam)
         
@@ -78,6 +82,7 @@ class KolamService(LoggerMixin):
             setattr(db_kolam, field, value)
         
         db_kolam.updated_at = datetime.utcnow()
+        record_search_change(self.db, KOLAM_IMAGES, image_id)
         self.db.commit()
         self.db.refresh(db_kolam)
         
@@ -100,6 +105,7 @@ class KolamService(LoggerMixin):
         db_kolam.symmetry_type = analysis.symmetry_type
         db_kolam.geometric_features = analysis.geometric_features
         db_kolam.updated_at = datetime.utcnow()
+        record_search_change(self.db, KOLAM_IMAGES, image_id)
         
         self.db.commit()
         self.db.refresh(db_kolam)
@@ -114,6 +120,7 @@ class KolamService(LoggerMixin):
             return False
         
         self.db.delete(db_kolam)
+        record_search_change(self.db, KOLAM_IMAGES, image_id)
         self.db.commit()
         
         self.logger.info("Kolam image deleted", image_id=image_id)
@@ -147,6 +154,35 @@ class KolamService(LoggerMixin):
         self.logger.info("Generated Kolam created", kolam_id=db_kolam.id, user_id=user_id)
         return db_kolam
     
+    def record_generated_image(
+        self,
+        user_id: int,
+        image_path: str,
+        prompt: str,
+        generation_params: Optional[dict] = None
+    ) -> GeneratedKolam:
+        """Record a stored generated image for a user, reusing an existing record."""
+        db_kolam = self.db.query(GeneratedKolam).filter(
+            and_(GeneratedKolam.user_id == user_id, GeneratedKolam.image_path == image_path)
+        ).first()
+        if db_kolam:
+            return db_kolam
+        
+        db_kolam = GeneratedKolam(
+            user_id=user_id,
+            pattern_type="imagen",
+            title=prompt[:255],
+            description=prompt,
+            image_path=image_path,
+            generation_params=generation_params
+        )
+        self.db.add(db_kolam)
+        self.db.commit()
+        self.db.refresh(db_kolam)
+        
+        self.logger.info("Generated image recorded", kolam_id=db_kolam.id, user_id=user_id)
+        return db_kolam
+    
     def get_generated_kolam(self, kolam_id: int, user_id: int) -> Optional[GeneratedKolam]:
         """Get generated Kolam by ID for a specific user."""
         return self.db.query(GeneratedKolam).filter(
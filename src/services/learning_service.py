@@ -3,11 +3,13 @@ from sqlalchemy import and_, func
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
-from src.db.models.models import TriviaQuestion, LearningSession
+from src.db.models.models import TriviaQuestion, LearningSession, QuestionAIContent
 from src.schemas import (
     TriviaQuestionCreate, TriviaQuestionUpdate, LearningSessionCreate, LearningSessionUpdate
 )
 from src.core.logging import LoggerMixin
+from src.search.indices import TRIVIA_QUESTIONS
+from src.search.outbox import record_search_change
 
 
 class LearningService(LoggerMixin):
@@ -32,6 +34,8 @@ class LearningService(LoggerMixin):
             tags=question_data.tags
         )
         self.db.add(db_question)
+        self.db.flush()
+        record_search_change(self.db, TRIVIA_QUESTIONS, db_question.id)
         self.db.commit()
         self.db.refresh(db_question)
         
@@ -76,6 +80,8 @@ class LearningService(LoggerMixin):
             setattr(db_question, field, value)
         
         db_question.updated_at = datetime.utcnow()
+        self._invalidate_ai_content(question_id)
+        record_search_change(self.db, TRIVIA_QUESTIONS, question_id)
         self.db.commit()
         self.db.refresh(db_question)
         
@@ -90,11 +96,21 @@ class LearningService(LoggerMixin):
         
         db_question.is_active = False
         db_question.updated_at = datetime.utcnow()
+        self._invalidate_ai_content(question_id)
+        record_search_change(self.db, TRIVIA_QUESTIONS, question_id)
         self.db.commit()
         
         self.logger.info("Trivia question deleted", question_id=question_id)
         return True
     
+    def _invalidate_ai_content(self, question_id: int):
+        """Drop precomputed hints/explanations so they are regenerated."""
+        deleted = self.db.query(QuestionAIContent).filter(
+            QuestionAIContent.question_id == question_id
+        ).delete(synchronize_session=False)
+        if deleted:
+            self.logger.info("AI content invalidated", question_id=question_id, entries=deleted)
+    
     # Learning Session operations
     def create_learning_session(
         self,
@@ -0,0 +1,256 @@
+import hashlib
+import json
+from pathlib import Path
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.core.database import SessionLocal
+from src.core.logging import LoggerMixin, get_logger
+from src.db.models.models import QuestionAIContent, TriviaQuestion
+from src.services.ai.ollama_service import (
+    AILearningAssistant,
+    EXPLANATION_PROMPT_VERSION,
+    HINT_PROMPT_VERSION,
+    OllamaError,
+    TASK_EXPLANATION,
+    TASK_HINT,
+    get_ai_learning_assistant,
+)
+
+
+logger = get_logger(__name__)
+
+KIND_HINT = TASK_HINT
+KIND_EXPLANATION = TASK_EXPLANATION
+
+PROMPT_VERSIONS = {
+    KIND_HINT: HINT_PROMPT_VERSION,
+    KIND_EXPLANATION: EXPLANATION_PROMPT_VERSION,
+}
+
+
+def normalize_answer(answer: Optional[str]) -> str:
+    """Normalize an answer the same way quiz grading does."""
+    return (answer or "").lower().strip()[:500]
+
+
+def source_hash(question: TriviaQuestion) -> str:
+    """Hash of the question fields hint and explanation prompts are built from."""
+    fields = [
+        question.question_text,
+        question.correct_answer,
+        question.options,
+        question.explanation,
+        question.difficulty_level,
+        question.category,
+    ]
+    return hashlib.sha256(json.dumps(fields, default=str).encode("utf-8")).hexdigest()
+
+
+class QuestionContentService(LoggerMixin):
+    """Serve AI hints and explanations for trivia questions from a persisted cache.
+
+    Hints and canonical explanations are the same for every learner, and
+    explanations for wrong multiple-choice answers depend only on the option
+    picked, so all of them are generated once per question, prompt version
+    and model and stored in the question_ai_content table. Entries also
+    carry the source_hash of the question as it was when generation
+    started, so text that finishes after an edit is never served for the
+    edited question.
+    """
+
+    def __init__(self, db: Session, assistant: Optional[AILearningAssistant] = None):
+        self.db = db
+        self.assistant = assistant or get_ai_learning_assistant()
+
+    def _model(self, kind: str) -> str:
+        """Model that generates this kind of content."""
+        return self.assistant.ollama_service.model_for(kind)
+
+    def get_cached(self, question: TriviaQuestion, kind: str, variant: str = "") -> Optional[str]:
+        """Get cached content for the question as it is now, the current prompt version and model."""
+        entry = self.db.query(QuestionAIContent).filter(
+            QuestionAIContent.question_id == question.id,
+            QuestionAIContent.kind == kind,
+            QuestionAIContent.variant == variant,
+            QuestionAIContent.prompt_version == PROMPT_VERSIONS[kind],
+            QuestionAIContent.model == self._model(kind),
+            QuestionAIContent.source_hash == source_hash(question)
+        ).first()
+        return entry.content if entry else None
+
+    def store(self, question_id: int, kind: str, content: str, variant: str, source: str):
+        """Persist generated content, ignoring a concurrent duplicate insert.
+
+        source is the source_hash taken before generating, not after: the
+        question may have been edited meanwhile.
+        """
+        self.db.add(QuestionAIContent(
+            question_id=question_id,
+            kind=kind,
+            variant=variant,
+            prompt_version=PROMPT_VERSIONS[kind],
+            model=self._model(kind),
+            source_hash=source,
+            content=content
+        ))
+        try:
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+
+    async def get_hint(self, question: TriviaQuestion) -> str:
+        """Get the hint for a question, generating it only on a cache miss."""
+        cached = self.get_cached(question, KIND_HINT)
+        if cached is not None:
+            return cached
+
+        try:
+            return await self._generate_hint(question)
+        except OllamaError as e:
+            self.logger.error("Failed to generate hint", question_id=question.id, error=str(e))
+            return "I apologize, but I couldn't generate a hint at this time. Please try again later."
+
+    async def get_explanation(self, question: TriviaQuestion, user_answer: Optional[str] = None) -> str:
+        """Get the explanation for a question and answer.
+
+        Wrong answers matching one of the question's options get their own
+        cached explanation; free-text answers fall back to the canonical one.
+        """
+        cached = self.get_cached_explanation(question, user_answer)
+        if cached is not None:
+            return cached
+
+        try:
+            return await self._generate_explanation(question, self._variant(question, user_answer))
+        except OllamaError as e:
+            self.logger.error("Failed to generate explanation", question_id=question.id, error=str(e))
+            return "I apologize, but I couldn't generate an explanation at this time. Please try again later."
+
+    def get_cached_explanation(self, question: TriviaQuestion, user_answer: Optional[str] = None) -> Optional[str]:
+        """Cached explanation for an answer, falling back to the canonical one."""
+        variant = self._variant(question, user_answer)
+        cached = self.get_cached(question, KIND_EXPLANATION, variant)
+        if cached is None and variant:
+            cached = self.get_cached(question, KIND_EXPLANATION)
+        return cached
+
+    async def pregenerate(
+        self,
+        questions: Iterable[TriviaQuestion],
+        concurrency: Optional[int] = None,
+        checkpoint_dir: Optional[str] = None
+    ) -> Dict[str, int]:
+        """Fill the cache for the given questions, skipping existing entries.
+
+        Missing entries are generated as one batch per content kind; with a
+        checkpoint directory an interrupted run resumes without regenerating
+        finished prompts.
+        """
+        stats = {"generated": 0, "cached": 0, "failed": 0}
+        jobs: Dict[str, List[Tuple[TriviaQuestion, str, str]]] = {KIND_HINT: [], KIND_EXPLANATION: []}
+
+        for question in questions:
+            wanted = [(KIND_HINT, ""), (KIND_EXPLANATION, "")] + [
+                (KIND_EXPLANATION, variant) for variant in self._wrong_options(question)
+            ]
+            for kind, variant in wanted:
+                if self.get_cached(question, kind, variant) is not None:
+                    stats["cached"] += 1
+                else:
+                    jobs[kind].append((question, variant, source_hash(question)))
+
+        ollama = self.assistant.ollama_service
+        for kind, items in jobs.items():
+            if not items:
+                continue
+            prompts = [
+                ollama.build_prompt(kind, **self._prompt_fields(question, kind, variant))
+                for question, variant, _ in items
+            ]
+            checkpoint = str(Path(checkpoint_dir) / f"{kind}.jsonl") if checkpoint_dir else None
+            results = await ollama.generate_batch(
+                prompts, task=kind, concurrency=concurrency, checkpoint_path=checkpoint
+            )
+
+            for (question, variant, source), content in zip(items, results):
+                if content is None:
+                    stats["failed"] += 1
+                else:
+                    self.store(question.id, kind, content, variant, source)
+                    stats["generated"] += 1
+
+        self.logger.info("Question content pre-generated", **stats)
+        return stats
+
+    async def _generate_hint(self, question: TriviaQuestion) -> str:
+        source = source_hash(question)
+        content = await self.assistant.ollama_service.generate_hint(
+            **self._prompt_fields(question, KIND_HINT, ""),
+            fail_silently=False
+        )
+        self.store(question.id, KIND_HINT, content, "", source)
+        return content
+
+    async def _generate_explanation(self, question: TriviaQuestion, variant: str) -> str:
+        source = source_hash(question)
+        content = await self.assistant.ollama_service.generate_explanation(
+            **self._prompt_fields(question, KIND_EXPLANATION, variant),
+            fail_silently=False
+        )
+        self.store(question.id, KIND_EXPLANATION, content, variant, source)
+        return content
+
+    def _prompt_fields(self, question: TriviaQuestion, kind: str, variant: str) -> Dict[str, Any]:
+        """Prompt template fields for one piece of content."""
+        if kind == KIND_HINT:
+            return {
+                "question": question.question_text,
+                "difficulty_level": question.difficulty_level,
+                "category": question.category
+            }
+        return {
+            "question": question.question_text,
+            "correct_answer": question.correct_answer,
+            "user_answer": self._option_for(question, variant),
+            "context": question.explanation
+        }
+
+    def _variant(self, question: TriviaQuestion, user_answer: Optional[str]) -> str:
+        """Cache variant for an answer: empty for the canonical explanation."""
+        answer = normalize_answer(user_answer)
+        if answer and answer in self._wrong_options(question):
+            return answer
+        return ""
+
+    def _wrong_options(self, question: TriviaQuestion) -> Dict[str, str]:
+        """Normalized wrong options mapped to their original text."""
+        correct = normalize_answer(question.correct_answer)
+        return {
+            normalize_answer(option): option
+            for option in (question.options or [])
+            if normalize_answer(option) and normalize_answer(option) != correct
+        }
+
+    def _option_for(self, question: TriviaQuestion, variant: str) -> Optional[str]:
+        return self._wrong_options(question).get(variant) if variant else None
+
+
+async def pregenerate_question_content(
+    question_ids: Optional[Iterable[int]] = None,
+    concurrency: Optional[int] = None,
+    checkpoint_dir: Optional[str] = None
+) -> Dict[str, int]:
+    """Background job: pre-generate AI content for active questions."""
+    db = SessionLocal()
+    try:
+        query = db.query(TriviaQuestion).filter(TriviaQuestion.is_active == True)
+        if question_ids is not None:
+            query = query.filter(TriviaQuestion.id.in_(list(question_ids)))
+        return await QuestionContentService(db).pregenerate(query.all(), concurrency, checkpoint_dir)
+    except Exception as e:
+        logger.error("Question content pre-generation failed", error=str(e))
+        return {"generated": 0, "cached": 0, "failed": 0}
+    finally:
+        db.close()
@@ -0,0 +1,342 @@
+import hashlib
+import math
+import os
+import re
+import tempfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from src.core.config import settings
+from src.core.logging import LoggerMixin
+
+
+SVG_NS = "{http://www.w3.org/2000/svg}"
+
+_PATH_TOKEN_RE = re.compile(r"[MmLlHhVvQqTtCcSsAaZz]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+# Arguments per path command
+_ARG_COUNTS = {"m": 2, "l": 2, "h": 1, "v": 1, "q": 4, "t": 2, "c": 6, "s": 4, "a": 7, "z": 0}
+
+CURVE_STEPS = 12
+
+Subpath = Tuple[np.ndarray, bool]
+
+
+def _quadratic(p0: np.ndarray, c: np.ndarray, p1: np.ndarray) -> np.ndarray:
+    t = np.linspace(0, 1, CURVE_STEPS + 1)[1:, None]
+    return (1 - t) ** 2 * p0 + 2 * (1 - t) * t * c + t ** 2 * p1
+
+
+def _cubic(p0: np.ndarray, c1: np.ndarray, c2: np.ndarray, p1: np.ndarray) -> np.ndarray:
+    t = np.linspace(0, 1, CURVE_STEPS + 1)[1:, None]
+    return (1 - t) ** 3 * p0 + 3 * (1 - t) ** 2 * t * c1 + 3 * (1 - t) * t ** 2 * c2 + t ** 3 * p1
+
+
+def _arc(p0: np.ndarray, rx: float, ry: float, phi_deg: float, large: bool, sweep: bool, p1: np.ndarray) -> np.ndarray:
+    """Flatten an SVG elliptical arc (endpoint parameterization)."""
+    if rx == 0 or ry == 0 or np.allclose(p0, p1):
+        return p1[None, :]
+
+    rx, ry = abs(rx), abs(ry)
+    phi = math.radians(phi_deg)
+    cos_phi, sin_phi = math.cos(phi), math.sin(phi)
+
+    dx, dy = (p0 - p1) / 2
+    x1 = cos_phi * dx + sin_phi * dy
+    y1 = -sin_phi * dx + cos_phi * dy
+
+    # Scale radii up if they are too small to reach the end point
+    scale = x1 ** 2 / rx ** 2 + y1 ** 2 / ry ** 2
+    if scale > 1:
+        rx, ry = rx * math.sqrt(scale), ry * math.sqrt(scale)
+
+    numerator = rx ** 2 * ry ** 2 - rx ** 2 * y1 ** 2 - ry ** 2 * x1 ** 2
+    denominator = rx ** 2 * y1 ** 2 + ry ** 2 * x1 ** 2
+    factor = math.sqrt(max(numerator / denominator, 0))
+    if large == sweep:
+        factor = -factor
+    cx1, cy1 = factor * rx * y1 / ry, -factor * ry * x1 / rx
+
+    cx = cos_phi * cx1 - sin_phi * cy1 + (p0[0] + p1[0]) / 2
+    cy = sin_phi * cx1 + cos_phi * cy1 + (p0[1] + p1[1]) / 2
+
+    start = math.atan2((y1 - cy1) / ry, (x1 - cx1) / rx)
+    end = math.atan2((-y1 - cy1) / ry, (-x1 - cx1) / rx)
+    delta = end - start
+    if sweep and delta < 0:
+        delta += 2 * math.pi
+    elif not sweep and delta > 0:
+        delta -= 2 * math.pi
+
+    angles = start + delta * np.linspace(0, 1, 2 * CURVE_STEPS + 1)[1:]
+    xs = rx * np.cos(angles)
+    ys = ry * np.sin(angles)
+    return np.stack([cos_phi * xs - sin_phi * ys + cx, sin_phi * xs + cos_phi * ys + cy], axis=1)
+
+
+def parse_path(d: str) -> List[Subpath]:
+    """Flatten SVG path data into polyline subpaths."""
+    tokens = _PATH_TOKEN_RE.findall(d)
+    subpaths: List[Subpath] = []
+    points: List[np.ndarray] = []
+    current = np.zeros(2)
+    start = np.zeros(2)
+    last_control: Optional[np.ndarray] = None
+    command = ""
+    index = 0
+
+    def finish(closed: bool):
+        if len(points) > 1:
+            subpaths.append((np.vstack(points), closed))
+
+    while index < len(tokens):
+        token = tokens[index]
+        if token.isalpha():
+            command = token
+            index += 1
+            if command in "Zz":
+                finish(True)
+                points = []
+                current = start.copy()
+                last_control = None
+                command = ""
+                continue
+        elif not command:
+            raise ValueError("Path data must start with a command")
+
+        lower = command.lower()
+        count = _ARG_COUNTS[lower]
+        args = [float(value) for value in tokens[index:index + count]]
+        if len(args) < count:
+            raise ValueError("Truncated path data")
+        index += count
+        relative = command.islower()
+        origin = current if relative else np.zeros(2)
+
+        if lower == "m":
+            finish(False)
+            current = origin + args[:2]
+            start = current.copy()
+            points = [current[None, :]]
+            last_control = None
+            # Further coordinate pairs after a move are implicit lines
+            command = "l" if relative else "L"
+            continue
+
+        if lower == "l":
+            segment = (origin + args[:2])[None, :]
+            last_control = None
+        elif lower == "h":
+            segment = np.array([[current[0] + args[0] if relative else args[0], current[1]]])
+            last_control = None
+        elif lower == "v":
+            segment = np.array([[current[0], current[1] + args[0] if relative else args[0]]])
+            last_control = None
+        elif lower in "qt":
+            if lower == "q":
+                control = origin + args[:2]
+                end = origin + args[2:4]
+            else:
+                control = 2 * current - last_control if last_control is not None else current.copy()
+                end = origin + args[:2]
+            segment = _quadratic(current, control, end)
+            last_control = control
+        elif lower in "cs":
+            if lower == "c":
+                control1 = origin + args[:2]
+                control2 = origin + args[2:4]
+                end = origin + args[4:6]
+            else:
+                control1 = 2 * current - last_control if last_control is not None else current.copy()
+                control2 = origin + args[:2]
+                end = origin + args[2:4]
+            segment = _cubic(current, control1, control2, end)
+            last_control = control2
+        else:
+            end = origin + args[5:7]
+            segment = _arc(current, args[0], args[1], args[2], bool(args[3]), bool(args[4]), end)
+            last_control = None
+
+        points.append(segment)
+        current = segment[-1].copy()
+
+    finish(False)
+    return subpaths
+
+
+class ThumbnailService(LoggerMixin):
+    """Rasterize SVG Kolams into small PNG/WebP thumbnails cached on disk.
+
+    Each SVG is drawn once at the largest requested size (supersampled for
+    anti-aliasing) and downscaled to every other size, and the results are
+    keyed by a hash of the SVG content so unchanged patterns are never
+    rasterized twice.
+    """
+
+    MEDIA_TYPES = {"png": "image/png", "webp": "image/webp"}
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        sizes: Optional[Sequence[int]] = None,
+        formats: Optional[Sequence[str]] = None,
+        supersample: int = 2
+    ):
+        self.cache_dir = Path(cache_dir or settings.thumbnail_dir)
+        self.sizes = sorted(sizes or [int(s) for s in settings.thumbnail_sizes.split(",")])
+        self.formats = list(formats or settings.thumbnail_formats.split(","))
+        self.supersample = supersample
+
+    @staticmethod
+    def key_for(svg_data: str) -> str:
+        """Content hash used to name an SVG's thumbnails."""
+        return hashlib.sha256(svg_data.encode("utf-8")).hexdigest()
+
+    def thumbnail_path(self, key: str, size: int, fmt: str) -> Path:
+        """On-disk path of one thumbnail."""
+        return self.cache_dir / key[:2] / f"{key}_{size}.{fmt}"
+
+    def thumbnail_names(self) -> List[str]:
+        """File names ("<size>.<format>") of every thumbnail variant."""
+        return [f"{size}.{fmt}" for size in self.sizes for fmt in self.formats]
+
+    def render(self, svg_data: str) -> Dict[str, str]:
+        """Rasterize an SVG to all thumbnail sizes, reusing cached files."""
+        key = self.key_for(svg_data)
+        paths = {
+            f"{size}.{fmt}": self.thumbnail_path(key, size, fmt)
+            for size in self.sizes for fmt in self.formats
+        }
+
+        if all(path.exists() for path in paths.values()):
+            return {name: str(path) for name, path in paths.items()}
+
+        image = self._rasterize(svg_data, self.sizes[-1] * self.supersample)
+        paths[next(iter(paths))].parent.mkdir(parents=True, exist_ok=True)
+
+        for size in self.sizes:
+            scale = size / max(image.size)
+            thumbnail = image.resize(
+                (max(1, round(image.width * scale)), max(1, round(image.height * scale))),
+                Image.LANCZOS
+            )
+            for fmt in self.formats:
+                self._save(thumbnail, self.thumbnail_path(key, size, fmt), fmt)
+
+        self.logger.info("Thumbnails rendered", key=key, sizes=self.sizes, formats=self.formats)
+        return {name: str(path) for name, path in paths.items()}
+
+    def render_batch(self, svgs: Sequence[str], max_workers: int = 4) -> List[Dict[str, str]]:
+        """Rasterize many SVGs concurrently, returning results in order.
+
+        Duplicate SVGs are rendered once. An SVG that fails to render gets
+        an empty result instead of failing the whole batch.
+        """
+        unique = list(dict.fromkeys(svgs))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            rendered = dict(zip(unique, executor.map(self._render_or_skip, unique)))
+        return [rendered[svg_data] for svg_data in svgs]
+
+    def _render_or_skip(self, svg_data: str) -> Dict[str, str]:
+        try:
+            return self.render(svg_data)
+        except Exception as e:
+            self.logger.error("Thumbnail rendering failed", key=self.key_for(svg_data), error=str(e))
+            return {}
+
+    def _save(self, image: Image.Image, path: Path, fmt: str):
+        """Write a thumbnail atomically.
+
+        Each write goes to its own temporary file, so concurrent renders of
+        the same SVG never share a partial file.
+        """
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=f".{fmt}.tmp", delete=False) as tmp:
+            tmp_path = Path(tmp.name)
+            try:
+                if fmt == "webp":
+                    image.save(tmp, "WEBP", quality=80, method=4)
+                else:
+                    image.save(tmp, "PNG", optimize=True)
+            except Exception:
+                tmp.close()
+                tmp_path.unlink(missing_ok=True)
+                raise
+        os.replace(tmp_path, path)
+
+    def _rasterize(self, svg_data: str, target: int) -> Image.Image:
+        """Draw an SVG so that its longest side is target pixels."""
+        try:
+            root = ET.fromstring(svg_data)
+        except ET.ParseError as e:
+            raise ValueError(f"Invalid SVG: {e}")
+
+        view_box = root.get("viewBox")
+        if view_box:
+            min_x, min_y, width, height = (float(v) for v in view_box.replace(",", " ").split())
+        else:
+            min_x = min_y = 0.0
+            width = float(root.get("width", "0").rstrip("px") or 0)
+            height = float(root.get("height", "0").rstrip("px") or 0)
+        if width <= 0 or height <= 0:
+            raise ValueError("SVG has no size")
+
+        scale = target / max(width, height)
+        offset = np.array([min_x, min_y])
+        image = Image.new("RGB", (max(1, round(width * scale)), max(1, round(height * scale))), "white")
+        draw = ImageDraw.Draw(image)
+
+        for element in root.iter():
+            tag = element.tag.replace(SVG_NS, "")
+            subpaths = self._element_subpaths(tag, element)
+            if not subpaths:
+                continue
+
+            fill = element.get("fill", "black")
+            stroke = element.get("stroke", "none")
+            stroke_width = max(1, round(float(element.get("stroke-width", "1")) * scale))
+
+            for points, closed in subpaths:
+                xy = [tuple(p) for p in ((points - offset) * scale).tolist()]
+                if fill != "none" and len(xy) > 2:
+                    draw.polygon(xy, fill=fill)
+                if stroke != "none":
+                    if closed:
+                        xy.append(xy[0])
+                    draw.line(xy, fill=stroke, width=stroke_width, joint="curve")
+
+        return image
+
+    @staticmethod
+    def _element_subpaths(tag: str, element: ET.Element) -> List[Subpath]:
+        """Polyline subpaths for the SVG shapes the generators emit."""
+        get = lambda name: float(element.get(name, "0"))
+
+        if tag == "path":
+            return parse_path(element.get("d", ""))
+        if tag == "rect":
+            x, y, w, h = get("x"), get("y"), get("width"), get("height")
+            return [(np.array([[x, y], [x + w, y], [x + w, y + h], [x, y + h]]), True)]
+        if tag == "circle":
+            angles = np.linspace(0, 2 * math.pi, 4 * CURVE_STEPS, endpoint=False)
+            cx, cy, r = get("cx"), get("cy"), get("r")
+            return [(np.stack([cx + r * np.cos(angles), cy + r * np.sin(angles)], axis=1), True)]
+        if tag in ("polygon", "polyline"):
+            values = [float(v) for v in re.split(r"[\s,]+", element.get("points", "").strip()) if v]
+            if len(values) < 4:
+                return []
+            return [(np.array(values).reshape(-1, 2), tag == "polygon")]
+        if tag == "line":
+            return [(np.array([[get("x1"), get("y1")], [get("x2"), get("y2")]]), False)]
+        return []
+
+
+@lru_cache()
+def get_thumbnail_service() -> ThumbnailService:
+    """Get the application-wide thumbnail service."""
+    return ThumbnailService()
@@ -0,0 +1,141 @@
+"""Shared fixtures for the search tests."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.search.cache import SearchResultCache
+from src.search.client import AsyncOpenSearchClient, SearchService
+from src.search.indexer import FlushResult
+from src.search.suggest import Suggester
+
+
+class FakeOpenSearch:
+    """Stand-in for AsyncOpenSearch that answers from canned documents.
+
+    documents maps an index to the _source documents its searches return,
+    in order, with ids from their "id" and sort values [created_at, id];
+    search_after continues after the hit with those sort values. Responses
+    include aggregations and completion suggestions when the request asks
+    for them, and msearch answers with one hit list per entry of rankings.
+    fail makes every call fail like an unreachable cluster, expired makes
+    point-in-time searches fail, and latency delays every search.
+    """
+
+    def __init__(self):
+        self.documents = {}
+        self.aggregations = {}
+        self.suggestions = []
+        self.rankings = []
+        self.fail = False
+        self.expired = False
+        self.latency = 0.0
+        # (index, body, kwargs) of every search and msearch
+        self.searches = []
+        self.created = []
+        self.open_pits = set()
+        self.pit_index = None
+        self.indices = SimpleNamespace(exists=self._exists, create=self._create)
+
+    @property
+    def bodies(self):
+        return [body for _, body, _ in self.searches]
+
+    async def _exists(self, index):
+        return False
+
+    async def _create(self, index, body):
+        self.created.append((index, list(body.get("aliases", {}))))
+
+    async def ping(self):
+        return not self.fail
+
+    async def create_pit(self, index, params=None, **kwargs):
+        self.open_pits.add("pit-1")
+        self.pit_index = index
+        return {"pit_id": "pit-1"}
+
+    async def delete_pit(self, body=None, **kwargs):
+        self.open_pits.difference_update(body["pit_id"])
+
+    async def search(self, index=None, body=None, size=10, from_=0, **kwargs):
+        self.searches.append((index, body, kwargs))
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.fail:
+            raise ConnectionError("cluster down")
+        if "pit" in body:
+            if self.expired:
+                raise RuntimeError("No search context found for id [pit-1]")
+            index = self.pit_index
+
+        hits = [
+            {"_id": str(source.get("id", position)), "_score": 1.0, "_source": source,
+             "sort": [source.get("created_at"), source.get("id")]}
+            for position, source in enumerate(self.documents.get(index, []))
+        ]
+        if "search_after" in body:
+            hits = hits[[hit["sort"] for hit in hits].index(body["search_after"]) + 1:]
+
+        response = {"hits": {"hits": hits[from_:from_ + size]}}
+        if body.get("track_total_hits", True) is not False:
+            response["hits"]["total"] = {"value": len(hits)}
+        if "pit" in body:
+            response["pit_id"] = body["pit"]["id"]
+        if "aggs" in body:
+            response["aggregations"] = self.aggregations
+        if "suggest" in body:
+            response["suggest"] = {"terms": [{"options": self.suggestions}]}
+        return response
+
+    async def msearch(self, body, **kwargs):
+        self.searches.append((None, body, kwargs))
+        if self.fail:
+            raise ConnectionError("cluster down")
+        return {"responses": [
+            {"hits": {"hits": ranking, "total": {"value": len(ranking)}}} for ranking in self.rankings
+        ]}
+
+
+class RecordingIndexer:
+    """Collects queued actions; flush() reports them all accepted to subscribers."""
+
+    def __init__(self):
+        self.added = []
+        self.deleted = []
+        self._pending = []
+        self._listeners = []
+
+    def add(self, index, document, doc_id=None):
+        self.added.append((index, doc_id, document))
+        self._pending.append({"_op_type": "index", "_index": index, "_id": doc_id, "_source": document})
+
+    def delete(self, index, doc_id):
+        self.deleted.append((index, doc_id))
+        self._pending.append({"_op_type": "delete", "_index": index, "_id": doc_id})
+
+    def subscribe(self, listener):
+        self._listeners.append(listener)
+
+    async def flush(self):
+        written, self._pending = self._pending, []
+        for listener in self._listeners:
+            listener(written)
+        return FlushResult(succeeded=len(written), written=written)
+
+
+@pytest.fixture
+def fake_opensearch():
+    return FakeOpenSearch()
+
+
+@pytest.fixture
+def search_service(fake_opensearch):
+    """SearchService over fake_opensearch, with the result cache disabled."""
+    return SearchService(
+        AsyncOpenSearchClient(client=fake_opensearch),
+        indexer=RecordingIndexer(),
+        cache=SearchResultCache(enabled=False),
+        suggester=Suggester()
+    )
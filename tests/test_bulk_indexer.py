@@ -0,0 +1,156 @@
+"""Tests for the buffered bulk indexer."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from opensearchpy.serializer import JSONSerializer
+
+from src.search.indexer import BulkIndexer
+
+
+class FakeBulkClient:
+    """Answers bulk requests, failing items according to a status script."""
+
+    def __init__(self, statuses=None):
+        # doc id -> statuses for successive attempts (200 once exhausted)
+        self.statuses = statuses or {}
+        self.requests = []
+        self.params = []
+        self.transport = SimpleNamespace(serializer=JSONSerializer())
+
+    async def bulk(self, body, *args, **kwargs):
+        lines = [json.loads(line) for line in body.strip().split("\n")]
+        actions = [line for line in lines if set(line) & {"index", "delete"}]
+        self.requests.append(actions)
+        self.params.append(kwargs)
+
+        items = []
+        for action in actions:
+            op, meta = next(iter(action.items()))
+            script = self.statuses.get(meta["_id"], [])
+            status = script.pop(0) if script else 200
+            item = {"_index": meta["_index"], "_id": meta["_id"], "status": status}
+            if status >= 300:
+                item["error"] = {"type": "test_error"}
+            items.append({op: item})
+        return {"errors": any(i[next(iter(i))]["status"] >= 300 for i in items), "items": items}
+
+
+def make_indexer(client, **kwargs):
+    return BulkIndexer(client, **{"flush_interval": 0.05, "retry_backoff": 0.001, **kwargs})
+
+
+class TestBulkIndexer:
+    """Test cases for buffering, flushing and retries."""
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_buffer_is_full(self):
+        """Test that reaching max_docs wakes the background flush."""
+        client = FakeBulkClient()
+        indexer = make_indexer(client, max_docs=3, flush_interval=10)
+        indexer.start()
+
+        for i in range(3):
+            indexer.add("kolam_images", {"title": f"kolam {i}"}, str(i))
+        await asyncio.sleep(0.05)
+
+        assert len(client.requests) == 1 and len(client.requests[0]) == 3
+        assert indexer.pending == 0
+        await indexer.close()
+
+    @pytest.mark.asyncio
+    async def test_flushes_on_interval(self):
+        """Test that a partial buffer is sent after the flush interval."""
+        client = FakeBulkClient()
+        indexer = make_indexer(client)
+        indexer.start()
+
+        indexer.add("trivia_questions", {"question_text": "Q"}, "1")
+        indexer.delete("trivia_questions", "2")
+        await asyncio.sleep(0.15)
+
+        assert [len(request) for request in client.requests] == [2]
+        await indexer.close()
+
+    @pytest.mark.asyncio
+    async def test_retryable_items_are_resent_alone(self):
+        """Test that only items rejected with 429/5xx are retried."""
+        client = FakeBulkClient({"2": [429, 503]})
+        indexer = make_indexer(client)
+
+        for i in range(3):
+            indexer.add("kolam_images", {"title": f"kolam {i}"}, str(i))
+        result = await indexer.flush()
+
+        assert result.succeeded == 3 and not result.failed
+        assert [len(request) for request in client.requests] == [3, 1, 1]
+        assert result.retries == 2
+
+    @pytest.mark.asyncio
+    async def test_only_last_action_per_document_is_sent(self):
+        """Test that a retried index cannot resurrect a later delete."""
+        client = FakeBulkClient({"1": [503]})
+        indexer = make_indexer(client)
+
+        indexer.add("kolam_images", {"title": "draft"}, "1")
+        indexer.add("kolam_images", {"title": "other"}, "2")
+        indexer.delete("kolam_images", "1")
+        indexer.add("trivia_questions", {"question_text": "Q"}, "1")
+        result = await indexer.flush()
+
+        sent = [
+            (op, meta["_index"], meta["_id"])
+            for request in client.requests for op, meta in (next(iter(a.items())) for a in request)
+        ]
+        assert sent == [
+            ("index", "kolam_images", "2"),
+            ("delete", "kolam_images", "1"),
+            ("index", "trivia_questions", "1"),
+            ("delete", "kolam_images", "1"),
+        ]
+        assert result.succeeded == 3 and not result.failed
+
+    @pytest.mark.asyncio
+    async def test_permanent_failures_are_reported_per_item(self):
+        """Test that a mapping error is reported, not retried."""
+        client = FakeBulkClient({"bad": [400]})
+        indexer = make_indexer(client)
+
+        indexer.add("kolam_images", {"title": "ok"}, "good")
+        indexer.add("kolam_images", {"complexity_score": "high"}, "bad")
+        indexer.delete("kolam_images", "missing")
+        client.statuses["missing"] = [404]
+        result = await indexer.flush()
+
+        assert result.succeeded == 2
+        assert [(failure.doc_id, failure.status) for failure in result.failed] == [("bad", 400)]
+        assert len(client.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_remaining_actions(self):
+        """Test that shutdown sends whatever is still buffered."""
+        client = FakeBulkClient()
+        indexer = make_indexer(client, flush_interval=10)
+        indexer.start()
+
+        indexer.add("kolam_images", {"title": "last"}, "9")
+        await indexer.close()
+
+        assert len(client.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_listeners_get_accepted_actions_once_searchable(self):
+        """Test that flushes wait for the refresh, then report what the index accepted."""
+        client = FakeBulkClient(statuses={"2": [400]})
+        indexer = make_indexer(client)
+        written = []
+        indexer.subscribe(written.append)
+
+        indexer.add("kolam_images", {"title": "kept"}, "1")
+        indexer.add("kolam_images", {"title": "rejected"}, "2")
+        await indexer.flush()
+
+        assert client.params[0]["refresh"] == "wait_for"
+        assert [[action["_id"] for action in actions] for actions in written] == [["1"]]
@@ -0,0 +1,115 @@
+"""Tests for the LLM circuit breaker and hedged requests."""
+
+import asyncio
+from collections import deque
+
+import httpx
+import pytest
+
+from src.core.config import settings
+from src.services.ai.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from src.services.ai.llm_router import LLMRouter
+from src.services.ai.ollama_service import BUSY_MESSAGE, OllamaService
+
+
+class TestCircuitBreaker:
+    """Test cases for circuit state transitions."""
+
+    def test_opens_after_consecutive_failures(self):
+        """Test that the threshold counts consecutive failures only."""
+        breaker = CircuitBreaker("test", failure_threshold=2, recovery_seconds=60)
+
+        breaker.record(None, False)
+        breaker.record(0.1, True)
+        breaker.record(None, False)
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record(None, False)
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.available
+
+    def test_slow_calls_count_as_failures(self):
+        """Test that successful but slow calls open the circuit."""
+        breaker = CircuitBreaker("test", failure_threshold=2, slow_call_seconds=1.0)
+
+        breaker.record(5.0, True)
+        breaker.record(5.0, True)
+
+        assert breaker.state == CircuitState.OPEN
+
+    def test_half_open_admits_one_probe(self):
+        """Test that a probe success closes and a probe failure reopens."""
+        breaker = CircuitBreaker("test", failure_threshold=1, recovery_seconds=0)
+
+        breaker.record(None, False)
+        assert breaker.state == CircuitState.HALF_OPEN
+        breaker.acquire()
+        assert not breaker.available
+
+        breaker.record(None, False)
+        breaker.recovery_seconds = 60
+        assert breaker.state == CircuitState.OPEN
+
+        breaker.opened_at -= 60
+        breaker.acquire()
+        breaker.record(0.1, True)
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_released_probe_frees_the_slot(self):
+        """Test that a probe ending without an outcome can be retried."""
+        breaker = CircuitBreaker("test", failure_threshold=1, recovery_seconds=0)
+        breaker.record(None, False)
+
+        breaker.acquire()
+        breaker.release()
+
+        assert breaker.available
+
+
+class TestOllamaResilience:
+    """Test cases for fail-fast and hedging in OllamaService."""
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self):
+        """Test that no request is sent while every circuit is open."""
+        upstream = []
+
+        def handler(request):
+            upstream.append(request)
+            return httpx.Response(503)
+
+        router = LLMRouter(["http://ollama"], max_in_flight=1, max_queue=1, max_failures=1)
+        service = OllamaService(
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), router=router
+        )
+
+        await service.generate_learning_tip("symmetry", 1)
+        with pytest.raises(CircuitOpenError):
+            router.choose(service.model)
+
+        assert await service.generate_learning_tip("loops", 2) == BUSY_MESSAGE
+        assert len(upstream) == 1
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_slow_request_is_hedged(self, monkeypatch):
+        """Test that a second backend answers when the first is slow."""
+        monkeypatch.setattr(settings, "ollama_hedge_enabled", True)
+        monkeypatch.setattr(settings, "ollama_hedge_min_delay_seconds", 0.01)
+
+        async def handler(request):
+            if request.url.host == "slow":
+                await asyncio.sleep(1)
+                return httpx.Response(200, json={"response": "from slow"})
+            return httpx.Response(200, json={"response": "from fast"})
+
+        router = LLMRouter(["http://slow", "http://fast"], max_in_flight=1, max_queue=1)
+        router.backends[1].latency = 5.0
+        service = OllamaService(
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), router=router
+        )
+        service._latencies[service.model] = deque([0.01] * OllamaService.HEDGE_MIN_SAMPLES)
+
+        assert await service.generate_learning_tip("symmetry", 1) == "from fast"
+        assert router.backends[0].scheduler.in_flight == 0
+        await service.close()
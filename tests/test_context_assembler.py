@@ -0,0 +1,73 @@
+"""Tests for knowledge context assembly."""
+
+import pytest
+from types import SimpleNamespace
+
+from src.services.ai.context_assembler import (
+    ContextAssembler,
+    static_prompt,
+    truncate_to_tokens,
+)
+
+
+def make_doc(content, doc_id=None, reranking_score=None):
+    """Create a stand-in for a retrieved knowledge document."""
+    return SimpleNamespace(content=content, id=doc_id, name=None, reranking_score=reranking_score)
+
+
+class TestContextAssembler:
+    """Test cases for the token-budgeted context assembler."""
+
+    @pytest.fixture
+    def assembler(self):
+        """Create context assembler instance."""
+        return ContextAssembler(min_chunk_tokens=4)
+
+    def test_duplicates_are_dropped(self, assembler):
+        """Test that repeated chunks only appear once."""
+        docs = [
+            make_doc("Kolam is drawn with rice flour.", "a"),
+            make_doc("kolam is drawn   with rice flour.", "b"),
+            make_doc("Kolam is drawn with rice flour", "c"),
+        ]
+
+        context = assembler.assemble("kolam", docs, token_budget=500)
+
+        assert [chunk["id"] for chunk in context["chunks"]] == ["a"]
+        assert context["dropped"] == 2
+
+    def test_budget_is_respected(self, assembler):
+        """Test that the assembled context never exceeds the token budget."""
+        docs = [make_doc(f"word{i} " * 100, str(i)) for i in range(10)]
+
+        context = assembler.assemble("word", docs, token_budget=200)
+
+        assert context["tokens"] <= 200
+        assert len(context["chunks"]) == 2
+        assert context["chunks"][-1]["truncated"] is True
+
+    def test_ranking_prefers_reranking_score_and_query_overlap(self, assembler):
+        """Test that higher scoring chunks come first."""
+        docs = [
+            make_doc("Pookalam uses flowers.", "low", reranking_score=0.1),
+            make_doc("Muggu uses a dot grid.", "high", reranking_score=0.9),
+        ]
+
+        context = assembler.assemble("dot grid", docs, token_budget=500)
+
+        assert context["chunks"][0]["id"] == "high"
+
+    def test_truncate_to_tokens(self):
+        """Test truncation on a word boundary."""
+        text = "alpha beta gamma delta epsilon"
+
+        assert truncate_to_tokens(text, 100) == text
+        assert len(truncate_to_tokens(text, 3)) <= 13
+
+    def test_static_prompt_is_cached(self):
+        """Test that static prompts are normalized once."""
+        first = static_prompt("  You are\n  an assistant. ")
+        second = static_prompt("  You are\n  an assistant. ")
+
+        assert first[0] == "You are an assistant."
+        assert first is second
@@ -0,0 +1,152 @@
+"""Tests for the embedded SQLite search engine behind SearchService."""
+
+import pytest
+
+from src.search import client as client_module
+from src.search.cache import SearchResultCache
+from src.search.client import AsyncOpenSearchClient, SearchService
+from src.search.embedded import EmbeddedSearchEngine
+from src.search.indexer import BulkIndexer
+
+
+KOLAMS = [
+    {"id": 1, "title": "Lotus kolam", "description": "Petals around dots", "tags": ["festival", "lotus"],
+     "detected_patterns": ["pulli"], "symmetry_type": "radial", "complexity_score": 0.8,
+     "user_id": 1, "is_public": True, "created_at": "2025-01-01", "image_vector": [1.0, 0.0]},
+    {"id": 2, "title": "Simple lines", "description": "A lotus border", "tags": ["daily"],
+     "detected_patterns": ["sikku"], "symmetry_type": "bilateral", "complexity_score": 0.2,
+     "user_id": 1, "is_public": True, "created_at": "2025-01-02", "image_vector": [0.0, 1.0]},
+    {"id": 3, "title": "Private lotus", "description": "Only for its owner", "tags": ["festival"],
+     "detected_patterns": ["pulli"], "symmetry_type": "radial", "complexity_score": 0.5,
+     "user_id": 2, "is_public": False, "created_at": "2025-01-03", "image_vector": [0.9, 0.1]},
+]
+
+
+async def make_service(path=":memory:"):
+    engine = EmbeddedSearchEngine(path)
+    service = SearchService(
+        AsyncOpenSearchClient(client=engine),
+        indexer=BulkIndexer(engine),
+        cache=SearchResultCache(enabled=False)
+    )
+    await service.initialize()
+    for kolam in KOLAMS:
+        await service.index_kolam_image(kolam)
+    await service.index_trivia_question({
+        "id": 1, "question_text": "What are the dots in a kolam called?", "category": "basics",
+        "difficulty_level": 1, "tags": [], "is_active": True
+    })
+    await service.indexer.flush()
+    return service, engine
+
+
+class TestEmbeddedSearch:
+    """Test cases for searching without an OpenSearch cluster."""
+
+    @pytest.mark.asyncio
+    async def test_text_search_ranks_with_field_boosts_and_filters(self):
+        """Test BM25 ranking (title boosted) with visibility applied."""
+        service, _ = await make_service()
+
+        results = await service.search_similar_kolams("lotus")
+
+        assert [result["id"] for result in results] == [1, 2]
+        assert "image_vector" not in results[0]
+        assert [result["id"] for result in await service.search_similar_kolams("lotus", user_id=2)] == [1, 3, 2]
+
+    @pytest.mark.asyncio
+    async def test_keyword_and_range_filters(self):
+        """Test terms and range clauses in filter context."""
+        service, _ = await make_service()
+
+        results = await service.search_similar_kolams(tags=["festival"], complexity_range=(0.5, None), user_id=2)
+
+        assert sorted(result["id"] for result in results) == [1, 3]
+
+    @pytest.mark.asyncio
+    async def test_facets_pages_and_vectors(self):
+        """Test aggregations, search_after paging and brute-force knn."""
+        service, _ = await make_service()
+
+        facets = (await service.facet_kolams())["facets"]
+        assert facets["tags"][0] == {"value": "daily", "count": 1}
+        assert {bucket["value"]: bucket["count"] for bucket in facets["complexity"]} == {"low": 1, "medium": 0, "high": 1}
+
+        first = await service.page_kolams(size=1)
+        second = await service.page_kolams(size=1, cursor=first["next_cursor"])
+        assert [first["results"][0]["id"], second["results"][0]["id"]] == [2, 1]
+        last = await service.page_kolams(size=1, cursor=second["next_cursor"])
+        assert last == {"results": [], "next_cursor": None}
+
+        nearest = await service.vector_search_similar_kolams([1.0, 0.05], size=1, user_id=2)
+        assert [result["id"] for result in nearest] == [1]
+
+    @pytest.mark.asyncio
+    async def test_deletes_and_persistence(self, tmp_path):
+        """Test that documents survive a restart and deletes are applied."""
+        path = str(tmp_path / "search.db")
+        service, engine = await make_service(path)
+        await service.delete_kolam_image(2)
+        await service.indexer.flush()
+        await engine.close()
+
+        reopened = SearchService(AsyncOpenSearchClient(client=EmbeddedSearchEngine(path)),
+                                 cache=SearchResultCache(enabled=False))
+
+        assert [result["id"] for result in await reopened.search_similar_kolams("lotus")] == [1]
+        assert len(await reopened.search_trivia_questions("dots")) == 1
+
+    @pytest.mark.asyncio
+    async def test_suggestions_skip_the_engine(self):
+        """Test that typeahead answers from the trie without scanning the suggest index."""
+        service, engine = await make_service()
+        searches = []
+        search = engine.search
+
+        async def counted(*args, **kwargs):
+            searches.append(kwargs)
+            return await search(*args, **kwargs)
+
+        engine.search = counted
+
+        assert {"text": "Lotus kolam", "kind": "title"} in await service.suggest("lot")
+        assert searches == []
+
+    @pytest.mark.asyncio
+    async def test_bulk_is_one_transaction(self):
+        """Test that a failing bulk request leaves neither SQLite nor memory changed."""
+        engine = EmbeddedSearchEngine()
+        await engine.index("kolam_images", {"title": "Lotus kolam"}, id="1")
+        body = "\n".join([
+            '{"index": {"_index": "kolam_images", "_id": "2"}}', '{"title": "Simple lines"}',
+            '{"delete": {"_index": "kolam_images", "_id": "1"}}',
+            '{"update": {"_index": "kolam_images", "_id": "3"}}', '{"doc": "not an object"}',
+        ])
+
+        with pytest.raises(Exception):
+            await engine.bulk(body)
+
+        assert list(engine._documents["kolam_images"]) == ["1"]
+        count, = engine._db.execute("SELECT COUNT(*) FROM search_documents").fetchone()
+        assert count == 1
+        hits = (await engine.search({"query": {"match": {"title": "lotus"}}}, index="kolam_images"))["hits"]["hits"]
+        assert [hit["_id"] for hit in hits] == ["1"]
+
+
+class TestBackendSelection:
+    """Test cases for choosing between OpenSearch and the embedded engine."""
+
+    @pytest.fixture(autouse=True)
+    def reset_client(self, monkeypatch):
+        monkeypatch.setattr(client_module, "_search_client", None)
+        monkeypatch.setattr(client_module.settings, "search_embedded_path", ":memory:")
+
+    @pytest.mark.parametrize("reachable, embedded", [(False, True), (True, False)])
+    def test_auto_falls_back_when_cluster_unreachable(self, monkeypatch, reachable, embedded):
+        """Test that "auto" uses the embedded engine only without a cluster."""
+        monkeypatch.setattr(client_module.settings, "search_backend", "auto")
+        monkeypatch.setattr(client_module, "_cluster_reachable", lambda: reachable)
+
+        client = client_module.get_search_client()
+
+        assert isinstance(client.client, EmbeddedSearchEngine) is embedded
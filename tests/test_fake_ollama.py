@@ -0,0 +1,79 @@
+"""Tests for the fake Ollama server and the LLM load-test harness."""
+
+import json
+
+import httpx
+import pytest
+
+from scripts.fake_ollama import FakeOllamaConfig, create_app
+from scripts.load_test_llm import make_assistant, make_questions, percentile, run_load
+
+FAST = dict(median_ms=5, sigma=0.1, ttft_ms=1, tokens=5, seed=1)
+
+
+def fake_client(**config):
+    app = create_app(FakeOllamaConfig(**{**FAST, **config}))
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://fake")
+
+
+class TestFakeOllama:
+    """Test cases for the fake server's Ollama API."""
+
+    @pytest.mark.asyncio
+    async def test_generate_reports_usage(self):
+        """Test that non-streaming responses carry text and usage counts."""
+        async with fake_client() as client:
+            response = await client.post(
+                "/api/generate", json={"model": "llama2", "prompt": "Hint:", "stream": False}
+            )
+
+        body = response.json()
+        assert body["done"] and body["eval_count"] == 5
+        assert len(body["response"].split()) == 5
+
+    @pytest.mark.asyncio
+    async def test_stream_ends_with_done_chunk(self):
+        """Test that streaming yields one chunk per token, then a done chunk."""
+        async with fake_client() as client:
+            response = await client.post("/api/generate", json={"model": "llama2", "prompt": "Hint:"})
+
+        chunks = [json.loads(line) for line in response.text.splitlines()]
+        assert [chunk["done"] for chunk in chunks] == [False] * 5 + [True]
+
+    @pytest.mark.asyncio
+    async def test_error_injection(self):
+        """Test that the configured error rate produces 500s."""
+        async with fake_client(error_rate=1.0) as client:
+            response = await client.post(
+                "/api/generate", json={"model": "llama2", "prompt": "Hint:", "stream": False}
+            )
+
+        assert response.status_code == 500
+
+
+class TestLoadHarness:
+    """Test cases for the load-test harness."""
+
+    def test_percentile_is_nearest_rank(self):
+        """Test percentiles over a known distribution."""
+        values = [i / 100 for i in range(1, 101)]
+
+        assert percentile(values, 0.5) == 0.5
+        assert percentile(values, 0.99) == 0.99
+        assert percentile([], 0.5) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_assistant_scenario_reports_summary(self):
+        """Test a short in-process run against the fake server."""
+        assistant = make_assistant(config=FakeOllamaConfig(**FAST))
+        questions = make_questions(4)
+
+        result = await run_load(
+            "assistant", lambda i: assistant.get_question_hint(questions[i % 4]), 12, 3
+        )
+        summary = result.summary()
+
+        assert summary["requests"] == 12
+        assert summary["errors"] == summary["fallbacks"] == 0
+        assert summary["throughput_rps"] > 0
+        await assistant.ollama_service.client.aclose()
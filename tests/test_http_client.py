@@ -0,0 +1,42 @@
+"""Tests for the shared outbound HTTP client."""
+
+import pytest
+
+from src.core.http import close_http_client, get_http_client
+from src.services.ai.ollama_service import AILearningAssistant, OllamaService
+
+
+class TestSharedHttpClient:
+    """Test cases for the application-scoped HTTP client pool."""
+
+    @pytest.mark.asyncio
+    async def test_services_share_one_client(self):
+        """Test that Ollama services use the pooled client by default."""
+        first = AILearningAssistant()
+        second = AILearningAssistant()
+
+        assert first.ollama_service.client is second.ollama_service.client
+        assert first.ollama_service.client is get_http_client()
+        await close_http_client()
+
+    @pytest.mark.asyncio
+    async def test_service_close_leaves_shared_pool_open(self):
+        """Test that closing a service does not close the shared client."""
+        client = get_http_client()
+
+        await OllamaService().close()
+
+        assert not client.is_closed
+        await close_http_client()
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_client_is_recreated_after_shutdown(self):
+        """Test that a fresh pool is created after the old one is closed."""
+        old = get_http_client()
+        await close_http_client()
+
+        new = get_http_client()
+
+        assert new is not old and not new.is_closed
+        await close_http_client()
@@ -0,0 +1,59 @@
+"""Tests for k-NN mapping and hybrid lexical + vector Kolam search."""
+
+import pytest
+
+from src.search.fusion import normalized_score_fusion, reciprocal_rank_fusion
+from src.search.indices import KOLAM_IMAGES, index_body
+
+
+def hits(*pairs):
+    return [{"_id": doc_id, "_score": score, "_source": {"id": doc_id}} for doc_id, score in pairs]
+
+
+class TestFusion:
+    """Test cases for rank and score fusion."""
+
+    def test_rrf_favours_documents_ranked_by_both(self):
+        """Test that agreement between rankings beats one top rank."""
+        lexical = hits(("a", 12.0), ("b", 9.0), ("c", 1.0))
+        semantic = hits(("d", 0.99), ("b", 0.95), ("e", 0.5))
+
+        fused = reciprocal_rank_fusion([lexical, semantic])
+
+        assert [hit["_id"] for hit in fused] == ["b", "a", "d", "c", "e"]
+
+    def test_score_fusion_normalizes_each_side(self):
+        """Test that weights apply to min-max normalized scores."""
+        lexical = hits(("a", 20.0), ("b", 10.0))
+        semantic = hits(("b", 0.9), ("a", 0.1))
+
+        assert [hit["_id"] for hit in normalized_score_fusion([lexical, semantic], [0.3, 0.7])] == ["b", "a"]
+        assert [hit["_id"] for hit in normalized_score_fusion([lexical, semantic], [0.7, 0.3])] == ["a", "b"]
+
+
+class TestHybridSearch:
+    """Test cases for SearchService vector and hybrid search."""
+
+    def test_kolam_index_uses_hnsw_knn_vector(self):
+        """Test that the mapping is an OpenSearch k-NN field on a k-NN index."""
+        body = index_body(KOLAM_IMAGES)
+        field = body["mappings"]["properties"]["image_vector"]
+
+        assert body["settings"]["knn"] is True
+        assert field["type"] == "knn_vector"
+        assert field["method"]["name"] == "hnsw"
+        assert set(field["method"]["parameters"]) == {"ef_construction", "m"}
+
+    @pytest.mark.asyncio
+    async def test_hybrid_search_is_one_round_trip(self, search_service, fake_opensearch):
+        """Test that both queries share one _msearch with the same filters."""
+        fake_opensearch.rankings = [hits(("1", 5.0), ("2", 4.0)), hits(("2", 0.9), ("3", 0.8))]
+
+        results = await search_service.hybrid_search_kolams("lotus", [0.1, 0.2], tags=["festival"], size=2)
+
+        assert [result["id"] for result in results] == ["2", "1"]
+        assert len(fake_opensearch.bodies) == 1
+        _, lexical, _, semantic = fake_opensearch.bodies[0]
+        knn = semantic["query"]["knn"]["image_vector"]
+        assert knn["filter"]["bool"]["filter"] == lexical["query"]["bool"]["filter"]
+        assert {"terms": {"tags": ["festival"]}} in lexical["query"]["bool"]["filter"]
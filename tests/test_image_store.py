@@ -0,0 +1,57 @@
+"""Tests for the generated image store."""
+
+import os
+import pytest
+
+from src.services.image_store import GeneratedImageStore
+
+
+class TestGeneratedImageStore:
+    """Test cases for the content-addressed generated image store."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Create an image store in a temporary directory."""
+        return GeneratedImageStore(str(tmp_path), max_bytes=100)
+
+    def test_make_key_is_stable(self):
+        """Test that keys depend only on prompt, model and parameters."""
+        key_a = GeneratedImageStore.make_key("lotus kolam", "imagen", {"n": 1, "size": 2})
+        key_b = GeneratedImageStore.make_key("lotus kolam", "imagen", {"size": 2, "n": 1})
+        key_c = GeneratedImageStore.make_key("lotus kolam", "imagen", {"n": 2, "size": 2})
+
+        assert key_a == key_b
+        assert key_a != key_c
+        assert len(key_a) == 64
+
+    def test_put_and_get(self, store):
+        """Test storing and retrieving an image."""
+        key = store.make_key("prompt", "imagen")
+        assert store.get(key) is None
+
+        path = store.put(key, b"image-bytes")
+
+        assert store.get(key) == path
+        assert path.read_bytes() == b"image-bytes"
+
+    def test_eviction_removes_least_recently_used(self, store):
+        """Test that the store stays within its size budget."""
+        store.put("a", b"x" * 40)
+        store.put("b", b"x" * 40)
+
+        # Touch "a" so that "b" becomes the eviction candidate
+        assert store.get("a") is not None
+        store.put("c", b"x" * 40)
+
+        assert store.get("a") is not None
+        assert store.get("b") is None
+        assert store.get("c") is not None
+        assert not os.path.exists(store.path_for("b"))
+
+    def test_existing_images_are_indexed(self, tmp_path):
+        """Test that a new store picks up images already on disk."""
+        GeneratedImageStore(str(tmp_path), max_bytes=100).put("a", b"data")
+
+        reopened = GeneratedImageStore(str(tmp_path), max_bytes=100)
+
+        assert reopened.get("a") is not None
@@ -13,9 +13,9 @@ class TestGenerationService:
     """Test cases for Kolam generation service."""
     
     @pytest.fixture
-    def generation_service(self):
+    def generation_service(self, tmp_path):
         """Create generation service instance."""
-        return GenerationService()
+        return GenerationService(output_dir=str(tmp_path))
     
     def test_generation_service_initialization(self, generation_service):
         """Test generation service initialization."""
@@ -233,3 +233,94 @@ class TestGenerationService:
         assert isinstance(control_point, tuple)
         assert len(control_point) == 2
 
+
+    def test_symmetry_skips_redundant_copies(self, generation_service):
+        """Copies of an already-symmetric motif are not drawn twice."""
+        size_params = generation_service._get_size_parameters("large")
+        base = generation_service._generate_traditional_pattern(5, size_params)
+
+        # The pulli diamond is its own mirror image, so the mirrored half adds nothing
+        mirrored = generation_service._apply_bilateral_symmetry(base, 5, size_params["center"])
+        assert len(mirrored) == len(base)
+
+        radial = generation_service._apply_radial_symmetry(base, 5, size_params["center"])
+        rotational = generation_service._apply_rotational_symmetry(base, 5, size_params["center"])
+        assert len(radial) == len(rotational) < len(base) * 7
+
+    def test_symmetry_keeps_distinct_copies(self, generation_service):
+        """A motif off the mirror axis gets one reflected copy per rotation."""
+        base_pattern = [
+            {"type": "line", "start": (210, 200), "end": (260, 220), "style": {}}
+        ]
+
+        radial = generation_service._apply_radial_symmetry(base_pattern, 3, (200, 200))
+
+        assert len(radial) == 2 * generation_service._symmetry_folds(3)
+        assert radial[0]["start"] == (210, 200)
+        # The first mirrored copy reflects across the vertical axis through the center
+        assert radial[5]["start"] == (190, 200)
+        assert radial[5]["end"] == (140, 220)
+
+    def test_symmetry_dedupes_equal_styles(self, generation_service):
+        """Copies with equal but separately built styles still count as one shape."""
+        base_pattern = [
+            {"type": "line", "start": (150, 200), "end": (250, 200), "style": {"stroke": "#000"}},
+            {"type": "line", "start": (250, 200), "end": (150, 200), "style": {"stroke": "#000"}}
+        ]
+
+        mirrored = generation_service._apply_bilateral_symmetry(base_pattern, 3, (200, 200))
+
+        assert len(mirrored) == 1
+
+    @pytest.mark.parametrize("pattern_type,symmetry_type,expected", [
+        ("geometric", "radial", 57),
+        ("floral", "rotational", 43),
+        ("traditional", "radial", 2129),
+        ("traditional", "bilateral", 305),
+        ("modern", "radial", 210),
+    ])
+    @pytest.mark.asyncio
+    async def test_generate_pattern_element_counts(
+        self, pattern_type, symmetry_type, expected, tmp_path
+    ):
+        """Element counts for complexity 5 on the large canvas."""
+        service = GenerationService(output_dir=str(tmp_path))
+
+        result = await service.generate_pattern(pattern_type, 5, symmetry_type, "large")
+
+        assert result["element_count"] == expected
+        assert result["svg_data"].startswith("<svg")
+
+
+class TestLazyClients:
+    """The knowledge base and Imagen client connect on first use only."""
+
+    def test_knowledge_created_once_on_first_use(self):
+        from src.services.ai import generation_service as module
+
+        module.get_knowledge.cache_clear()
+        with patch.object(module, "PineconeDb") as pinecone, \
+                patch.object(module, "MistralEmbedder"), \
+                patch.object(module, "Knowledge") as knowledge:
+            assert not pinecone.called
+
+            first = module.get_knowledge()
+            second = module.get_knowledge()
+
+        assert first is second is knowledge.return_value
+        pinecone.assert_called_once()
+        module.get_knowledge.cache_clear()
+
+    def test_imagen_client_created_once_on_first_use(self):
+        from src.services.ai import generation_service as module
+
+        module.get_imagen_client.cache_clear()
+        with patch.object(module.genai, "Client") as client:
+            assert not client.called
+
+            first = module.get_imagen_client()
+            second = module.get_imagen_client()
+
+        assert first is second is client.return_value
+        client.assert_called_once()
+        module.get_imagen_client.cache_clear()
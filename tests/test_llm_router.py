@@ -0,0 +1,122 @@
+"""Tests for routing LLM requests across Ollama backends."""
+
+import json
+
+import httpx
+import pytest
+
+from src.services.ai.llm_router import LLMRouter, parse_task_models
+from src.services.ai.ollama_service import OllamaService
+
+
+def make_service(router, handler, task_models=None):
+    """Create an Ollama service over a mock transport."""
+    service = OllamaService(
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        router=router
+    )
+    service.task_models = task_models or {}
+    return service
+
+
+class TestLLMRouter:
+    """Test cases for backend selection."""
+
+    def test_parse_task_models_keeps_model_tags(self):
+        """Test that model tags containing colons survive parsing."""
+        assert parse_task_models("hint=llama3.2:1b, analysis=llama3:8b") == {
+            "hint": "llama3.2:1b",
+            "analysis": "llama3:8b",
+        }
+
+    def test_least_loaded_then_fastest_backend_wins(self):
+        """Test that load is compared first and latency breaks ties."""
+        router = LLMRouter(["http://a", "http://b"], max_in_flight=2, max_queue=4)
+        a, b = router.backends
+        a.latency, b.latency = 0.5, 2.0
+
+        assert router.choose("llama2") is a
+
+        a.scheduler._in_flight = 1
+        assert router.choose("llama2") is b
+
+    def test_failing_backend_is_ejected(self):
+        """Test that repeated failures take a backend out of rotation."""
+        router = LLMRouter(["http://a", "http://b"], max_in_flight=1, max_queue=1, max_failures=2)
+        a, b = router.backends
+        b.latency = 10.0
+
+        router.record(a, None, False)
+        assert router.choose("llama2") is a
+        router.record(a, None, False)
+
+        assert not a.healthy
+        assert router.choose("llama2") is b
+
+    def test_model_aware_routing(self):
+        """Test that backends only receive models they have pulled."""
+        router = LLMRouter(["http://small", "http://large"], max_in_flight=1, max_queue=1)
+        small, large = router.backends
+        small.models = {"llama3.2:1b"}
+        large.models = {"llama3:8b", "llama3.2:1b"}
+        large.scheduler._in_flight = 1
+
+        assert router.choose("llama3.2:1b") is small
+        assert router.choose("llama3:8b") is large
+        with pytest.raises(LookupError):
+            router.choose("mistral")
+
+    @pytest.mark.asyncio
+    async def test_health_check_discovers_models(self):
+        """Test that /api/tags populates each backend's model list."""
+        router = LLMRouter(["http://a"], max_in_flight=1, max_queue=1)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, json={"models": [{"name": "llama2:latest"}]})
+        ))
+
+        await router.check_health(client)
+
+        assert router.backends[0].serves("llama2")
+        assert not router.backends[0].serves("mistral")
+        await client.aclose()
+
+
+class TestOllamaServiceRouting:
+    """Test cases for requests routed through OllamaService."""
+
+    @pytest.mark.asyncio
+    async def test_failed_backend_is_retried_elsewhere(self):
+        """Test that a 5xx from one host is retried on another."""
+        hosts = []
+
+        def handler(request):
+            hosts.append(request.url.host)
+            if request.url.host == "down":
+                return httpx.Response(503)
+            return httpx.Response(200, json={"response": "from up"})
+
+        router = LLMRouter(["http://down", "http://up"], max_in_flight=1, max_queue=1)
+        router.backends[1].latency = 5.0
+        service = make_service(router, handler)
+
+        assert await service.generate_learning_tip("symmetry", 1) == "from up"
+        assert hosts == ["down", "up"]
+        assert router.backends[0].error_rate > 0
+
+    @pytest.mark.asyncio
+    async def test_task_models_select_the_model(self):
+        """Test that each task uses its configured model."""
+        models = []
+
+        def handler(request):
+            models.append(json.loads(request.content)["model"])
+            return httpx.Response(200, json={"response": "ok"})
+
+        router = LLMRouter(["http://a"], max_in_flight=1, max_queue=1)
+        service = make_service(router, handler, {"hint": "llama3.2:1b", "analysis": "llama3:8b"})
+
+        await service.generate_hint("Q", 1)
+        await service.analyze_kolam_pattern("loops", {})
+        await service.generate_learning_tip("symmetry", 1)
+
+        assert models == ["llama3.2:1b", "llama3:8b", service.model]
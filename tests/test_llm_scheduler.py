@@ -0,0 +1,108 @@
+"""Tests for the LLM request scheduler."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.services.ai.llm_router import LLMRouter
+from src.services.ai.llm_scheduler import (
+    DeadlineExceededError,
+    LLMScheduler,
+    Priority,
+    QueueFullError,
+)
+from src.services.ai.ollama_service import BUSY_MESSAGE, OllamaService
+
+
+async def hold(scheduler, priority, order, label, duration=0.02, timeout=None):
+    """Occupy a slot for a while, recording the order of admission."""
+    async with scheduler.slot(priority, timeout):
+        order.append(label)
+        await asyncio.sleep(duration)
+
+
+class TestLLMScheduler:
+    """Test cases for admission control."""
+
+    @pytest.mark.asyncio
+    async def test_in_flight_is_bounded(self):
+        """Test that no more than max_in_flight requests run at once."""
+        scheduler = LLMScheduler(max_in_flight=2, max_queue=10, name="test")
+        peak = 0
+
+        async def job():
+            nonlocal peak
+            async with scheduler.slot():
+                peak = max(peak, scheduler.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*[job() for _ in range(6)])
+
+        assert peak == 2
+        assert scheduler.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_interactive_requests_jump_the_queue(self):
+        """Test that queued interactive work runs before background work."""
+        scheduler = LLMScheduler(max_in_flight=1, max_queue=10, name="test")
+        order = []
+
+        first = asyncio.ensure_future(hold(scheduler, Priority.STANDARD, order, "first"))
+        await asyncio.sleep(0)
+        background = asyncio.ensure_future(hold(scheduler, Priority.BACKGROUND, order, "background"))
+        await asyncio.sleep(0)
+        interactive = asyncio.ensure_future(hold(scheduler, Priority.INTERACTIVE, order, "interactive"))
+
+        await asyncio.gather(first, background, interactive)
+
+        assert order == ["first", "interactive", "background"]
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_immediately(self):
+        """Test that requests beyond the queue capacity fail fast."""
+        scheduler = LLMScheduler(max_in_flight=1, max_queue=1, name="test")
+        order = []
+
+        running = asyncio.ensure_future(hold(scheduler, Priority.STANDARD, order, "a", 0.05))
+        await asyncio.sleep(0)
+        queued = asyncio.ensure_future(hold(scheduler, Priority.STANDARD, order, "b"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(QueueFullError):
+            await hold(scheduler, Priority.STANDARD, order, "c")
+
+        await asyncio.gather(running, queued)
+        assert order == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_waiters_past_deadline_are_dropped(self):
+        """Test that a request whose queue deadline passes never runs."""
+        scheduler = LLMScheduler(max_in_flight=1, max_queue=10, name="test")
+        order = []
+
+        running = asyncio.ensure_future(hold(scheduler, Priority.STANDARD, order, "slow", 0.05))
+        await asyncio.sleep(0)
+
+        with pytest.raises(DeadlineExceededError):
+            await hold(scheduler, Priority.INTERACTIVE, order, "late", timeout=0.01)
+
+        await running
+        assert order == ["slow"]
+        assert scheduler.in_flight == 0
+        assert scheduler.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_ollama_service_falls_back_when_shedding(self):
+        """Test that a rejected request gets the busy message at once."""
+        service = OllamaService()
+        service.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"response": "ok"}))
+        )
+        service.router = LLMRouter(["http://ollama"], max_in_flight=1, max_queue=0)
+
+        async with service.router.backends[0].scheduler.slot():
+            response = await service.generate_learning_tip("symmetry", 2)
+
+        assert response == BUSY_MESSAGE
+        await service.close()
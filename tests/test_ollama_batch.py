@@ -0,0 +1,94 @@
+"""Tests for batch generation in OllamaService."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from src.services.ai.llm_router import LLMRouter
+from src.services.ai.ollama_service import OllamaService
+
+
+def make_service(handler, max_in_flight=4):
+    """Create an Ollama service over a mock transport."""
+    return OllamaService(
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        router=LLMRouter(["http://ollama"], max_in_flight=max_in_flight, max_queue=100)
+    )
+
+
+class TestBatchGeneration:
+    """Test cases for generate_batch."""
+
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self):
+        """Test that results line up with prompts despite concurrency."""
+        async def handler(request):
+            prompt = json.loads(request.content)["prompt"]
+            await asyncio.sleep(0.01 * (5 - int(prompt)))
+            return httpx.Response(200, json={"response": f"answer {prompt}"})
+
+        service = make_service(handler)
+
+        results = await service.generate_batch([str(i) for i in range(5)])
+
+        assert results == [f"answer {i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """Test that no more than `concurrency` prompts run at once."""
+        running = peak = 0
+
+        async def handler(request):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return httpx.Response(200, json={"response": "ok"})
+
+        service = make_service(handler)
+
+        await service.generate_batch([f"p{i}" for i in range(10)], concurrency=2)
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_resumes_without_regenerating(self, tmp_path):
+        """Test that completed prompts are reused and failures retried."""
+        checkpoint = tmp_path / "batch.jsonl"
+        calls = []
+
+        def failing_third(request):
+            prompt = json.loads(request.content)["prompt"]
+            calls.append(prompt)
+            if prompt == "c":
+                return httpx.Response(400)
+            return httpx.Response(200, json={"response": prompt.upper()})
+
+        first = await make_service(failing_third).generate_batch(
+            ["a", "b", "c"], checkpoint_path=str(checkpoint)
+        )
+        assert first == ["A", "B", None]
+
+        # Simulate a crash that tore the last line
+        with open(checkpoint, "a") as f:
+            f.write('{"index": 2, "key"')
+
+        second = await make_service(
+            lambda request: httpx.Response(200, json={"response": "C"})
+        ).generate_batch(["a", "b", "c"], checkpoint_path=str(checkpoint))
+
+        assert second == ["A", "B", "C"]
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_ignores_changed_prompts(self, tmp_path):
+        """Test that an entry is only reused for the identical prompt."""
+        checkpoint = tmp_path / "batch.jsonl"
+        echo = lambda request: httpx.Response(200, json={"response": json.loads(request.content)["prompt"]})
+
+        await make_service(echo).generate_batch(["old"], checkpoint_path=str(checkpoint))
+        results = await make_service(echo).generate_batch(["new"], checkpoint_path=str(checkpoint))
+
+        assert results == ["new"]
@@ -0,0 +1,85 @@
+"""Tests for single-flight coalescing of Ollama requests."""
+
+import asyncio
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+from src.core.singleflight import SingleFlight
+from src.services.ai.ollama_service import OllamaError, OllamaService
+
+
+def counter(name):
+    return REGISTRY.get_sample_value(f"{name}_total") or 0.0
+
+
+def make_service(responses):
+    """Create an Ollama service whose upstream answers slowly."""
+    upstream = []
+
+    async def handler(request):
+        upstream.append(request)
+        await asyncio.sleep(0.05)
+        return responses(request)
+
+    service = OllamaService()
+    service.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return service, upstream
+
+
+class TestRequestCoalescing:
+    """Test cases for request coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_identical_prompts_share_one_upstream_call(self):
+        """Test that concurrent identical prompts hit Ollama once."""
+        service, upstream = make_service(lambda request: httpx.Response(200, json={"response": "shared"}))
+        coalesced_before = counter("ollama_coalesced_requests")
+
+        results = await asyncio.gather(*[service._generate("same prompt") for _ in range(5)])
+
+        assert results == ["shared"] * 5
+        assert len(upstream) == 1
+        assert counter("ollama_coalesced_requests") - coalesced_before == 4
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_different_prompts_are_not_coalesced(self):
+        """Test that distinct prompts each get their own request."""
+        service, upstream = make_service(lambda request: httpx.Response(200, json={"response": "ok"}))
+
+        await asyncio.gather(service._generate("one"), service._generate("two"))
+
+        assert len(upstream) == 2
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_every_waiter(self):
+        """Test that a failed shared call fails all coalesced callers."""
+        service, upstream = make_service(lambda request: httpx.Response(503))
+
+        results = await asyncio.gather(
+            *[service._generate("boom") for _ in range(3)], return_exceptions=True
+        )
+
+        assert all(isinstance(result, OllamaError) for result in results)
+        assert len(upstream) == 1
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_work(self):
+        """Test that the remaining callers still get the result."""
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.05)
+            return 42
+
+        first = asyncio.ensure_future(flight.do("key", work))
+        second = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert await second == (42, True)
+        assert flight.in_flight() == 0
@@ -0,0 +1,75 @@
+"""Tests for prefix-stable Ollama prompts and usage metrics."""
+
+import json
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+from src.services.ai.ollama_service import (
+    SYSTEM_PROMPTS,
+    TASK_EXPLANATION,
+    TASK_HINT,
+    OllamaService,
+)
+
+
+def make_service(payloads, reply=None):
+    """Create an Ollama service that records request bodies."""
+    def handler(request):
+        if request.url.path == "/api/tags":
+            return httpx.Response(200, json={"models": []})
+        payloads.append(json.loads(request.content))
+        return httpx.Response(200, json=reply or {"response": "ok"})
+
+    service = OllamaService()
+    service.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return service
+
+
+class TestPromptTemplates:
+    """Test cases for cache-friendly prompt construction."""
+
+    @pytest.mark.asyncio
+    async def test_instructions_are_sent_as_system_prompt(self):
+        """Test that the fixed instructions are identical across questions."""
+        payloads = []
+        service = make_service(payloads)
+
+        await service.generate_hint("What is a pulli?", 1)
+        await service.generate_hint("What is a sikku?", 3, category="history")
+
+        first, second = payloads
+        assert first["system"] == second["system"] == SYSTEM_PROMPTS[TASK_HINT]
+        assert first["prompt"].startswith("Question: What is a pulli?")
+        assert "You are" not in first["prompt"]
+        assert first["keep_alive"]
+        assert first["options"]["num_predict"] == 500
+        await service.close()
+
+    def test_prompt_ends_with_task_cue(self):
+        """Test that variable fields come before the answer cue."""
+        prompt = OllamaService().build_prompt(
+            TASK_EXPLANATION, question="Q?", correct_answer="A", user_answer="B"
+        )
+
+        assert prompt == "Question: Q?\nCorrect Answer: A\nUser's Answer: B\n\nExplanation:"
+
+    @pytest.mark.asyncio
+    async def test_usage_is_recorded(self):
+        """Test that token counts from the response feed the histograms."""
+        payloads = []
+        service = make_service(payloads, {
+            "response": "ok",
+            "prompt_eval_count": 12,
+            "eval_count": 40,
+            "prompt_eval_duration": 5_000_000,
+            "total_duration": 900_000_000
+        })
+        labels = {"task": TASK_HINT}
+        before = REGISTRY.get_sample_value("llm_completion_tokens_sum", labels) or 0.0
+
+        await service.generate_hint("Why dots?", 2)
+
+        assert REGISTRY.get_sample_value("llm_completion_tokens_sum", labels) - before == 40
+        await service.close()
@@ -0,0 +1,86 @@
+"""Tests for streaming Ollama responses."""
+
+import json
+
+import httpx
+import pytest
+
+from src.api.learning import sse_events
+from src.services.ai.ollama_service import OllamaService, OllamaStreamError
+
+
+def ndjson(*chunks):
+    """Encode chunks the way Ollama streams them."""
+    return "".join(json.dumps(chunk) + "\n" for chunk in chunks).encode("utf-8")
+
+
+def make_service(handler):
+    """Create an Ollama service backed by a mock transport."""
+    service = OllamaService()
+    service.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return service
+
+
+async def collect(tokens):
+    return [token async for token in tokens]
+
+
+class TestOllamaStreaming:
+    """Test cases for token streaming."""
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_tokens_in_order(self):
+        """Test that each NDJSON chunk is yielded as it arrives."""
+        requests = []
+
+        def handler(request):
+            requests.append(json.loads(request.content))
+            return httpx.Response(200, content=ndjson(
+                {"response": "Kolams ", "done": False},
+                {"response": "use dots.", "done": False},
+                {"response": "", "done": True}
+            ))
+
+        service = make_service(handler)
+        tokens = await collect(service.stream_hint("What is a pulli?", 2))
+
+        assert tokens == ["Kolams ", "use dots."]
+        assert requests[0]["stream"] is True
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_stream_error_status_raises_apology(self):
+        """Test that an HTTP error raises with the apology instead of yielding it."""
+        service = make_service(lambda request: httpx.Response(500))
+
+        with pytest.raises(OllamaStreamError, match="apologize"):
+            await collect(service.stream_explanation("Q", "A"))
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_stream_failure_after_tokens_is_an_error_event(self):
+        """Test that a mid-stream error ends the events with error, not done."""
+        service = make_service(lambda request: httpx.Response(200, content=ndjson(
+            {"response": "Partial", "done": False},
+            {"error": "model crashed"}
+        )))
+
+        events = await collect(sse_events(service.stream_learning_tip("symmetry", 3)))
+
+        assert events[0] == 'data: {"token": "Partial"}\n\n'
+        assert len(events) == 2
+        assert events[1].startswith("event: error\n")
+        assert "apologize" in json.loads(events[1].split("data: ", 1)[1])["message"]
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_sse_events_format(self):
+        """Test that tokens are framed as server-sent events."""
+        async def tokens():
+            yield "Hello"
+            yield " world"
+
+        events = await collect(sse_events(tokens()))
+
+        assert events[0] == 'data: {"token": "Hello"}\n\n'
+        assert events[-1].startswith("event: done")
@@ -0,0 +1,107 @@
+"""Tests for the pulli (dot-grid) Kolam generator."""
+
+import pytest
+from math import gcd
+
+from src.services.ai.pulli_kolam import PulliGrid, PulliKolamGenerator
+
+
+def mirror_mask(grid, kolam):
+    """Rebuild a mirror bitmask from a generated Kolam."""
+    return sum(1 << grid.edge_index[tuple(point)] for point in kolam["mirrors"])
+
+
+class TestPulliGrid:
+    """Test cases for the mirror-curve grid model."""
+
+    @pytest.mark.parametrize("rows,cols", [(1, 1), (2, 3), (3, 3), (4, 6), (5, 3)])
+    def test_plain_grid_loop_count(self, rows, cols):
+        """Test that a grid without mirrors draws gcd(rows, cols) loops."""
+        assert PulliGrid(rows, cols).count_loops(0) == gcd(rows, cols)
+
+    def test_edge_orbits_cover_all_edges(self):
+        """Test that symmetry orbits partition the internal edges."""
+        grid = PulliGrid(4, 4)
+        orbits = grid.edge_orbits("rotational")
+
+        edges = sorted(edge for orbit in orbits for edge in orbit)
+        assert edges == list(range(len(grid.edges)))
+        assert all(len(orbit) in (1, 2, 4) for orbit in orbits)
+
+
+class TestPulliKolamGenerator:
+    """Test cases for sikku Kolam search and caching."""
+
+    @pytest.fixture
+    def generator(self, tmp_path):
+        """Create generator with a temporary cache directory."""
+        return PulliKolamGenerator(cache_dir=str(tmp_path))
+
+    def test_generated_kolams_are_single_loops(self, generator):
+        """Test that every result is one loop through every segment."""
+        result = generator.generate(3, 4, "none", max_results=10)
+        grid = PulliGrid(3, 4)
+
+        assert len(result["kolams"]) == 10
+        for kolam in result["kolams"]:
+            assert grid.count_loops(mirror_mask(grid, kolam)) == 1
+            assert len(kolam["loop"]) == grid.segment_count
+
+    def test_symmetry_constraint_is_respected(self, generator):
+        """Test that results are invariant under the requested symmetry."""
+        result = generator.generate(5, 5, "rotational", max_results=5)
+        grid = PulliGrid(5, 5)
+
+        assert result["kolams"]
+        for kolam in result["kolams"]:
+            mirrors = {tuple(point) for point in kolam["mirrors"]}
+            for transform in grid.transforms("rotational"):
+                assert {transform(*point) for point in mirrors} == mirrors
+
+    def test_exhaustive_search_finds_distinct_designs(self, generator):
+        """Test that exhaustive results are distinct up to grid symmetry."""
+        result = generator.generate(3, 3, "none", max_results=1000)
+
+        assert result["exhaustive"] is True
+        masks = {frozenset(map(tuple, kolam["mirrors"])) for kolam in result["kolams"]}
+        assert len(masks) == len(result["kolams"])
+
+    def test_results_are_persisted(self, generator, tmp_path, monkeypatch):
+        """Test that a new generator reuses results from disk."""
+        first = generator.generate(4, 4, "none", max_results=3)
+
+        reloaded = PulliKolamGenerator(cache_dir=str(tmp_path))
+        monkeypatch.setattr(reloaded, "_search", lambda *args: pytest.fail("search should be cached"))
+
+        assert reloaded.generate(4, 4, "none", max_results=3) == first
+
+    def test_smaller_requests_reuse_larger_search(self, generator, monkeypatch):
+        """Test that one cached search per grid serves smaller max_results."""
+        full = generator.generate(4, 4, "none", max_results=6)
+        monkeypatch.setattr(generator, "_search", lambda *args: pytest.fail("search should be cached"))
+
+        fewer = generator.generate(4, 4, "none", max_results=2)
+
+        assert fewer["kolams"] == full["kolams"][:2]
+        assert fewer["exhaustive"] is False
+
+    def test_seeded_results_are_not_persisted(self, generator, tmp_path):
+        """Test that seeded samples stay out of the disk cache."""
+        generator.generate(4, 4, "none", max_results=3, seed=7)
+
+        assert not list(tmp_path.glob("*seed*"))
+
+    def test_memory_cache_is_bounded(self, tmp_path):
+        """Test that the in-memory cache evicts least recently used grids."""
+        generator = PulliKolamGenerator(cache_dir=str(tmp_path), memory_size=2)
+
+        for seed in range(4):
+            generator.generate(3, 3, "none", max_results=2, seed=seed)
+
+        assert len(generator._memory) == 2
+        assert list(generator._memory) == ["3x3-none-2-seed2", "3x3-none-2-seed3"]
+
+    def test_invalid_symmetry(self, generator):
+        """Test that unknown symmetry constraints are rejected."""
+        with pytest.raises(ValueError):
+            generator.generate(3, 3, "spiral")
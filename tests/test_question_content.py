@@ -0,0 +1,206 @@
+"""Tests for the precomputed hint/explanation cache."""
+
+import pytest
+from types import SimpleNamespace
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.core.database import Base
+from src.db.models.models import QuestionAIContent, TriviaQuestion
+from src.schemas import TriviaQuestionUpdate
+from src.services.ai.ollama_service import AILearningAssistant, OllamaError
+from src.services.learning_service import LearningService
+from src.services.question_content_service import QuestionContentService
+
+
+class FakeOllama:
+    """Stand-in for OllamaService that counts calls."""
+
+    def __init__(self, model="llama2"):
+        self.model = model
+        self.calls = []
+        self.fail = False
+
+    def model_for(self, task):
+        return self.model
+
+    def build_prompt(self, task, **fields):
+        return (task, fields)
+
+    async def generate_batch(self, prompts, task=None, concurrency=None, checkpoint_path=None):
+        results = []
+        for kind, fields in prompts:
+            generate = self.generate_hint if kind == "hint" else self.generate_explanation
+            try:
+                results.append(await generate(**fields))
+            except OllamaError:
+                results.append(None)
+        return results
+
+    async def generate_hint(self, question, difficulty_level, category=None, fail_silently=True, priority=None):
+        self.calls.append(("hint", None))
+        if self.fail:
+            raise OllamaError("down")
+        return f"hint for {question}"
+
+    async def generate_explanation(self, question, correct_answer, user_answer=None, context=None,
+                                   fail_silently=True, priority=None):
+        self.calls.append(("explanation", user_answer))
+        if self.fail:
+            raise OllamaError("down")
+        return f"explanation ({user_answer or 'canonical'})"
+
+
+@pytest.fixture
+def db():
+    """Create an in-memory database session."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def question(db):
+    """Create a multiple-choice trivia question."""
+    question = TriviaQuestion(
+        question_text="What are kolam dots called?",
+        question_type="multiple_choice",
+        difficulty_level=2,
+        options=["Pulli", "Sikku", "Kambi"],
+        correct_answer="Pulli",
+        is_active=True
+    )
+    db.add(question)
+    db.commit()
+    return question
+
+
+@pytest.fixture
+def ollama():
+    return FakeOllama()
+
+
+@pytest.fixture
+def service(db, ollama):
+    return QuestionContentService(db, assistant=SimpleNamespace(ollama_service=ollama))
+
+
+class TestQuestionContentService:
+    """Test cases for the question content cache."""
+
+    @pytest.mark.asyncio
+    async def test_hint_is_generated_once(self, service, ollama, question):
+        """Test that repeat hint requests are served from the cache."""
+        first = await service.get_hint(question)
+        second = await service.get_hint(question)
+
+        assert first == second
+        assert ollama.calls == [("hint", None)]
+
+    @pytest.mark.asyncio
+    async def test_pregenerate_covers_hint_and_every_wrong_option(self, service, ollama, question):
+        """Test that pre-generation fills all entries quiz traffic needs."""
+        stats = await service.pregenerate([question])
+
+        assert stats == {"generated": 4, "cached": 0, "failed": 0}
+        assert await service.get_explanation(question, " sikku ") == "explanation (Sikku)"
+        assert await service.get_explanation(question, "free text") == "explanation (canonical)"
+        assert await service.get_explanation(question, "Pulli") == "explanation (canonical)"
+        assert len(ollama.calls) == 4
+
+        assert (await service.pregenerate([question]))["cached"] == 4
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self, service, ollama, question, db):
+        """Test that an Ollama failure returns an apology without caching it."""
+        ollama.fail = True
+
+        hint = await service.get_hint(question)
+
+        assert "apologize" in hint
+        assert db.query(QuestionAIContent).count() == 0
+
+    @pytest.mark.asyncio
+    async def test_model_change_misses_cache(self, db, question, service):
+        """Test that entries are keyed by model."""
+        await service.get_hint(question)
+
+        other = QuestionContentService(db, assistant=SimpleNamespace(ollama_service=FakeOllama("mistral")))
+
+        assert other.get_cached(question, "hint") is None
+
+    @pytest.mark.asyncio
+    async def test_update_invalidates_entries(self, db, question, service):
+        """Test that updating a question drops its cached content."""
+        await service.pregenerate([question])
+
+        LearningService(db).update_trivia_question(
+            question.id, TriviaQuestionUpdate(correct_answer="Sikku")
+        )
+
+        assert db.query(QuestionAIContent).count() == 0
+
+    @pytest.mark.asyncio
+    async def test_edit_during_generation_is_not_served_stale(self, db, question, service, ollama):
+        """Test that a hint finishing after an edit is not served for the edited question."""
+        generate = ollama.generate_hint
+
+        async def edited_meanwhile(**fields):
+            text = await generate(**fields)
+            LearningService(db).update_trivia_question(
+                question.id, TriviaQuestionUpdate(question_text="What are kolam loops called?")
+            )
+            return text
+
+        ollama.generate_hint = edited_meanwhile
+
+        stale = await service.get_hint(question)
+        ollama.generate_hint = generate
+
+        assert stale == "hint for What are kolam dots called?"
+        assert await service.get_hint(question) == "hint for What are kolam loops called?"
+        assert len(ollama.calls) == 2
+
+
+class TestAssistantContentCache:
+    """Test cases for the assistant's cache-backed hint and explanation calls."""
+
+    @pytest.fixture
+    def assistant(self, db, ollama):
+        # The assistant opens and closes its own sessions on the same database
+        factory = sessionmaker(bind=db.get_bind())
+        return AILearningAssistant(ollama, session_factory=factory)
+
+    @pytest.fixture
+    def question_data(self, question):
+        return {
+            "question_text": question.question_text,
+            "correct_answer": question.correct_answer,
+            "difficulty_level": question.difficulty_level,
+            "category": question.category,
+            "explanation": question.explanation
+        }
+
+    @pytest.mark.asyncio
+    async def test_stored_question_is_generated_once(self, assistant, ollama, question, question_data):
+        """Test that repeat calls with a question id reuse persisted content."""
+        hints = [await assistant.get_question_hint(question_data, question_id=question.id) for _ in range(2)]
+        explanations = [
+            await assistant.get_question_explanation(question.id, question_data, "Sikku")
+            for _ in range(2)
+        ]
+
+        assert hints[0] == hints[1]
+        assert explanations[0] == explanations[1] == "explanation (Sikku)"
+        assert ollama.calls == [("hint", None), ("explanation", "Sikku")]
+
+    @pytest.mark.asyncio
+    async def test_unknown_question_is_generated_directly(self, assistant, ollama, question_data, db):
+        """Test that calls without a stored question still reach the model."""
+        await assistant.get_question_hint(question_data)
+        await assistant.get_question_hint(question_data, question_id=999)
+
+        assert ollama.calls == [("hint", None), ("hint", None)]
+        assert db.query(QuestionAIContent).count() == 0
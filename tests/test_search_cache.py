@@ -0,0 +1,107 @@
+"""Tests for the search result cache and query normalization."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.search.cache import SearchResultCache
+from src.search.indices import KOLAM_IMAGES
+
+
+@pytest.fixture
+def cached_service(search_service, fake_opensearch):
+    """search_service with its result cache on, over one festival Kolam."""
+    fake_opensearch.documents["kolam_images"] = [{"id": 1, "title": "Lotus", "tags": ["festival"]}]
+    search_service.cache.enabled = True
+    return search_service
+
+
+class TestSearchResultCache:
+    """Test cases for SearchResultCache."""
+
+    def test_equivalent_queries_share_a_key(self):
+        """Test that clause order, terms order and query case don't change the key."""
+        first = {"query": {"bool": {"must": [
+            {"multi_match": {"query": "Lotus  Kolam", "fields": ["title^2", "tags"]}},
+            {"terms": {"tags": ["festival", "diwali"]}},
+        ]}}}
+        second = {"query": {"bool": {"must": [
+            {"terms": {"tags": ["diwali", "festival"]}},
+            {"multi_match": {"query": "lotus kolam", "fields": ["tags", "title^2"]}},
+        ]}}}
+
+        assert SearchResultCache.make_key(KOLAM_IMAGES, first, 10) == SearchResultCache.make_key(KOLAM_IMAGES, second, 10)
+        assert SearchResultCache.make_key(KOLAM_IMAGES, first, 10) != SearchResultCache.make_key(KOLAM_IMAGES, first, 20)
+
+    def test_entries_expire_and_evict(self):
+        """Test the ttl and the least-recently-used bound."""
+        cache = SearchResultCache(ttl=0.05, max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put(key, [{"id": key}], [key])
+
+        assert cache.get("a") is None
+        assert cache.get("c") == [{"id": "c"}]
+        time.sleep(0.06)
+        assert cache.get("c") is None
+
+    def test_invalidation_by_tag_and_user(self):
+        """Test that a write only drops entries the document could join."""
+        cache = SearchResultCache()
+        cache.put("festival", [{"id": 1}], ["1"], tags=["festival"])
+        cache.put("wedding", [{"id": 2}], ["2"], tags=["wedding"])
+        cache.put("user-7", [{"id": 3}], ["3"], user_id=7)
+
+        # A private image of user 7 tagged festival
+        dropped = cache.invalidate("9", {"id": 9, "tags": ["festival"], "user_id": 7, "is_public": False})
+
+        assert dropped == 1
+        assert cache.get("user-7") is None
+        assert cache.get("festival") is not None
+
+        # A public festival image, then a delete of a cached result
+        assert cache.invalidate("10", {"id": 10, "tags": ["festival"], "user_id": 8, "is_public": True}) == 1
+        assert cache.invalidate("2") == 1
+        assert len(cache) == 0
+
+
+class TestCachedSearch:
+    """Test cases for caching in SearchService."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_search_is_served_from_cache(self, cached_service, fake_opensearch):
+        """Test that the second identical search skips the cluster."""
+
+        first = await cached_service.search_similar_kolams("lotus", tags=["festival", "diwali"])
+        second = await cached_service.search_similar_kolams("Lotus", tags=["diwali", "festival"])
+
+        assert first == second == [{"id": 1, "title": "Lotus", "tags": ["festival"]}]
+        assert len(fake_opensearch.bodies) == 1
+        assert "image_vector" not in fake_opensearch.bodies[0]["_source"]
+
+    @pytest.mark.asyncio
+    async def test_index_write_invalidates_matching_searches_once_flushed(self, cached_service, fake_opensearch):
+        """Test that a matching image invalidates when its flush makes it searchable."""
+        await cached_service.search_similar_kolams(tags=["festival"])
+
+        await cached_service.index_kolam_image({"id": 2, "tags": ["wedding"], "user_id": 3, "is_public": True})
+        await cached_service.indexer.flush()
+        await cached_service.search_similar_kolams(tags=["festival"])
+        assert len(fake_opensearch.bodies) == 1
+
+        await cached_service.index_kolam_image({"id": 4, "tags": ["festival"], "user_id": 3, "is_public": True})
+        await cached_service.search_similar_kolams(tags=["festival"])
+        assert len(fake_opensearch.bodies) == 1
+
+        await cached_service.indexer.flush()
+        await cached_service.search_similar_kolams(tags=["festival"])
+        assert len(fake_opensearch.bodies) == 2
+
+    @pytest.mark.asyncio
+    async def test_search_overlapping_an_invalidation_is_not_stored(self, cached_service, fake_opensearch):
+        """Test that results read before a write became visible are not cached."""
+        fake_opensearch.latency = 0.01
+        await cached_service.index_kolam_image({"id": 1, "title": "Lotus ring", "tags": ["festival"], "is_public": True})
+        await asyncio.gather(cached_service.search_similar_kolams(tags=["festival"]), cached_service.indexer.flush())
+
+        assert len(cached_service.cache) == 0
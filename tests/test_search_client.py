@@ -0,0 +1,72 @@
+"""Tests for the async OpenSearch client and SearchService."""
+
+import asyncio
+
+import pytest
+
+from src.search.client import KeepAliveHttpConnection
+
+
+class TestSearchService:
+    """Test cases for async search."""
+
+    @pytest.mark.asyncio
+    async def test_initialize_creates_indices(self, search_service, fake_opensearch):
+        """Test that every index is created behind its alias on startup."""
+        await search_service.initialize()
+
+        assert sorted(aliases for _, aliases in fake_opensearch.created) == [
+            ["kolam_images"], ["search_suggestions"], ["trivia_questions"]
+        ]
+        assert all(index.startswith(f"{aliases[0]}_") for index, aliases in fake_opensearch.created)
+
+    @pytest.mark.asyncio
+    async def test_initialize_skips_unreachable_cluster(self, search_service, fake_opensearch):
+        """Test that startup reports an unreachable cluster instead of creating indices."""
+        fake_opensearch.fail = True
+
+        await search_service.initialize()
+
+        assert fake_opensearch.created == []
+
+    @pytest.mark.asyncio
+    async def test_search_all_fans_out_concurrently(self, search_service, fake_opensearch):
+        """Test that kolam and question searches run at the same time."""
+        fake_opensearch.documents = {
+            "kolam_images": [{"title": "Lotus"}],
+            "trivia_questions": [{"question_text": "What is a pulli?"}],
+        }
+        fake_opensearch.latency = 0.01
+
+        started = asyncio.get_running_loop().time()
+        results = await search_service.search_all("lotus")
+        elapsed = asyncio.get_running_loop().time() - started
+
+        assert results == {
+            "kolams": [{"title": "Lotus"}],
+            "questions": [{"question_text": "What is a pulli?"}],
+        }
+        assert elapsed < 0.02
+        assert {index for index, _, _ in fake_opensearch.searches} == {"kolam_images", "trivia_questions"}
+
+    @pytest.mark.asyncio
+    async def test_search_failure_returns_no_results(self, search_service, fake_opensearch):
+        """Test that an unreachable cluster degrades to empty results."""
+        fake_opensearch.fail = True
+
+        assert await search_service.search_trivia_questions("kolam") == []
+
+
+class TestKeepAliveHttpConnection:
+    """Test cases for the pooled transport."""
+
+    @pytest.mark.asyncio
+    async def test_session_uses_pool_settings(self):
+        """Test that pool size and keep-alive reach the aiohttp connector."""
+        connection = KeepAliveHttpConnection(pool_maxsize=7, keepalive_timeout=90.0)
+
+        await connection._create_aiohttp_session()
+
+        assert connection.session.connector.limit == 7
+        assert connection.session.connector._keepalive_timeout == 90.0
+        await connection.close()
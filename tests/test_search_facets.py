@@ -0,0 +1,74 @@
+"""Tests for faceted Kolam gallery search."""
+
+import pytest
+
+from src.search.pagination import decode_cursor
+
+
+AGGREGATIONS = {
+    "tags": {"buckets": [{"key": "festival", "doc_count": 4}, {"key": "diwali", "doc_count": 2}]},
+    "detected_patterns": {"buckets": [{"key": "pulli", "doc_count": 3}]},
+    "symmetry_type": {"buckets": []},
+    "complexity": {"buckets": [
+        {"key": "low", "to": 0.33, "doc_count": 1},
+        {"key": "medium", "from": 0.33, "to": 0.66, "doc_count": 2},
+        {"key": "high", "from": 0.66, "doc_count": 1},
+    ]},
+}
+
+
+@pytest.fixture
+def gallery(fake_opensearch):
+    """One Kolam hit, plus aggregations whenever they are asked for."""
+    fake_opensearch.documents["kolam_images"] = [{"id": 1, "created_at": "2025-01-01"}]
+    fake_opensearch.aggregations = AGGREGATIONS
+    return fake_opensearch
+
+
+class TestFacetSearch:
+    """Test cases for SearchService.facet_kolams."""
+
+    @pytest.mark.asyncio
+    async def test_hits_and_facets_in_one_search(self, search_service, gallery):
+        """Test that every facet comes back from a single request."""
+        response = await search_service.facet_kolams("lotus", complexity_range=(0.5, None))
+
+        assert len(gallery.bodies) == 1
+        assert set(gallery.bodies[0]["aggs"]) == {"tags", "detected_patterns", "symmetry_type", "complexity"}
+        assert {"range": {"complexity_score": {"gte": 0.5}}} in gallery.bodies[0]["query"]["bool"]["filter"]
+        assert response["results"] == [{"id": 1, "created_at": "2025-01-01"}]
+        assert response["facets"]["tags"] == [{"value": "festival", "count": 4}, {"value": "diwali", "count": 2}]
+        assert [bucket["value"] for bucket in response["facets"]["complexity"]] == ["low", "medium", "high"]
+
+    @pytest.mark.asyncio
+    async def test_global_facets_are_reused(self, search_service, gallery):
+        """Test that unfiltered searches aggregate once, filtered ones every time."""
+        first = await search_service.facet_kolams()
+        second = await search_service.facet_kolams()
+        await search_service.facet_kolams(tags=["festival"])
+
+        assert first["facets"] == second["facets"]
+        assert ["aggs" in body for body in gallery.bodies] == [True, False, True]
+
+    @pytest.mark.asyncio
+    async def test_responses_are_cached_until_invalidated(self, search_service, gallery):
+        """Test that a repeated search is served from the result cache."""
+        search_service.cache.enabled = True
+
+        first = await search_service.facet_kolams("lotus", tags=["festival"])
+        second = await search_service.facet_kolams("Lotus ", tags=["festival"])
+        search_service.cache.invalidate("1")
+        await search_service.facet_kolams("lotus", tags=["festival"])
+
+        assert first == second
+        assert len(gallery.bodies) == 2
+
+    @pytest.mark.asyncio
+    async def test_full_page_continues_in_page_order(self, search_service, gallery):
+        """Test that a full first page returns a cursor for page_kolams."""
+        full = await search_service.facet_kolams("lotus", size=1)
+        short = await search_service.facet_kolams("lotus", size=5)
+
+        assert gallery.bodies[0]["sort"] == [{"_score": "desc"}, {"id": "desc"}]
+        assert decode_cursor(full["next_cursor"]) == (None, ["2025-01-01", 1])
+        assert short["next_cursor"] is None
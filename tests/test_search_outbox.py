@@ -0,0 +1,192 @@
+"""Tests for the search outbox and its relay."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from opensearchpy import ConnectionError as TransportConnectionError
+from opensearchpy.serializer import JSONSerializer
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.core.database import Base
+from src.db.models.models import SearchOutbox, User
+from src.schemas import KolamImageCreate, TriviaQuestionCreate
+from src.search.cache import SearchResultCache
+from src.search.client import AsyncOpenSearchClient, SearchService
+from src.search.indexer import BulkIndexer
+from src.search.relay import OutboxRelay
+from src.search.suggest import Suggester
+from src.services.kolam_service import KolamService
+from src.services.learning_service import LearningService
+
+
+class FakeBulkClient:
+    """Records bulk actions, rejecting documents listed in reject."""
+
+    def __init__(self, reject=()):
+        self.reject = set(reject)
+        self.actions = []
+        self.transport = SimpleNamespace(serializer=JSONSerializer())
+
+    async def bulk(self, body, *args, **kwargs):
+        lines = [json.loads(line) for line in body.strip().split("\n")]
+        items = []
+        for line in lines:
+            if not set(line) & {"index", "delete"}:
+                continue
+            op, meta = next(iter(line.items()))
+            self.actions.append((op, meta["_index"], meta["_id"]))
+            status = 400 if meta["_id"] in self.reject else 200
+            items.append({op: {"_index": meta["_index"], "_id": meta["_id"], "status": status}})
+        return {"errors": bool(self.reject), "items": items}
+
+
+class UnreachableBulkClient(FakeBulkClient):
+    """Fails every bulk request like a cluster that is down."""
+
+    async def bulk(self, body, *args, **kwargs):
+        raise TransportConnectionError("N/A", "connection refused", None)
+
+
+@pytest.fixture
+def session_factory():
+    """Create an in-memory database shared by every session."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    db = factory()
+    db.add(User(email="a@example.com", username="a", hashed_password="x"))
+    db.commit()
+    db.close()
+    return factory
+
+
+def make_relay(session_factory, client, **kwargs):
+    search = SearchService(
+        AsyncOpenSearchClient(client=client),
+        indexer=BulkIndexer(client, max_retries=0),
+        cache=SearchResultCache(),
+        suggester=Suggester()
+    )
+    return OutboxRelay(search, session_factory, **{"batch_size": 10, **kwargs})
+
+
+def create_image(db, title="Lotus"):
+    return KolamService(db).create_kolam_image(
+        1, "lotus.png", "/tmp/lotus.png", 10, "image/png",
+        KolamImageCreate(title=title, tags=["festival"], is_public=True)
+    )
+
+
+class TestSearchOutbox:
+    """Test cases for outbox writes and relaying."""
+
+    def test_writes_record_outbox_entries_in_their_transaction(self, session_factory):
+        """Test that creates, updates and deletes each leave an entry."""
+        db = session_factory()
+        image = create_image(db)
+        KolamService(db).delete_kolam_image(image.id)
+        question = LearningService(db).create_trivia_question(TriviaQuestionCreate(
+            question_text="What is a pulli?", question_type="multiple_choice", difficulty_level=1, correct_answer="A dot"
+        ))
+        LearningService(db).delete_trivia_question(question.id)
+
+        entries = [(entry.index_name, entry.doc_id) for entry in db.query(SearchOutbox).order_by(SearchOutbox.id)]
+        assert entries == [
+            ("kolam_images", str(image.id)),
+            ("kolam_images", str(image.id)),
+            ("trivia_questions", str(question.id)),
+            ("trivia_questions", str(question.id)),
+        ]
+        db.close()
+
+    @pytest.mark.asyncio
+    async def test_relay_sends_current_state_and_clears_entries(self, session_factory):
+        """Test that existing rows are indexed, deleted rows removed, and entries acknowledged."""
+        db = session_factory()
+        kept = create_image(db, "Kept").id
+        removed = create_image(db, "Removed").id
+        KolamService(db).delete_kolam_image(removed)
+        db.close()
+        client = FakeBulkClient()
+
+        relayed = await make_relay(session_factory, client).relay_once()
+
+        assert relayed == 3
+        assert sorted(action for action in client.actions if action[1] == "kolam_images") == [
+            ("delete", "kolam_images", str(removed)),
+            ("index", "kolam_images", str(kept)),
+        ]
+        db = session_factory()
+        assert db.query(SearchOutbox).count() == 0
+        db.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_documents_stay_in_the_outbox(self, session_factory):
+        """Test at-least-once delivery: a rejected document is kept for the next pass."""
+        db = session_factory()
+        create_image(db, "First")
+        second = str(create_image(db, "Second").id)
+        db.close()
+
+        await make_relay(session_factory, FakeBulkClient(reject={second})).relay_once()
+
+        db = session_factory()
+        entries = db.query(SearchOutbox).all()
+        assert [(entry.doc_id, entry.attempts) for entry in entries] == [(second, 1)]
+        db.close()
+
+        client = FakeBulkClient()
+        await make_relay(session_factory, client).relay_once()
+        assert [action for action in client.actions if action[1] == "kolam_images"] == [
+            ("index", "kolam_images", second)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_poison_entries_are_dead_lettered(self, session_factory):
+        """Test that an entry failing max_attempts times stops being read."""
+        db = session_factory()
+        poison = str(create_image(db, "Poison").id)
+        db.close()
+        relay = make_relay(session_factory, FakeBulkClient(reject={poison}), max_attempts=2)
+
+        assert await relay.relay_once() == 0
+        assert await relay.relay_once() == 0
+
+        db = session_factory()
+        entry = db.query(SearchOutbox).one()
+        assert (entry.doc_id, entry.attempts) == (poison, 2)
+        assert entry.failed_at is not None
+        later = create_image(db, "Later").id
+        db.close()
+
+        client = FakeBulkClient(reject={poison})
+        assert await make_relay(session_factory, client, max_attempts=2).relay_once() == 1
+        assert [action for action in client.actions if action[1] == "kolam_images"] == [
+            ("index", "kolam_images", str(later))
+        ]
+
+    @pytest.mark.asyncio
+    async def test_outage_defers_entries_without_counting_attempts(self, session_factory):
+        """Test that transport errors back off instead of dead-lettering the outbox."""
+        db = session_factory()
+        image = str(create_image(db, "Lotus").id)
+        db.close()
+        relay = make_relay(session_factory, UnreachableBulkClient(), max_attempts=2, max_backoff=4.0)
+
+        for _ in range(5):
+            assert await relay.relay_once() == 0
+
+        db = session_factory()
+        entry = db.query(SearchOutbox).one()
+        assert (entry.doc_id, entry.attempts, entry.failed_at) == (image, 0, None)
+        db.close()
+        assert relay.failed_passes == 5
+        assert relay.delay() == 4.0
+
+        relay.search.indexer.client = FakeBulkClient()
+        assert await relay.relay_once() == 1
+        assert relay.failed_passes == 0
+        assert relay.delay() == relay.poll_interval
@@ -0,0 +1,87 @@
+"""Tests for filter-context queries and cursor pagination."""
+
+import pytest
+
+from src.search.pagination import ExpiredCursorError, InvalidCursorError, decode_cursor, encode_cursor
+
+
+@pytest.fixture
+def kolams(fake_opensearch):
+    """Numbered Kolam documents, newest (highest id) first."""
+    fake_opensearch.documents["kolam_images"] = [
+        {"id": i, "created_at": f"2025-01-{i:02d}"} for i in range(5, 0, -1)
+    ]
+    return fake_opensearch
+
+
+class TestFilterContext:
+    """Test cases for where query clauses go."""
+
+    @pytest.mark.asyncio
+    async def test_only_text_match_is_scored(self, search_service, fake_opensearch):
+        """Test that tags, visibility and ranges run as filters."""
+        await search_service.search_similar_kolams("lotus", tags=["festival"], complexity_range=(1, 5), user_id=3)
+
+        query = fake_opensearch.bodies[0]["query"]["bool"]
+        assert [list(clause) for clause in query["must"]] == [["multi_match"]]
+        assert {"terms": {"tags": ["festival"]}} in query["filter"]
+        assert len(query["filter"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_trivia_filters_are_not_scored(self, search_service, fake_opensearch):
+        """Test that trivia searches keep is_active and category out of must."""
+        await search_service.search_trivia_questions(category="history")
+
+        query = fake_opensearch.bodies[0]["query"]["bool"]
+        assert query["must"] == []
+        assert query["filter"] == [{"term": {"category": "history"}}, {"term": {"is_active": True}}]
+
+
+class TestCursorPagination:
+    """Test cases for search_after pagination over a point in time."""
+
+    @pytest.mark.asyncio
+    async def test_pages_follow_on_and_close_the_snapshot(self, search_service, kolams):
+        """Test that cursors walk every document once and the last page releases the PIT."""
+        seen, cursor = [], None
+        while True:
+            page = await search_service.page_kolams(size=2, cursor=cursor)
+            seen += [result["id"] for result in page["results"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == [5, 4, 3, 2, 1]
+        assert all(body["pit"]["id"] == "pit-1" for body in kolams.bodies)
+        assert all(index is None for index, _, _ in kolams.searches)
+        assert "search_after" not in kolams.bodies[0]
+        assert kolams.bodies[0]["sort"] == [{"created_at": "desc"}, {"id": "desc"}]
+        assert not kolams.open_pits
+
+    @pytest.mark.asyncio
+    async def test_expired_snapshot_is_not_an_empty_page(self, search_service, kolams):
+        """Test that a failed follow-on page raises instead of ending the scroll."""
+        page = await search_service.page_kolams(size=2)
+
+        kolams.expired = True
+
+        with pytest.raises(ExpiredCursorError):
+            await search_service.page_kolams(size=2, cursor=page["next_cursor"])
+        # A first page still degrades to empty results like other searches
+        assert (await search_service.page_kolams(size=2))["results"] == []
+
+    @pytest.mark.asyncio
+    async def test_cursor_without_snapshot_opens_one(self, search_service, kolams):
+        """Test that a cursor from a cached first page continues over a new PIT."""
+        page = await search_service.page_kolams(size=2, cursor=encode_cursor(None, ["2025-01-04", 4]))
+
+        assert [result["id"] for result in page["results"]] == [3, 2]
+        assert kolams.bodies[0]["pit"]["id"] == "pit-1"
+        assert decode_cursor(page["next_cursor"])[0] == "pit-1"
+
+    def test_cursor_round_trip_and_rejection(self):
+        """Test that cursors decode to what was encoded and garbage is refused."""
+        assert decode_cursor(encode_cursor("pit-1", ["2025-01-03", 3])) == ("pit-1", ["2025-01-03", 3])
+
+        with pytest.raises(InvalidCursorError):
+            decode_cursor("not a cursor")
@@ -0,0 +1,185 @@
+"""Tests for rebuilding search indices from the database."""
+
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+from opensearchpy.serializer import JSONSerializer
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.core.database import Base
+from src.db.models.models import TriviaQuestion
+from src.search.indices import TRIVIA_QUESTIONS
+from src.search.reindex import Reindexer, ReindexError
+
+
+class FakeIndices:
+    """Index and alias state of a fake cluster."""
+
+    def __init__(self, existing=None, aliases=None):
+        self.indices = {name: {"settings": {}} for name in existing or []}
+        self.aliases = dict(aliases or {})
+        self.alias_updates = []
+
+    def create(self, index, body):
+        self.indices[index] = {"settings": body["settings"], "docs": {}}
+
+    def put_settings(self, index, body):
+        self.indices[index]["settings"].update(body["index"])
+
+    def refresh(self, index):
+        pass
+
+    def delete(self, index, ignore=None):
+        self.indices.pop(index, None)
+
+    def exists(self, index):
+        return index in self.indices or index in self.aliases.values()
+
+    def exists_alias(self, name):
+        return name in self.aliases.values()
+
+    def get_alias(self, name):
+        return {index: {} for index, alias in self.aliases.items() if alias == name}
+
+    def get(self, index):
+        prefix = index.rstrip("*")
+        return {name: {} for name in self.indices if name.startswith(prefix)}
+
+    def update_aliases(self, body):
+        self.alias_updates.append(body["actions"])
+        for action in body["actions"]:
+            op, args = next(iter(action.items()))
+            if op == "add":
+                self.aliases[args["index"]] = args["alias"]
+            elif op == "remove":
+                self.aliases.pop(args["index"], None)
+            elif op == "remove_index":
+                self.indices.pop(args["index"], None)
+
+
+class FakeOpenSearch:
+    """Records bulk-indexed documents, optionally rejecting some."""
+
+    def __init__(self, indices, reject=()):
+        self.indices = indices
+        self.reject = set(reject)
+        self.transport = SimpleNamespace(serializer=JSONSerializer())
+        self.lock = threading.Lock()
+
+    def bulk(self, body, *args, **kwargs):
+        lines = [json.loads(line) for line in body.strip().split("\n")]
+        items = []
+        while lines:
+            meta = lines.pop(0)
+            if "delete" in meta:
+                meta = meta["delete"]
+                self.indices.indices[meta["_index"]]["docs"].pop(meta["_id"], None)
+                items.append({"delete": {"_id": meta["_id"], "status": 200}})
+                continue
+            meta, source = meta["index"], lines.pop(0)
+            status = 400 if meta["_id"] in self.reject else 201
+            if status == 201:
+                with self.lock:
+                    self.indices.indices[meta["_index"]]["docs"][meta["_id"]] = source
+            items.append({"index": {"_id": meta["_id"], "status": status}})
+        return {"errors": bool(self.reject), "items": items}
+
+    def search(self, index, body, scroll, size, **kwargs):
+        hits = [{"_id": doc_id} for doc_id in self.indices.indices[index]["docs"]]
+        self._pages = [hits[i:i + size] for i in range(0, len(hits), size)] + [[]]
+        return self.scroll(body={})
+
+    def scroll(self, body, **kwargs):
+        shards = {"total": 1, "successful": 1, "skipped": 0}
+        return {"_scroll_id": "scroll", "_shards": shards, "hits": {"hits": self._pages.pop(0)}}
+
+    def clear_scroll(self, body, **kwargs):
+        pass
+
+
+@pytest.fixture
+def db():
+    """Create an in-memory database with some trivia questions."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    for i in range(7):
+        session.add(TriviaQuestion(
+            question_text=f"Question {i}", question_type="multiple_choice", correct_answer="A"
+        ))
+    session.commit()
+    yield session
+    session.close()
+
+
+class TestReindexer:
+    """Test cases for the reindex pipeline."""
+
+    def test_rows_are_loaded_and_alias_replaces_legacy_index(self, db):
+        """Test a full load into a new index swapped in for a plain index."""
+        indices = FakeIndices(existing=[TRIVIA_QUESTIONS])
+        reindexer = Reindexer(FakeOpenSearch(indices), db, batch_size=2, thread_count=2)
+
+        stats = reindexer.reindex(TRIVIA_QUESTIONS)
+
+        new_index = stats["index"]
+        assert stats["indexed"] == 7
+        assert len(indices.indices[new_index]["docs"]) == 7
+        assert indices.aliases == {new_index: TRIVIA_QUESTIONS}
+        assert TRIVIA_QUESTIONS not in indices.indices
+        assert len(indices.alias_updates) == 1
+
+    def test_load_phase_settings_are_restored(self, db):
+        """Test that refresh and replicas are turned back on before the swap."""
+        indices = FakeIndices()
+        reindexer = Reindexer(FakeOpenSearch(indices), db)
+
+        stats = reindexer.reindex(TRIVIA_QUESTIONS)
+
+        index_settings = indices.indices[stats["index"]]["settings"]
+        assert index_settings["refresh_interval"] == "1s"
+        assert index_settings["number_of_replicas"] == 0
+
+    def test_previous_index_is_kept_for_rollback(self, db):
+        """Test that only indices beyond keep_previous are deleted."""
+        indices = FakeIndices(existing=["trivia_questions_1", "trivia_questions_2"])
+        indices.aliases = {"trivia_questions_2": TRIVIA_QUESTIONS}
+        reindexer = Reindexer(FakeOpenSearch(indices), db, keep_previous=1)
+
+        stats = reindexer.reindex(TRIVIA_QUESTIONS)
+
+        assert stats["previous"] == ["trivia_questions_2"]
+        assert stats["dropped"] == ["trivia_questions_1"]
+        assert sorted(indices.indices) == sorted(["trivia_questions_2", stats["index"]])
+
+    def test_rows_deleted_during_load_are_removed(self, db):
+        """Test that a delete racing the load does not reappear after the swap."""
+        indices = FakeIndices()
+        reindexer = Reindexer(FakeOpenSearch(indices), db, batch_size=2)
+        put_settings = indices.put_settings
+
+        def delete_after_load(index, body):
+            # Row 1 is already copied; its delete would only reach the old index
+            db.query(TriviaQuestion).filter(TriviaQuestion.id == 1).delete()
+            db.commit()
+            put_settings(index, body)
+        indices.put_settings = delete_after_load
+
+        stats = reindexer.reindex(TRIVIA_QUESTIONS)
+
+        assert stats["removed"] == 1
+        assert sorted(indices.indices[stats["index"]]["docs"]) == ["2", "3", "4", "5", "6", "7"]
+
+    def test_failed_documents_abort_the_swap(self, db):
+        """Test that a partial index is deleted and the alias left alone."""
+        indices = FakeIndices(existing=["trivia_questions_1"], aliases={"trivia_questions_1": TRIVIA_QUESTIONS})
+        reindexer = Reindexer(FakeOpenSearch(indices, reject={"3"}), db)
+
+        with pytest.raises(ReindexError):
+            reindexer.reindex(TRIVIA_QUESTIONS)
+
+        assert list(indices.indices) == ["trivia_questions_1"]
+        assert indices.aliases == {"trivia_questions_1": TRIVIA_QUESTIONS}
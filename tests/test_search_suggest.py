@@ -0,0 +1,137 @@
+"""Tests for typeahead suggestions."""
+
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.core.database import Base
+from src.db.models.models import KolamImage, User
+from src.search.suggest import PrefixTrie, Suggester, load_suggestions
+
+
+@pytest.fixture
+def cluster_down(fake_opensearch):
+    fake_opensearch.fail = True
+    return fake_opensearch
+
+
+class TestPrefixTrie:
+    """Test cases for the in-memory completion trie."""
+
+    def test_completes_any_word_start_by_weight(self):
+        """Test that mid-phrase prefixes match and heavier terms come first."""
+        trie = PrefixTrie(capacity=2)
+        trie.insert(("title", "Lotus kolam"), 1)
+        trie.insert(("tag", "kolam"), 3)
+        trie.insert(("tag", "kolattam"), 2)
+
+        assert trie.complete("KOL", 5) == [("tag", "kolam"), ("tag", "kolattam")]
+        assert trie.complete("lotus k", 5) == [("title", "Lotus kolam")]
+        assert trie.complete("xyz", 5) == []
+
+    def test_removal_and_lower_weights_rerank(self):
+        """Test that terms pruned from a full node come back when others leave."""
+        trie = PrefixTrie(capacity=1)
+        trie.insert(("tag", "kolam"), 3)
+        trie.insert(("tag", "kolattam"), 2)
+
+        trie.insert(("tag", "kolam"), 1)
+        assert trie.complete("kol", 5) == [("tag", "kolattam")]
+        trie.remove(("tag", "kolattam"))
+        assert trie.complete("kola", 5) == [("tag", "kolam")]
+        trie.remove(("tag", "kolam"))
+        assert trie.complete("k", 5) == []
+        assert len(trie) == 0
+
+    def test_lookups_are_fast(self):
+        """Test that a lookup costs microseconds regardless of the term count."""
+        trie = PrefixTrie()
+        for i in range(5000):
+            trie.insert(("title", f"pattern {i}"), i % 50)
+
+        started = time.perf_counter()
+        for _ in range(1000):
+            trie.complete("pattern 4", 8)
+        assert time.perf_counter() - started < 0.1
+
+
+class TestSuggest:
+    """Test cases for SearchService.suggest and its sources."""
+
+    @pytest.mark.asyncio
+    async def test_completion_suggester_is_used_with_a_short_timeout(self, search_service, fake_opensearch):
+        """Test that completions come from the suggest index when it answers."""
+        fake_opensearch.suggestions = [{"text": "lotus", "_source": {"text": "Lotus", "kind": "tag"}}]
+
+        assert await search_service.suggest("lo") == [{"text": "Lotus", "kind": "tag"}]
+        index, body, kwargs = fake_opensearch.searches[0]
+        assert index == "search_suggestions"
+        assert body["suggest"]["terms"]["prefix"] == "lo"
+        assert kwargs["request_timeout"] == 0.005
+
+    @pytest.mark.asyncio
+    async def test_trie_answers_when_the_cluster_is_down(self, search_service, cluster_down):
+        """Test the fallback, and that only public images contribute terms."""
+        await search_service.index_kolam_image({"id": 1, "title": "Lotus kolam", "tags": ["festival"], "is_public": True})
+        await search_service.index_kolam_image({"id": 2, "title": "Secret lotus", "tags": ["private"], "is_public": False})
+        await search_service.index_kolam_image({"id": 1, "title": "Lotus kolam", "tags": ["festival"], "is_public": True})
+
+        assert await search_service.suggest("lot") == [{"text": "Lotus kolam", "kind": "title"}]
+        assert await search_service.suggest("fest") == [{"text": "festival", "kind": "tag"}]
+        assert await search_service.suggest("priv") == []
+        # Re-indexing the same image adds no weight and no new suggestion documents
+        assert [doc_id for index, doc_id, _ in search_service.indexer.added if index == "search_suggestions"] == [
+            doc_id for doc_id, _ in [Suggester.document(("title", "Lotus kolam"), 1),
+                                     Suggester.document(("tag", "festival"), 1)]
+        ]
+
+    @pytest.mark.asyncio
+    async def test_withdrawn_terms_are_decremented_then_deleted(self, search_service, cluster_down):
+        """Test edits, a switch to private and deletes against shared terms."""
+        await search_service.index_kolam_image({"id": 1, "title": "Lotus kolam", "tags": ["festival"], "is_public": True})
+        await search_service.index_kolam_image({"id": 2, "title": "Rangoli", "tags": ["festival"], "is_public": True})
+        festival = Suggester.document_id(("tag", "festival"))
+        search_service.indexer.added.clear()
+
+        await search_service.index_kolam_image({"id": 1, "title": "Lotus ring", "tags": ["festival"], "is_public": True})
+        await search_service.index_kolam_image({"id": 2, "title": "Rangoli", "tags": ["festival"], "is_public": False})
+
+        assert await search_service.suggest("lot") == [{"text": "Lotus ring", "kind": "title"}]
+        assert await search_service.suggest("rang") == []
+        assert search_service.suggester.trie.weights[("tag", "festival")] == 1
+        assert (("search_suggestions", festival, Suggester.document(("tag", "festival"), 1)[1])
+                in search_service.indexer.added)
+        assert search_service.indexer.deleted == [
+            ("search_suggestions", Suggester.document_id(("title", "Lotus kolam"))),
+            ("search_suggestions", Suggester.document_id(("title", "Rangoli"))),
+        ]
+
+        await search_service.delete_kolam_image(1)
+
+        assert await search_service.suggest("fest") == []
+        assert len(search_service.suggester.trie) == 0
+        assert search_service.indexer.deleted[-2:] == [
+            ("search_suggestions", festival),
+            ("search_suggestions", Suggester.document_id(("title", "Lotus ring"))),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_suggestions_load_from_database_and_styles(self, search_service, cluster_down):
+        """Test the startup load of public rows plus Kolam style names."""
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(bind=engine)
+        factory = sessionmaker(bind=engine)
+        db = factory()
+        db.add(User(id=1, email="a@example.com", username="a", hashed_password="x"))
+        db.add(KolamImage(user_id=1, filename="a.png", file_path="a.png", title="Pookalam ring",
+                          tags=["onam"], detected_patterns=["radial"], is_public=True))
+        db.commit()
+        db.close()
+
+        await load_suggestions(search_service, ["pookalam", "rangoli"], session_factory=factory)
+
+        assert [s["text"] for s in await search_service.suggest("poo")] == ["Pookalam", "Pookalam ring"]
+        assert await search_service.suggest("rad") == [{"text": "radial", "kind": "pattern"}]
@@ -0,0 +1,129 @@
+"""Tests for compact SVG output and thumbnail rasterization."""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from src.services.ai.svg_emitter import SvgPathBuilder, render_svg
+from src.services.thumbnail_service import ThumbnailService, parse_path
+
+
+class TestSvgEmitter:
+    """Test cases for the compact SVG emitter."""
+
+    def test_relative_quantized_commands(self):
+        """Test that path data is relative, quantized and uses h/v."""
+        path = SvgPathBuilder(precision=1)
+        path.move_to((10, 10))
+        path.line_to((20.04, 10))
+        path.line_to((20.04, 30))
+        path.line_to((25, 35))
+
+        assert path.d() == "m10,10h10v20l5,5"
+
+    def test_smooth_quadratic_shorthand(self):
+        """Test that mirrored control points use the t shorthand."""
+        path = SvgPathBuilder()
+        path.move_to((0, 0))
+        path.quad_to((5, 10), (10, 0))
+        path.quad_to((15, -10), (20, 0))
+
+        assert path.d() == "m0,0q5,10,10,0t10,0"
+
+    def test_same_style_elements_share_a_path(self):
+        """Test that elements with identical styles are merged."""
+        style = {"stroke": "#000", "stroke_width": 2, "fill": "none"}
+        elements = [
+            {"type": "line", "start": (0, 0), "end": (10, 10), "style": style},
+            {"type": "line", "start": (10, 0), "end": (0, 10), "style": style},
+            {"type": "circle", "center": (5, 5), "radius": 2, "style": {"fill": "red", "stroke": "none"}},
+        ]
+
+        svg = render_svg(elements, 20, 20)
+
+        assert svg.count("<path") == 2
+
+    def test_emitted_path_round_trips(self):
+        """Test that the rasterizer's parser reads back emitted geometry."""
+        style = {"stroke": "#000", "stroke_width": 1, "fill": "none"}
+        elements = [
+            {"type": "polygon", "points": [(1, 1), (9, 1), (9, 9), (1, 9)], "style": style},
+            {"type": "loop", "points": [(0, 5), (5, 0), (10, 5), (5, 10)],
+             "controls": [(0, 0), (10, 0), (10, 10), (0, 10)], "style": style},
+        ]
+        d = render_svg(elements, 10, 10, background=None).split('d="')[1].split('"')[0]
+
+        subpaths = parse_path(d)
+
+        assert len(subpaths) == 2
+        assert all(closed for _, closed in subpaths)
+        np.testing.assert_allclose(subpaths[0][0][:4], [[1, 1], [9, 1], [9, 9], [1, 9]])
+        np.testing.assert_allclose(subpaths[1][0][-1], [0, 5])
+
+
+class TestThumbnailService:
+    """Test cases for the thumbnail rasterizer."""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        """Create a thumbnail service writing to a temporary directory."""
+        return ThumbnailService(str(tmp_path), sizes=[32, 64], formats=["png", "webp"])
+
+    @pytest.fixture
+    def svg(self):
+        """A small SVG with a filled circle."""
+        return render_svg(
+            [{"type": "circle", "center": (50, 50), "radius": 30, "style": {"fill": "#ff0000", "stroke": "none"}}],
+            100, 100
+        )
+
+    def test_renders_every_size_and_format(self, service, svg):
+        """Test that all thumbnail variants are written."""
+        paths = service.render(svg)
+
+        assert set(paths) == {"32.png", "32.webp", "64.png", "64.webp"}
+        with Image.open(paths["64.png"]) as image:
+            assert image.size == (64, 64)
+            assert image.getpixel((32, 32))[:3] == (255, 0, 0)
+
+    def test_thumbnails_are_cached_by_content(self, service, svg, monkeypatch):
+        """Test that an unchanged SVG is not rasterized again."""
+        first = service.render(svg)
+
+        monkeypatch.setattr(service, "_rasterize", lambda *args: pytest.fail("re-rasterized"))
+        second = service.render(svg)
+
+        assert first == second
+
+    def test_batch_rendering_preserves_order(self, service, svg):
+        """Test that batched rendering returns results in input order."""
+        other = svg.replace("#ff0000", "#0000ff")
+
+        results = service.render_batch([svg, other])
+
+        assert results[0]["32.png"] != results[1]["32.png"]
+        assert service.key_for(svg) in results[0]["32.png"]
+
+    def test_batch_renders_duplicates_once(self, service, svg, tmp_path):
+        """Test that a batch with repeated SVGs rasterizes each only once."""
+        calls = []
+        rasterize = service._rasterize
+        service._rasterize = lambda *args: calls.append(args) or rasterize(*args)
+
+        results = service.render_batch([svg] * 8, max_workers=4)
+
+        assert len(calls) == 1
+        assert all(result == results[0] for result in results)
+        assert not list(tmp_path.rglob("*.tmp"))
+
+    def test_batch_skips_invalid_svg(self, service, svg):
+        """Test that one bad SVG does not fail the rest of the batch."""
+        results = service.render_batch(["<svg", svg])
+
+        assert results[0] == {}
+        assert set(results[1]) == {"32.png", "32.webp", "64.png", "64.webp"}
+
+    def test_invalid_svg_is_rejected(self, service):
+        """Test that malformed SVG raises ValueError."""
+        with pytest.raises(ValueError):
+            service.render("<svg")